@@ -18,9 +18,49 @@ if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
         SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
     )
 else:
-    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    # 워커별 커넥션 풀 크기 (app/server.py가 워커 수에 맞춰 설정, 기본값은 SQLAlchemy 기본값)
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=int(os.environ.get("DB_POOL_SIZE", "5")),
+        max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", "10")),
+    )
+
+# 커밋 후 객체를 만료시키지 않음: 응답 직렬화 시 행마다 다시 SELECT하지 않도록
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# 동기 엔드포인트 스레드 수 (0이면 AnyIO 기본값 40, app/server.py가 커넥션 풀 크기에 맞춰 설정)
+THREADPOOL_SIZE = int(os.environ.get("THREADPOOL_SIZE", "0"))
+
+# 비트맵 색인 스냅샷 파일 경로
+BITMAP_SNAPSHOT_PATH = os.environ.get("BITMAP_SNAPSHOT_PATH", "./bitmap_index.snapshot")
+
+# 학생 일괄 등록 시 비밀번호 해시에 사용할 프로세스 수
+# HASH_WORKERS: import_students.py(CLI), IMPORT_HASH_WORKERS: API 서버 워커 하나당 (워커 수만큼 곱해지므로 작게)
+HASH_WORKERS = int(os.environ.get("HASH_WORKERS", os.cpu_count() or 1))
+IMPORT_HASH_WORKERS = int(os.environ.get("IMPORT_HASH_WORKERS", "2"))
+
+# 운영진 전용 API(학생 계정 일괄 등록) 토큰: X-Admin-Token 헤더로 전달, 비어 있으면 해당 API를 막음
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
+
+# 다른 워커 프로세스가 커밋한 변경을 인메모리 색인에 반영하기 위해 change_log를 읽는 주기(초)
+# 0이면 사용 안 함 (단일 프로세스), app/server.py가 기본 2초로 설정
+CHANGE_POLL_INTERVAL = float(os.environ.get("CHANGE_POLL_INTERVAL", "0"))
+
+# 멀티 워커 메트릭 합산용 스냅샷 디렉터리와 쓰기 주기(초) (app/server.py가 설정, 비어 있으면 워커 자기 값만)
+METRICS_DIR = os.environ.get("METRICS_DIR", "")
+METRICS_FLUSH_INTERVAL = float(os.environ.get("METRICS_FLUSH_INTERVAL", "5"))
+
+# 요청 프로파일러: 관리자 토큰(X-Profile-Token 헤더)과 무작위 샘플링 비율, 표본 간격(초), 보관 개수
+# 토큰이 비어 있고 비율이 0이면 꺼짐
+PROFILE_TOKEN = os.environ.get("PROFILE_TOKEN", "")
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL = float(os.environ.get("PROFILE_INTERVAL", "0.005"))
+PROFILE_BUFFER_SIZE = int(os.environ.get("PROFILE_BUFFER_SIZE", "50"))
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 실행 환경: production이면 빌드 때 export_openapi.py로 만든 정적 OpenAPI 스키마를 제공
+APP_ENV = os.environ.get("APP_ENV", "development")
+OPENAPI_STATIC = APP_ENV == "production"
+OPENAPI_SCHEMA_PATH = os.environ.get("OPENAPI_SCHEMA_PATH", "./openapi.json")
 
 # OAuth 설정 (개발용 더미 값)
 GOOGLE_CLIENT_ID = config('GOOGLE_CLIENT_ID', default='dummy_google_client_id')
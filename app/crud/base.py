@@ -0,0 +1,23 @@
+from typing import Any, Optional, Type, TypeVar
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+ModelT = TypeVar("ModelT")
+
+# PostgreSQL과 SQLite(3.35 이상) 모두 RETURNING을 지원하므로,
+# 쓰기 한 번으로 DB가 채운 값(id 등)까지 받아 와 커밋 후 refresh SELECT가 필요 없습니다.
+# 세션은 expire_on_commit=False로 만들어지므로 반환된 객체는 커밋 후에도 그대로 응답에 사용할 수 있습니다.
+
+def insert_returning(db: Session, model: Type[ModelT], **values: Any) -> ModelT:
+    """
+    INSERT ... RETURNING으로 한 행을 생성하고, 생성된 객체를 반환합니다. (커밋은 호출한 쪽에서 수행)
+    """
+    return db.scalars(insert(model).values(**values).returning(model)).one()
+
+def update_returning(db: Session, model: Type[ModelT], model_id: int, **values: Any) -> Optional[ModelT]:
+    """
+    UPDATE ... RETURNING으로 기본키가 model_id인 행을 수정하고, 수정된 객체를 반환합니다.
+    행이 없으면 None을 반환하므로 존재 확인용 SELECT가 따로 필요 없습니다. (커밋은 호출한 쪽에서 수행)
+    """
+    statement = update(model).where(model.id == model_id).values(**values).returning(model)
+    return db.scalars(statement.execution_options(synchronize_session=False)).one_or_none()
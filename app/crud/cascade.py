@@ -0,0 +1,75 @@
+from typing import Iterable, Iterator, List, Set
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+from app.models.resume import ResumeBasicInfo
+from app.models.portfolio import Portfolio
+from app.models.project import Project
+from app.models.award import Award
+from app.models.education import Education
+from app.models.skill import ProjectSkill
+from app.utils.search import remove_documents
+from app.utils.changes import record_change
+
+# 모델마다 declarative Base가 달라 테이블 간 FK(ON DELETE CASCADE)를 걸 수 없으므로
+# 하위 행을 애플리케이션에서 IN 목록 단위로 일괄 삭제합니다. (커밋은 호출한 쪽에서 수행)
+CHUNK_SIZE = 1000  # 한 문장의 IN 목록 최대 크기
+
+def _chunks(ids: Iterable[int]) -> Iterator[List[int]]:
+    ids = list(dict.fromkeys(ids))
+    for start in range(0, len(ids), CHUNK_SIZE):
+        yield ids[start:start + CHUNK_SIZE]
+
+def delete_projects(db: Session, project_ids: Iterable[int]) -> List[int]:
+    """
+    프로젝트와 표준 기술 스택, 검색 문서를 삭제하고 실제로 삭제된 프로젝트 ID를 반환합니다.
+    """
+    deleted: List[int] = []
+    portfolios: Set[int] = set()
+    for chunk in _chunks(project_ids):
+        db.execute(delete(ProjectSkill).where(ProjectSkill.project_id.in_(chunk)))
+        rows = db.execute(
+            delete(Project).where(Project.id.in_(chunk)).returning(Project.id, Project.portfolio_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        remove_documents(db, "project", chunk)
+        deleted.extend(project_id for project_id, _ in rows)
+        portfolios.update(portfolio_id for _, portfolio_id in rows)
+    record_change(db, "portfolio", portfolios)
+    record_change(db, "project", deleted)
+    return deleted
+
+def delete_portfolios(db: Session, portfolio_ids: Iterable[int]) -> List[int]:
+    """
+    포트폴리오와 소속 프로젝트(및 그 하위 데이터)를 삭제하고 실제로 삭제된 포트폴리오 ID를 반환합니다.
+    """
+    deleted: List[int] = []
+    resumes: Set[int] = set()
+    for chunk in _chunks(portfolio_ids):
+        delete_projects(db, [project_id for (project_id,) in db.query(Project.id).filter(Project.portfolio_id.in_(chunk))])
+        rows = db.execute(
+            delete(Portfolio).where(Portfolio.id.in_(chunk)).returning(Portfolio.id, Portfolio.resume_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        remove_documents(db, "portfolio", chunk)
+        deleted.extend(portfolio_id for portfolio_id, _ in rows)
+        resumes.update(resume_id for _, resume_id in rows)
+    record_change(db, "resume", resumes)
+    return deleted
+
+def delete_resumes(db: Session, resume_ids: Iterable[int]) -> List[int]:
+    """
+    이력서와 포트폴리오/프로젝트/수상/교육 이력을 모두 삭제하고 실제로 삭제된 이력서 ID를 반환합니다.
+    """
+    deleted: List[int] = []
+    for chunk in _chunks(resume_ids):
+        delete_portfolios(db, [portfolio_id for (portfolio_id,) in db.query(Portfolio.id).filter(Portfolio.resume_id.in_(chunk))])
+        db.execute(delete(Award).where(Award.resume_id.in_(chunk)).execution_options(synchronize_session=False))
+        db.execute(delete(Education).where(Education.resume_id.in_(chunk)).execution_options(synchronize_session=False))
+        rows = db.execute(
+            delete(ResumeBasicInfo).where(ResumeBasicInfo.id.in_(chunk)).returning(ResumeBasicInfo.id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        remove_documents(db, "resume", chunk)
+        deleted.extend(resume_id for (resume_id,) in rows)
+    record_change(db, "resume", deleted)
+    return deleted
@@ -0,0 +1,32 @@
+from typing import Any, Optional
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from app.models.portfolio import Portfolio
+from app.crud.base import update_returning
+
+# 대표 포트폴리오 동시 변경(uq_portfolio_representative 위반) 시 409 응답 메시지
+REPRESENTATIVE_CONFLICT = "다른 요청이 대표 포트폴리오를 먼저 변경했습니다. 다시 시도해 주세요."
+
+def clear_representative(db: Session, resume_id: Optional[int] = None, portfolio_id: Optional[int] = None) -> None:
+    """
+    이력서의 현재 대표 포트폴리오를 해제합니다.
+    대표는 부분 유니크 인덱스(uq_portfolio_representative)로 최대 하나이므로 많아야 한 행만 수정합니다.
+    resume_id 대신 portfolio_id를 주면 그 포트폴리오의 이력서를 같은 문장 안에서 찾고, 해당 포트폴리오는 제외합니다.
+    """
+    statement = update(Portfolio).where(Portfolio.is_representative == True)
+    if portfolio_id is not None:
+        owner = select(Portfolio.resume_id).where(Portfolio.id == portfolio_id).scalar_subquery()
+        statement = statement.where(Portfolio.resume_id == owner, Portfolio.id != portfolio_id)
+    else:
+        statement = statement.where(Portfolio.resume_id == resume_id)
+    db.execute(statement.values(is_representative=False).execution_options(synchronize_session=False))
+
+def set_representative(db: Session, portfolio_id: int, **values: Any) -> Optional[Portfolio]:
+    """
+    대표 포트폴리오를 전환합니다. 기존 대표 해제(최대 1행) 후 대상을 UPDATE ... RETURNING으로 설정합니다.
+    UPDATE 한 문장으로 두 행을 바꾸면 유니크 인덱스가 행 단위로 검사되어 순서에 따라 실패할 수 있으므로 두 문장으로 나눕니다.
+    동시에 같은 이력서의 대표를 바꾸면 나중 요청은 IntegrityError가 발생하므로 호출한 쪽에서 409로 응답합니다.
+    포트폴리오가 없으면 None을 반환합니다. (커밋은 호출한 쪽에서 수행)
+    """
+    clear_representative(db, portfolio_id=portfolio_id)
+    return update_returning(db, Portfolio, portfolio_id, **dict(values, is_representative=True))
@@ -0,0 +1,212 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session, load_only
+from app.models.resume import ResumeBasicInfo
+from app.models.portfolio import Portfolio
+from app.models.project import Project
+from app.models.award import Award
+from app.models.education import Education
+from app.schemas.resume import ResumeSave, ResumeBasicInfoResponse
+from app.schemas.portfolio import PortfolioResponse
+from app.schemas.project import ProjectResponse
+from app.schemas.award import AwardResponse
+from app.schemas.education import EducationResponse
+from app.utils.search import index_resume, index_portfolios, index_projects
+from app.utils.skills import assign_project_skills_many
+from app.utils.changes import record_change
+from app.crud.cascade import delete_projects, delete_portfolios
+
+def load_resume_graph(db: Session, resume_id: int) -> Optional[Dict[str, Any]]:
+    """
+    이력서 기본 정보와 포트폴리오/프로젝트/수상/교육 목록을 한 번에 조회합니다. (이력서가 없으면 None)
+    """
+    return load_resume_graphs(db, [resume_id]).get(resume_id)
+
+def load_resume_graphs(db: Session, resume_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    여러 이력서의 전체 정보를 섹션별 IN 쿼리 한 번씩(총 5회)으로 조회해 이력서 ID별로 묶어 반환합니다.
+    없는 이력서 ID는 결과에서 빠집니다.
+    """
+    resumes = db.query(ResumeBasicInfo).filter(ResumeBasicInfo.id.in_(resume_ids)).all() if resume_ids else []
+    graphs = {
+        resume.id: {"resume": resume, "portfolios": [], "projects": [], "awards": [], "educations": []}
+        for resume in resumes
+    }
+    if not graphs:
+        return graphs
+    portfolios = db.query(Portfolio).filter(Portfolio.resume_id.in_(list(graphs))).all()
+    owner = {portfolio.id: portfolio.resume_id for portfolio in portfolios}
+    for portfolio in portfolios:
+        graphs[portfolio.resume_id]["portfolios"].append(portfolio)
+    if owner:
+        for project in db.query(Project).filter(Project.portfolio_id.in_(list(owner))):
+            graphs[owner[project.portfolio_id]]["projects"].append(project)
+    for award in db.query(Award).filter(Award.resume_id.in_(list(graphs))):
+        graphs[award.resume_id]["awards"].append(award)
+    for education in db.query(Education).filter(Education.resume_id.in_(list(graphs))):
+        graphs[education.resume_id]["educations"].append(education)
+    return graphs
+
+# fields 파라미터로 고를 수 있는 섹션별 필드 (응답 스키마 기준)
+RESUME_SECTIONS = {
+    "resume": list(ResumeBasicInfoResponse.model_fields),
+    "portfolios": list(PortfolioResponse.model_fields),
+    "projects": list(ProjectResponse.model_fields),
+    "awards": list(AwardResponse.model_fields),
+    "educations": list(EducationResponse.model_fields),
+}
+_SECTION_MODELS = {
+    "resume": ResumeBasicInfo,
+    "portfolios": Portfolio,
+    "projects": Project,
+    "awards": Award,
+    "educations": Education,
+}
+
+def load_resume_fields(db: Session, resume_id: int, sections: Dict[str, Optional[List[str]]]) -> Optional[Dict[str, Any]]:
+    """
+    지정한 섹션/필드만 조회해 딕셔너리로 반환합니다. (이력서가 없으면 None)
+    SELECT 절에 지정한 컬럼만 포함하며(load_only), 지정하지 않은 섹션은 조회하지 않습니다.
+    """
+    def query(section: str):
+        model = _SECTION_MODELS[section]
+        names = sections[section] or RESUME_SECTIONS[section]
+        return db.query(model).options(load_only(*[getattr(model, name) for name in names])), names
+
+    def rows(objects, names: List[str]) -> List[Dict[str, Any]]:
+        return [{name: getattr(obj, name) for name in names} for obj in objects]
+
+    if "resume" in sections:
+        resume_query, names = query("resume")
+        resume = resume_query.filter(ResumeBasicInfo.id == resume_id).first()
+        result = {"resume": rows([resume], names)[0]} if resume else None
+    else:
+        resume = db.query(ResumeBasicInfo.id).filter(ResumeBasicInfo.id == resume_id).first()
+        result = {} if resume else None
+    if result is None:
+        return None
+    if "portfolios" in sections:
+        portfolio_query, names = query("portfolios")
+        result["portfolios"] = rows(portfolio_query.filter(Portfolio.resume_id == resume_id), names)
+    if "projects" in sections:
+        project_query, names = query("projects")
+        portfolio_ids = select(Portfolio.id).where(Portfolio.resume_id == resume_id)
+        result["projects"] = rows(project_query.filter(Project.portfolio_id.in_(portfolio_ids)), names)
+    if "awards" in sections:
+        award_query, names = query("awards")
+        result["awards"] = rows(award_query.filter(Award.resume_id == resume_id), names)
+    if "educations" in sections:
+        education_query, names = query("educations")
+        result["educations"] = rows(education_query.filter(Education.resume_id == resume_id), names)
+    return result
+
+def _check_owned(ids: Iterable[int], owned: Set[int], label: str) -> None:
+    missing = set(ids) - owned
+    if missing:
+        raise LookupError(f"이력서에 속한 {label}을(를) 찾을 수 없습니다: {sorted(missing)}")
+
+def _changes(items: List[Any], **extra: Any) -> List[Dict[str, Any]]:
+    """
+    수정 항목을 기본키 기준 일괄 UPDATE용 딕셔너리로 변환합니다. (None 필드는 수정하지 않음)
+    """
+    rows = [item.dict(exclude_none=True) for item in items]
+    return [dict(row, **extra) for row in rows if len(row) > 1]
+
+def _insert(db: Session, model, rows: List[Dict[str, Any]]) -> List[Any]:
+    if not rows:
+        return []
+    return db.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows).all()
+
+def apply_resume_diff(db: Session, resume_id: int, diff: ResumeSave) -> None:
+    """
+    이력서 전체 변경분(생성/수정/삭제)을 현재 트랜잭션에 반영합니다. (커밋은 호출한 쪽에서 수행)
+    - 섹션별로 삭제 -> 수정 -> 생성 순서로, 각각 하나의 일괄 문장으로 실행합니다.
+    - 다른 이력서의 항목 ID가 섞여 있으면 LookupError, 요청 자체가 모순되면 ValueError를 발생시킵니다.
+    - 포트폴리오를 삭제하면 소속 프로젝트도 함께 삭제합니다. (app.crud.cascade)
+    """
+    if not db.query(ResumeBasicInfo.id).filter(ResumeBasicInfo.id == resume_id).first():
+        raise LookupError("이력서를 찾을 수 없습니다.")
+    now = datetime.utcnow()
+
+    # 1. 소유권 검증 (섹션별 ID 조회 한 번씩)
+    owned_portfolios = {i for (i,) in db.query(Portfolio.id).filter(Portfolio.resume_id == resume_id)}
+    project_owner = dict(db.query(Project.id, Project.portfolio_id).filter(Project.portfolio_id.in_(owned_portfolios))) if owned_portfolios else {}
+    owned_awards = {i for (i,) in db.query(Award.id).filter(Award.resume_id == resume_id)}
+    owned_educations = {i for (i,) in db.query(Education.id).filter(Education.resume_id == resume_id)}
+    _check_owned([p.id for p in diff.portfolios.update] + diff.portfolios.delete, owned_portfolios, "포트폴리오")
+    _check_owned([p.id for p in diff.projects.update] + diff.projects.delete, set(project_owner), "프로젝트")
+    _check_owned([a.id for a in diff.awards.update] + diff.awards.delete, owned_awards, "수상 및 활동")
+    _check_owned([e.id for e in diff.educations.update] + diff.educations.delete, owned_educations, "교육")
+
+    deleted_portfolios = set(diff.portfolios.delete)
+    deleted_projects = set(diff.projects.delete) | {i for i, owner in project_owner.items() if owner in deleted_portfolios}
+    if {p.id for p in diff.portfolios.update} & deleted_portfolios or \
+            {p.id for p in diff.projects.update} & deleted_projects or \
+            {a.id for a in diff.awards.update} & set(diff.awards.delete) or \
+            {e.id for e in diff.educations.update} & set(diff.educations.delete):
+        raise ValueError("삭제하는 항목은 같은 요청에서 수정할 수 없습니다.")
+    refs = [p.ref for p in diff.portfolios.create if p.ref is not None]
+    if len(refs) != len(set(refs)):
+        raise ValueError("포트폴리오 ref가 중복되었습니다.")
+    for draft in diff.projects.create:
+        if (draft.portfolio_id is None) == (draft.portfolio_ref is None):
+            raise ValueError("새 프로젝트에는 portfolio_id와 portfolio_ref 중 하나만 지정해야 합니다.")
+        if draft.portfolio_ref is not None and draft.portfolio_ref not in refs:
+            raise ValueError(f"알 수 없는 포트폴리오 ref입니다: {draft.portfolio_ref}")
+        if draft.portfolio_id is not None:
+            _check_owned([draft.portfolio_id], owned_portfolios - deleted_portfolios, "포트폴리오")
+    representatives = sum(1 for p in diff.portfolios.create if p.is_representative) + \
+        sum(1 for p in diff.portfolios.update if p.is_representative)
+    if representatives > 1:
+        raise ValueError("대표 포트폴리오는 하나만 지정할 수 있습니다.")
+
+    # 2. 삭제 (포트폴리오에 딸린 프로젝트 포함)
+    delete_projects(db, diff.projects.delete)
+    delete_portfolios(db, deleted_portfolios)
+    if diff.awards.delete:
+        db.execute(delete(Award).where(Award.id.in_(diff.awards.delete)))
+    if diff.educations.delete:
+        db.execute(delete(Education).where(Education.id.in_(diff.educations.delete)))
+
+    # 3. 수정 (기본키 기준 executemany)
+    if representatives:
+        db.execute(update(Portfolio).where(Portfolio.resume_id == resume_id, Portfolio.is_representative == True).values(is_representative=False))
+    resume_fields = diff.resume.dict(exclude_none=True) if diff.resume else {}
+    if resume_fields:
+        db.execute(update(ResumeBasicInfo).where(ResumeBasicInfo.id == resume_id).values(updated_at=now, **resume_fields))
+    portfolio_rows = _changes(diff.portfolios.update, updated_at=now)
+    project_rows = _changes(diff.projects.update, updated_at=now)
+    award_rows = _changes(diff.awards.update)
+    education_rows = _changes(diff.educations.update)
+    for model, rows in ((Portfolio, portfolio_rows), (Project, project_rows), (Award, award_rows), (Education, education_rows)):
+        if rows:
+            db.execute(update(model), rows)
+
+    # 4. 생성 (INSERT ... RETURNING)
+    created_portfolios = _insert(db, Portfolio, [
+        dict(p.dict(exclude={"ref"}), resume_id=resume_id, created_at=now, updated_at=now) for p in diff.portfolios.create
+    ])
+    ref_ids = {draft.ref: portfolio.id for draft, portfolio in zip(diff.portfolios.create, created_portfolios) if draft.ref is not None}
+    created_projects = _insert(db, Project, [
+        dict(p.dict(exclude={"portfolio_id", "portfolio_ref"}),
+             portfolio_id=p.portfolio_id if p.portfolio_id is not None else ref_ids[p.portfolio_ref],
+             created_at=now, updated_at=now)
+        for p in diff.projects.create
+    ])
+    _insert(db, Award, [dict(a.dict(), resume_id=resume_id, created_at=now) for a in diff.awards.create])
+    _insert(db, Education, [dict(e.dict(), resume_id=resume_id, created_at=now) for e in diff.educations.create])
+
+    # 5. 검색 인덱스 / 표준 기술 스택 / 변경 알림
+    if resume_fields:
+        index_resume(db, db.query(ResumeBasicInfo).filter(ResumeBasicInfo.id == resume_id).one())
+    updated_portfolios = {row["id"] for row in portfolio_rows}
+    index_portfolios(db, created_portfolios + (db.query(Portfolio).filter(Portfolio.id.in_(updated_portfolios)).all() if updated_portfolios else []))
+    updated_projects = {row["id"] for row in project_rows}
+    projects = created_projects + (db.query(Project).filter(Project.id.in_(updated_projects)).all() if updated_projects else [])
+    index_projects(db, projects)
+    restacked = {row["id"] for row in project_rows if "tech_stack" in row} | {p.id for p in created_projects}
+    assign_project_skills_many(db, [(p.id, p.tech_stack) for p in projects if p.id in restacked])
+    record_change(db, "resume", [resume_id])
+    record_change(db, "portfolio", {p.portfolio_id for p in projects})
+    record_change(db, "project", {p.id for p in projects})
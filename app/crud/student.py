@@ -0,0 +1,120 @@
+import csv
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import HASH_WORKERS
+from app.models.user import User, StudentProfile, UserTypeEnum
+from app.schemas.user import UserCreateStudent
+from app.utils.auth import hash_password
+from app.utils.changes import record_change
+from app.utils.skills import assign_student_skills_many
+
+IMPORT_BATCH_SIZE = 200  # 한 트랜잭션에 등록하는 학생 수
+CSV_COLUMNS = list(UserCreateStudent.model_fields)  # email, password, course_name, course_generation, tech_stack
+
+Row = Tuple[int, UserCreateStudent]  # (CSV 줄 번호, 검증된 행)
+
+def read_student_csv(lines: Iterable[str], errors: List[Dict[str, Any]]) -> Iterator[Row]:
+    """
+    학생 CSV를 한 줄씩 읽어 검증된 행만 내보내고, 잘못된 행은 errors에 줄 번호와 함께 기록합니다.
+    """
+    reader = csv.DictReader(lines)
+    missing = [name for name in CSV_COLUMNS if name not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"CSV에 필수 컬럼이 없습니다: {', '.join(missing)}")
+    for row in reader:
+        line = reader.line_num
+        values = {name: (row.get(name) or "").strip() for name in CSV_COLUMNS}
+        empty = [name for name in CSV_COLUMNS if not values[name]]
+        if empty:
+            errors.append({"line": line, "email": values["email"] or None, "detail": f"값이 비어 있습니다: {', '.join(empty)}"})
+            continue
+        try:
+            yield line, UserCreateStudent(**values)
+        except ValidationError as e:
+            error = e.errors()[0]
+            errors.append({"line": line, "email": values["email"], "detail": f"{'.'.join(map(str, error['loc']))}: {error['msg']}"})
+
+def _batches(rows: Iterator[Row], size: int) -> Iterator[List[Row]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _insert_batch(db: Session, batch: List[Row], hashes: List[str]) -> int:
+    now = datetime.utcnow()
+    users = db.scalars(
+        insert(User).returning(User.id, sort_by_parameter_order=True),
+        [
+            {"email": row.email, "password_hash": password_hash, "user_type": UserTypeEnum.student, "created_at": now, "updated_at": now}
+            for (_, row), password_hash in zip(batch, hashes)
+        ],
+    ).all()
+    db.execute(insert(StudentProfile), [
+        {"user_id": user_id, "course_name": row.course_name, "course_generation": row.course_generation, "tech_stack": row.tech_stack}
+        for user_id, (_, row) in zip(users, batch)
+    ])
+    assign_student_skills_many(db, [(user_id, row.tech_stack) for user_id, (_, row) in zip(users, batch)])
+    record_change(db, "student", users)
+    return len(users)
+
+def import_students(db: Session, lines: Iterable[str], batch_size: int = IMPORT_BATCH_SIZE, executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """
+    학생 CSV(email,password,course_name,course_generation,tech_stack)로 계정을 일괄 등록합니다.
+    - 행을 읽는 대로 검증하고, batch_size개씩 비밀번호를 프로세스 풀에서 병렬로 해시한 뒤
+      User/StudentProfile을 일괄 INSERT하고 배치마다 커밋합니다.
+    - 형식 오류, 파일 안/DB의 중복 이메일은 해당 행만 건너뛰고 errors에 기록합니다.
+    - executor를 주지 않으면 HASH_WORKERS개짜리 프로세스 풀을 만들어 쓰고 닫습니다. (CLI용)
+      API 서버에서는 요청마다 풀을 만들지 말고 공유 풀(app/routers/auth.py의 hash_pool)을 넘깁니다.
+    반환값: {"created": 등록 수, "failed": 실패 수, "errors": [{"line", "email", "detail"}, ...]}
+    """
+    errors: List[Dict[str, Any]] = []
+    created = 0
+    seen = set()
+    pool = executor or ProcessPoolExecutor(max_workers=HASH_WORKERS)
+    # 청크 크기는 실제로 넘겨받은 풀의 프로세스 수 기준 (API 공유 풀은 IMPORT_HASH_WORKERS개)
+    workers = getattr(pool, "_max_workers", None) or HASH_WORKERS
+    try:
+        for batch in _batches(read_student_csv(lines, errors), batch_size):
+            # 파일 안에서 중복된 이메일과 이미 가입된 이메일 제외
+            rows = []
+            for line, row in batch:
+                if row.email in seen:
+                    errors.append({"line": line, "email": row.email, "detail": "파일 안에서 중복된 이메일입니다."})
+                else:
+                    seen.add(row.email)
+                    rows.append((line, row))
+            existing = {email for (email,) in db.query(User.email).filter(User.email.in_([row.email for _, row in rows]))} if rows else set()
+            for line, row in rows:
+                if row.email in existing:
+                    errors.append({"line": line, "email": row.email, "detail": "이미 사용 중인 이메일입니다."})
+            rows = [(line, row) for line, row in rows if row.email not in existing]
+            if not rows:
+                continue
+            hashes = list(pool.map(hash_password, [row.password for _, row in rows], chunksize=max(1, len(rows) // (workers * 4))))
+            try:
+                created += _insert_batch(db, rows, hashes)
+                db.commit()
+            except IntegrityError:
+                # 확인 직후 다른 요청이 같은 이메일로 가입한 경우: 배치 전체를 실패로 기록하지 않고 한 행씩 다시 시도
+                db.rollback()
+                for (line, row), password_hash in zip(rows, hashes):
+                    try:
+                        created += _insert_batch(db, [(line, row)], [password_hash])
+                        db.commit()
+                    except IntegrityError:
+                        db.rollback()
+                        errors.append({"line": line, "email": row.email, "detail": "이미 사용 중인 이메일입니다."})
+    finally:
+        if executor is None:
+            pool.shutdown()
+    errors.sort(key=lambda error: error["line"])
+    return {"created": created, "failed": len(errors), "errors": errors}
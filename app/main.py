@@ -1,77 +1,42 @@
 from fastapi import FastAPI, Request
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.routers import resume, portfolio, project, auth, talent
 import os
+from functools import lru_cache
 from app.routers.award import router as award_router
 from app.routers.education import router as education_router
+from app.routers.autocomplete import router as autocomplete_router
+from app.core.config import engine, SessionLocal, OPENAPI_STATIC, OPENAPI_SCHEMA_PATH, THREADPOOL_SIZE, METRICS_DIR, METRICS_FLUSH_INTERVAL, CHANGE_POLL_INTERVAL
+from app.utils.search import ensure_search_index
+from app.utils.autocomplete import autocomplete
+from app.utils.bitmap import bitmap_index
+from app.utils.skills import ensure_skill_tables
+from app.utils.changes import ChangePoller, ensure_change_log_table
+from app.utils.similar import ensure_similar_table, rebuild_similar_talents
+from app.models.user import StudentProfile
+from app.models.resume import ResumeBasicInfo
+from app.models.portfolio import Portfolio
+from app.models.similar import SimilarTalent
+from sqlalchemy import inspect
+from sqlalchemy.exc import DatabaseError
+from typing import List
+import logging
+from app.utils.metrics import MetricsMiddleware, SnapshotWriter, registry, read_snapshots, CONTENT_TYPE
+from app.utils.profiler import ProfileMiddleware
+from app.routers.profiling import router as profiling_router
+from app.utils.openapi import install_static_docs
 
-app = FastAPI(
-    title="🦁 LionConnect API",
-    description="""
-    ## LionConnect - 학생과 기업을 연결하는 플랫폼 API
-    
-    ### 주요 기능
-    - 🔐 **소셜 로그인**: Google, Kakao OAuth2 지원
-    - 👨‍🎓 **학생 프로필**: 이력서, 포트폴리오 관리
-    - 🏢 **기업 프로필**: 채용 정보, 기업 소개
-    - 🤝 **매칭 시스템**: 학생과 기업 연결
-    
-    ### 인증 방식
-    - JWT Bearer Token 사용
-    - 소셜 로그인 후 자동 토큰 발급
-    - 토큰은 Authorization 헤더에 `Bearer {token}` 형태로 전송
-    
-    ### 사용자 유형
-    - **student**: 수료생 (이력서, 포트폴리오 작성)
-    - **company**: 기업 (채용 정보, 학생 검색)
-    
-    ### 개발 환경
-    - **Base URL**: `http://localhost:8000`
-    - **API 문서**: `/docs` (Swagger UI)
-    - **대안 문서**: `/redoc` (ReDoc)
-    
-    ### 소셜 로그인 플로우
-    1. 사용자가 소셜 로그인 버튼 클릭
-    2. OAuth 제공자(Google/Kakao)로 리디렉트
-    3. 인증 완료 후 백엔드 콜백 URL로 리디렉트
-    4. 백엔드에서 사용자 정보 처리 및 JWT 토큰 생성
-    5. 클라이언트로 토큰 반환
-    """,
-    version="2.0.0",
-    contact={
-        "name": "LionConnect Team",
-        "email": "support@lionconnect.com",
-    },
-    license_info={
-        "name": "MIT",
-        "url": "https://opensource.org/licenses/MIT",
-    },
-    openapi_tags=[
-        {
-            "name": "Auth",
-            "description": "인증 관련 API - 소셜 로그인, 토큰 관리"
-        },
-        {
-            "name": "Resume",
-            "description": "이력서 관리 API - 학생 이력서 작성 및 관리"
-        },
-        {
-            "name": "Portfolio",
-            "description": "포트폴리오 관리 API - 프로젝트 포트폴리오 작성 및 관리"
-        },
-        {
-            "name": "Project",
-            "description": "프로젝트 관리 API - 개별 프로젝트 정보 관리"
-        },
-        {
-            "name": "Talent",
-            "description": "인재 매칭 API - 기업의 인재 검색 및 연결"
-        }
-    ]
-)
+logger = logging.getLogger(__name__)
+
+if OPENAPI_STATIC:
+    # 운영: 빌드 때 만든 openapi.json을 그대로 제공 (문서 메타데이터와 스키마 생성 생략)
+    app = FastAPI(title="🦁 LionConnect API", version="2.0.0", openapi_url=None, docs_url=None, redoc_url=None)
+    install_static_docs(app, OPENAPI_SCHEMA_PATH)
+else:
+    from app.core.api_docs import api_metadata
+    app = FastAPI(**api_metadata())
 
 # CORS 미들웨어 설정
 app.add_middleware(
@@ -86,6 +51,12 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 헤더 허용
 )
 
+# 요청 수/처리 시간/응답 크기 메트릭 수집 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 요청 샘플링 프로파일러 (PROFILE_TOKEN/PROFILE_SAMPLE_RATE 설정 시에만 동작, GET /debug/profiles)
+app.add_middleware(ProfileMiddleware)
+
 # 정적 파일 제공 (업로드된 이미지 등)
 app.mount("/media", StaticFiles(directory="app/media"), name="media")
 
@@ -98,21 +69,147 @@ app.include_router(auth.router)
 app.include_router(talent.router)
 app.include_router(award_router)
 app.include_router(education_router)
+app.include_router(autocomplete_router)
+app.include_router(profiling_router)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    # Prometheus 수집용 (로드 밸런서 뒤 내부망에서만 노출할 것)
+    # 멀티 워커에서는 다른 워커들의 스냅샷을 더해 전체 값을 응답 (DB 풀/스레드 게이지는 응답한 워커의 값)
+    others = read_snapshots(METRICS_DIR) if METRICS_DIR else []
+    return Response(registry.render(others), media_type=CONTENT_TYPE)
+
+snapshot_writer = SnapshotWriter(METRICS_DIR, METRICS_FLUSH_INTERVAL) if METRICS_DIR else None
+
+@app.on_event("startup")
+def start_metrics_snapshot():
+    if snapshot_writer:
+        snapshot_writer.start()
+
+@app.on_event("shutdown")
+def stop_metrics_snapshot():
+    if snapshot_writer:
+        snapshot_writer.stop()
+
+@app.on_event("startup")
+async def init_thread_limiter():
+    # 동기 엔드포인트 동시 실행 수를 커넥션 풀 크기에 맞춤 (풀 대기로 스레드가 묶이지 않도록)
+    if THREADPOOL_SIZE:
+        import anyio.to_thread
+        anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+@app.on_event("startup")
+def init_search_index():
+    # 전문 검색 인덱스 테이블 준비 (이미 있으면 무시)
+    ensure_search_index(engine)
+
+def _create_tables(create) -> None:
+    # 여러 워커가 동시에 시작하면 같은 테이블을 함께 만들다 한쪽이 "already exists"로 실패하므로 한 번 더 확인
+    try:
+        create(engine)
+    except DatabaseError:
+        create(engine)
+
+@app.on_event("startup")
+def init_skill_tables():
+    # 표준 스킬 테이블 준비 (이미 있으면 무시)
+    _create_tables(ensure_skill_tables)
+
+change_poller = ChangePoller(CHANGE_POLL_INTERVAL) if CHANGE_POLL_INTERVAL else None
+
+@app.on_event("startup")
+def init_change_poller():
+    # 멀티 워커: 다른 워커가 커밋한 변경을 이 워커의 인메모리 색인에 반영 (색인 구축 전에 시작 위치를 정함)
+    if change_poller:
+        _create_tables(ensure_change_log_table)
+        change_poller.start()
+
+@app.on_event("shutdown")
+def stop_change_poller():
+    if change_poller:
+        change_poller.stop()
+
+def _missing_tables(*models) -> List[str]:
+    existing = set(inspect(engine).get_table_names())
+    return [model.__tablename__ for model in models if model.__tablename__ not in existing]
+
+@app.on_event("startup")
+def init_autocomplete():
+    # 자동완성 트라이 구축 (테이블이 아직 없는 DB면 건너뛰고 첫 조회 때 구축)
+    missing = _missing_tables(StudentProfile, ResumeBasicInfo)
+    if missing:
+        logger.warning(f"테이블이 없어 자동완성 구축을 건너뜁니다 ({', '.join(missing)}). create_tables.py를 실행하세요.")
+        return
+    db = SessionLocal()
+    try:
+        autocomplete.build(db)
+    finally:
+        db.close()
+
+@app.on_event("startup")
+def init_bitmap_index():
+    # 비트맵 색인: 스냅샷이 최신이면 불러오고, 아니면 새로 구축 (테이블이 아직 없는 DB면 건너뜀)
+    missing = _missing_tables(StudentProfile, Portfolio)
+    if missing:
+        logger.warning(f"테이블이 없어 비트맵 색인 구축을 건너뜁니다 ({', '.join(missing)}). create_tables.py를 실행하세요.")
+        return
+    db = SessionLocal()
+    try:
+        bitmap_index.build(db)
+    finally:
+        db.close()
+
+@app.on_event("startup")
+def init_similar_talents():
+    # 유사 인재 테이블 준비, 비어 있으면 전체 계산 (이후에는 변경된 학생만 백그라운드 갱신)
+    _create_tables(ensure_similar_table)
+    missing = _missing_tables(StudentProfile, Portfolio)
+    if missing:
+        logger.warning(f"테이블이 없어 유사 인재 계산을 건너뜁니다 ({', '.join(missing)}). create_tables.py를 실행하세요.")
+        return
+    db = SessionLocal()
+    try:
+        if db.query(SimilarTalent.student_user_id).first() is None and db.query(StudentProfile.id).first() is not None:
+            count = rebuild_similar_talents(db)
+            logger.info(f"유사 인재 목록 {count}명을 계산했습니다.")
+    except DatabaseError as e:
+        # 여러 워커가 동시에 시작하면 다른 워커가 먼저 계산 중일 수 있음
+        db.rollback()
+        logger.warning(f"유사 인재 목록 계산을 건너뜁니다: {str(e)}")
+    finally:
+        db.close()
+
+@app.on_event("shutdown")
+def save_bitmap_index():
+    db = SessionLocal()
+    try:
+        # 저장 직전에 다른 워커의 변경을 한 번 더 받아 반영 (여러 워커 중 한 프로세스만 저장)
+        bitmap_index.save_snapshot(db, sync=change_poller.poll if change_poller else None)
+    finally:
+        db.close()
+
+@app.on_event("shutdown")
+def close_hash_pool():
+    auth.shutdown_hash_pool()
 
-templates = Jinja2Templates(directory=os.path.join(os.path.dirname(__file__), "templates"))
+@lru_cache(maxsize=None)
+def templates():
+    # 입력 폼 페이지는 개발용이라 jinja2는 처음 요청될 때 불러옴
+    from fastapi.templating import Jinja2Templates
+    return Jinja2Templates(directory=os.path.join(os.path.dirname(__file__), "templates"))
 
 @app.get("/resume-form", response_class=HTMLResponse)
 def resume_form(request: Request):
-    return templates.TemplateResponse("resume_form.html", {"request": request})
+    return templates().TemplateResponse("resume_form.html", {"request": request})
 
 @app.get("/portfolio-form", response_class=HTMLResponse)
 def portfolio_form(request: Request):
-    return templates.TemplateResponse("portfolio_form.html", {"request": request})
+    return templates().TemplateResponse("portfolio_form.html", {"request": request})
 
 @app.get("/project-form", response_class=HTMLResponse)
 def project_form(request: Request):
-    return templates.TemplateResponse("project_form.html", {"request": request})
+    return templates().TemplateResponse("project_form.html", {"request": request})
 
 @app.get("/", response_class=HTMLResponse)
 def home(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request}) 
\ No newline at end of file
+    return templates().TemplateResponse("index.html", {"request": request}) 
\ No newline at end of file
@@ -4,4 +4,6 @@ from .project import *
 from .user import *
 from .connect import *
 from .award import *
-from .education import * 
\ No newline at end of file
+from .education import * 
+from .similar import *
+from .skill import *
\ No newline at end of file
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
+
+Base = declarative_base()
+
+class ChangeLog(Base):
+    __tablename__ = "change_log"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    origin = Column(String(100), nullable=False)                     # 기록한 프로세스 ("호스트:pid")
+    changes = Column(Text, nullable=False)                           # {"student": [...], "resume": [...], ...} JSON
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -16,4 +16,9 @@ class ConnectRequest(Base):
     required_stack = Column(String, nullable=True)  # 필수 기술 스택
     career_level = Column(String, nullable=True)  # 희망 경력 수준
     employment_type = Column(String, nullable=True)  # 고용 수준
-    created_at = Column(DateTime, default=datetime.utcnow) 
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # 중복 요청 확인용 (기업, 수료생, 포트폴리오) 조회 인덱스
+    __table_args__ = (
+        Index("ix_connect_request_pair", "company_user_id", "student_user_id", "portfolio_id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -8,7 +8,7 @@ class Portfolio(Base):
     __tablename__ = "portfolio"
 
     id = Column(Integer, primary_key=True, index=True)
-    resume_id = Column(Integer, nullable=False)  # 이력서(수료생) 참조
+    resume_id = Column(Integer, nullable=False, index=True)  # 이력서(수료생) 참조
     is_representative = Column(Boolean, default=False)
     image = Column(String, nullable=True)
     project_url = Column(String, nullable=True)
@@ -17,4 +17,10 @@ class Portfolio(Base):
     project_period = Column(String, nullable=False)
     role = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 이력서당 대표 포트폴리오는 최대 하나 (부분 유니크 인덱스)
+    __table_args__ = (
+        Index("uq_portfolio_representative", "resume_id", unique=True,
+              postgresql_where=text("is_representative"), sqlite_where=text("is_representative")),
+    )
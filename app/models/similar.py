@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, Float, DateTime
+from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
+
+Base = declarative_base()
+
+class SimilarTalent(Base):
+    __tablename__ = "similar_talent"
+    student_user_id = Column(Integer, primary_key=True)  # 기준 학생 user_id
+    rank = Column(Integer, primary_key=True)             # 유사도 순위 (1부터)
+    neighbour_user_id = Column(Integer, nullable=False, index=True)  # 유사한 학생 user_id
+    score = Column(Float, nullable=False)                # 코사인 유사도
+    updated_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
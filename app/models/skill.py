@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+class StudentSkill(Base):
+    __tablename__ = "student_skill"
+    user_id = Column(Integer, primary_key=True)               # 학생 user_id
+    skill_id = Column(Integer, primary_key=True, index=True)  # 표준 스킬 ID (app.utils.skills.SKILLS)
+
+class ProjectSkill(Base):
+    __tablename__ = "project_skill"
+    project_id = Column(Integer, primary_key=True)            # 프로젝트 ID
+    skill_id = Column(Integer, primary_key=True, index=True)  # 표준 스킬 ID (app.utils.skills.SKILLS)
\ No newline at end of file
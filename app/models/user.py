@@ -43,7 +43,7 @@ class StudentProfile(Base):
     __tablename__ = "student_profile"
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False, unique=True)
-    course_name = Column(String, nullable=False)
+    course_name = Column(String, nullable=False, index=True)
     course_generation = Column(String, nullable=False)
     tech_stack = Column(String, nullable=False)
     user = relationship("User", back_populates="student_profile")
@@ -1,10 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, UploadFile, File
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.schemas.user import UserResponse, TokenResponse, OAuthLoginRequest, OAuthCallbackResponse, LoginRequest, UserCreateStudent, UserCreateCompany, UserTypeEnum
+from app.schemas.user import UserResponse, TokenResponse, OAuthLoginRequest, OAuthCallbackResponse, LoginRequest, UserCreateStudent, UserCreateCompany, UserTypeEnum, StudentImportResponse
 from app.models.user import User, StudentProfile, CompanyProfile
-from app.core.config import SessionLocal
+from app.core.config import SessionLocal, ADMIN_TOKEN, IMPORT_HASH_WORKERS
 from app.utils.auth import hash_password, verify_password, create_access_token
+from app.utils.changes import record_change
+from app.utils.skills import assign_student_skills
+from app.crud.base import insert_returning
+from app.crud.student import import_students
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
+from typing import Optional
+import io
+import multiprocessing
+import secrets
+import threading
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -15,42 +26,114 @@ def get_db():
     finally:
         db.close()
 
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    if not ADMIN_TOKEN or not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+
+# 일괄 등록용 비밀번호 해시 프로세스 풀 (워커 프로세스마다 하나, 처음 요청 때 생성)
+# 스레드가 여러 개인 서버 프로세스에서 fork하지 않도록 forkserver(없으면 spawn)로 띄웁니다.
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+def hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _hash_pool = ProcessPoolExecutor(max_workers=IMPORT_HASH_WORKERS, mp_context=multiprocessing.get_context(method))
+        return _hash_pool
+
+def shutdown_hash_pool() -> None:
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown()
+            _hash_pool = None
+
 # ====== 기존 회원가입/로그인 API만 남김 ======
 @router.post("/signup/student", response_model=UserResponse)
 def signup_student(user: UserCreateStudent, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.email == user.email).first():
+    # 사용자와 프로필을 한 트랜잭션으로 생성 (이메일 중복은 유니크 제약으로 확인)
+    try:
+        user_obj = insert_returning(
+            db, User,
+            email=user.email,
+            password_hash=hash_password(user.password),
+            user_type=UserTypeEnum.student,
+        )
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="이미 사용 중인 이메일입니다.")
-    user_obj = User(
-        email=user.email,
-        password_hash=hash_password(user.password),
-        user_type=UserTypeEnum.student,
-    )
-    db.add(user_obj)
-    db.commit()
-    db.refresh(user_obj)
-    profile = StudentProfile(
+    insert_returning(
+        db, StudentProfile,
         user_id=user_obj.id,
         course_name=user.course_name,
         course_generation=user.course_generation,
         tech_stack=user.tech_stack,
     )
-    db.add(profile)
+    assign_student_skills(db, user_obj.id, user.tech_stack)
+    record_change(db, "student", [user_obj.id])
     db.commit()
     return user_obj
 
+@router.post(
+    "/import/students",
+    response_model=StudentImportResponse,
+    summary="학생 계정 일괄 등록 (CSV)",
+    description="""
+    기수 시작 시 운영진이 학생 계정을 CSV 파일로 한 번에 등록합니다.\n
+    - 운영진 전용: `X-Admin-Token` 헤더에 관리자 토큰(ADMIN_TOKEN)을 보내야 합니다.\n    - 컬럼: `email,password,course_name,course_generation,tech_stack` (첫 줄은 헤더, UTF-8)\n    - 행을 읽는 대로 검증하고, 여러 행씩 묶어 비밀번호를 병렬로 해시한 뒤 한 트랜잭션으로 등록합니다.\n    - 잘못된 행이나 중복 이메일은 해당 행만 건너뛰고 `errors`에 줄 번호와 함께 보고합니다.\n
+    **응답:** `created`(등록 수), `failed`(실패 수), `errors`(줄 번호, 이메일, 사유)
+    """,
+    responses={
+        400: {
+            "description": "CSV 형식 오류",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "CSV에 필수 컬럼이 없습니다: tech_stack"
+                    }
+                }
+            }
+        },
+        403: {
+            "description": "관리자 토큰이 없거나 올바르지 않음",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "관리자 권한이 필요합니다."
+                    }
+                }
+            }
+        }
+    },
+    dependencies=[Depends(require_admin)]
+)
+def import_student_accounts(
+    file: UploadFile = File(..., description="학생 목록 CSV 파일"),
+    db: Session = Depends(get_db)
+):
+    try:
+        return import_students(db, io.TextIOWrapper(file.file, encoding="utf-8-sig", newline=""), executor=hash_pool())
+    except (ValueError, UnicodeDecodeError) as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/signup/company", response_model=UserResponse)
 def signup_company(user: UserCreateCompany, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.email == user.email).first():
+    # 사용자와 프로필을 한 트랜잭션으로 생성 (이메일 중복은 유니크 제약으로 확인)
+    try:
+        user_obj = insert_returning(
+            db, User,
+            email=user.email,
+            password_hash=hash_password(user.password),
+            user_type=UserTypeEnum.company,
+        )
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="이미 사용 중인 이메일입니다.")
-    user_obj = User(
-        email=user.email,
-        password_hash=hash_password(user.password),
-        user_type=UserTypeEnum.company,
-    )
-    db.add(user_obj)
-    db.commit()
-    db.refresh(user_obj)
-    profile = CompanyProfile(
+    insert_returning(
+        db, CompanyProfile,
         user_id=user_obj.id,
         company_name=user.company_name,
         industry=user.industry,
@@ -58,7 +141,6 @@ def signup_company(user: UserCreateCompany, db: Session = Depends(get_db)):
         intro=user.intro,
         email_verified=False,
     )
-    db.add(profile)
     db.commit()
     return user_obj
 
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from app.schemas.talent import AutocompleteSuggestion
+from app.core.config import SessionLocal
+from app.utils.autocomplete import autocomplete
+from typing import List
+
+router = APIRouter(prefix="/autocomplete", tags=["Talent"])
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@router.get(
+    "",
+    response_model=List[AutocompleteSuggestion],
+    summary="검색어 자동완성",
+    description="""
+    입력 중인 검색어로 시작하는 값을 많이 사용된 순서대로 추천합니다.\n
+    - `field`: 자동완성 대상 (`skill`: 기술 스택, `school`: 학교, `major`: 전공, `course`: 과정명)\n
+    - `q`: 입력 중인 검색어 (한글은 자모 단위로 비교하므로 "서울ㄷ"처럼 입력 중인 글자도 일치, 기술 스택은 "리ㅇ" → React처럼 한글 별칭으로도 검색)\n
+    - `limit`: 최대 추천 개수 (기본값: 10)\n
+    **응답:** `value`(추천 값), `count`(사용 빈도) 목록
+    """,
+    responses={
+        200: {
+            "description": "자동완성 성공",
+            "content": {
+                "application/json": {
+                    "example": [
+                        {"value": "웹개발 과정", "count": 42},
+                        {"value": "웹디자인 과정", "count": 7}
+                    ]
+                }
+            }
+        }
+    }
+)
+def get_autocomplete(
+    field: str = Query(..., pattern="^(skill|school|major|course)$", description="자동완성 대상 필드"),
+    q: str = Query(..., min_length=1, description="입력 중인 검색어"),
+    limit: int = Query(10, ge=1, le=10, description="최대 추천 개수"),
+    db: Session = Depends(get_db),
+):
+    """
+    인메모리 접두사 트라이에서 자동완성 후보를 조회합니다.
+    """
+    return [{"value": value, "count": count} for value, count in autocomplete.suggest(db, field, q, limit)]
\ No newline at end of file
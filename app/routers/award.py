@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.award import Award
 from app.schemas.award import AwardCreate, AwardResponse
 from app.core.config import SessionLocal
+from app.crud.base import insert_returning
 from typing import List
 
 router = APIRouter(prefix="/awards", tags=["Award"])
@@ -44,8 +46,29 @@ def get_db():
     }
 )
 def create_award(award: AwardCreate, db: Session = Depends(get_db)):
-    db_award = Award(**award.dict())
-    db.add(db_award)
+    db_award = insert_returning(db, Award, **award.dict())
     db.commit()
-    db.refresh(db_award)
-    return db_award 
\ No newline at end of file
+    return db_award
+
+@router.post(
+    "/bulk",
+    response_model=List[AwardResponse],
+    summary="수상 및 활동 일괄 등록",
+    description="""
+    여러 건의 수상 및 활동을 한 번의 요청으로 등록합니다.\n
+    - 요청 본문: `POST /awards/`와 같은 형식의 객체 배열\n    - 전체를 검증한 뒤 하나의 트랜잭션에서 한 번의 INSERT로 저장합니다.\n
+    **응답:** 등록된 수상/활동 목록 (요청 순서와 동일)
+    """,
+    responses={
+        200: {"description": "수상 및 활동 일괄 등록 성공"},
+        400: {"description": "등록할 항목이 없음"},
+        422: {"description": "입력값 검증 실패"},
+        500: {"description": "서버 오류"}
+    }
+)
+def create_awards_bulk(awards: List[AwardCreate], db: Session = Depends(get_db)):
+    if not awards:
+        raise HTTPException(status_code=400, detail="등록할 항목이 없습니다.")
+    created = db.scalars(insert(Award).returning(Award, sort_by_parameter_order=True), [award.dict() for award in awards]).all()
+    db.commit()
+    return created
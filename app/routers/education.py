@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.education import Education
 from app.schemas.education import EducationCreate, EducationResponse
 from app.core.config import SessionLocal
+from app.crud.base import insert_returning
 from typing import List
 
 router = APIRouter(prefix="/educations", tags=["Education"])
@@ -44,8 +46,29 @@ def get_db():
     }
 )
 def create_education(education: EducationCreate, db: Session = Depends(get_db)):
-    db_education = Education(**education.dict())
-    db.add(db_education)
+    db_education = insert_returning(db, Education, **education.dict())
     db.commit()
-    db.refresh(db_education)
-    return db_education 
\ No newline at end of file
+    return db_education
+
+@router.post(
+    "/bulk",
+    response_model=List[EducationResponse],
+    summary="교육 일괄 등록",
+    description="""
+    여러 건의 교육 이력을 한 번의 요청으로 등록합니다.\n
+    - 요청 본문: `POST /educations/`와 같은 형식의 객체 배열\n    - 전체를 검증한 뒤 하나의 트랜잭션에서 한 번의 INSERT로 저장합니다.\n
+    **응답:** 등록된 교육 이력 목록 (요청 순서와 동일)
+    """,
+    responses={
+        200: {"description": "교육 일괄 등록 성공"},
+        400: {"description": "등록할 항목이 없음"},
+        422: {"description": "입력값 검증 실패"},
+        500: {"description": "서버 오류"}
+    }
+)
+def create_educations_bulk(educations: List[EducationCreate], db: Session = Depends(get_db)):
+    if not educations:
+        raise HTTPException(status_code=400, detail="등록할 항목이 없습니다.")
+    created = db.scalars(insert(Education).returning(Education, sort_by_parameter_order=True), [education.dict() for education in educations]).all()
+    db.commit()
+    return created
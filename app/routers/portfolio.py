@@ -1,9 +1,16 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query, status, Path
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.schemas.portfolio import PortfolioResponse, PortfolioUpdate
 from app.models.portfolio import Portfolio
 from app.core.config import SessionLocal
-from app.utils.file import save_profile_image
+from app.utils.file import save_profile_image, delete_media
+from app.utils.search import index_portfolio
+from app.utils.changes import record_change
+from app.crud.base import insert_returning, update_returning
+from app.crud.portfolio import clear_representative, set_representative, REPRESENTATIVE_CONFLICT
+from app.crud.cascade import delete_portfolios
+from app.utils.serialization import fast_json, to_rows
 from typing import Optional, List
 from datetime import datetime
 
@@ -89,6 +96,16 @@ def get_db():
                     }
                 }
             }
+        },
+        409: {
+            "description": "동시 요청으로 대표 포트폴리오 변경 충돌",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "다른 요청이 대표 포트폴리오를 먼저 변경했습니다. 다시 시도해 주세요."
+                    }
+                }
+            }
         }
     }
 )
@@ -113,25 +130,30 @@ def create_portfolio(
     if image:
         image_path = save_profile_image(image)
 
-    # 대표 포트폴리오로 설정 시, 기존 대표 해제
-    if is_representative:
-        db.query(Portfolio).filter(Portfolio.resume_id == resume_id).update({"is_representative": False})
-
-    portfolio = Portfolio(
-        resume_id=resume_id,
-        is_representative=is_representative,
-        image=image_path,
-        project_url=project_url,
-        project_name=project_name,
-        project_intro=project_intro,
-        project_period=project_period,
-        role=role,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-    )
-    db.add(portfolio)
+    try:
+        # 대표 포트폴리오로 설정 시, 기존 대표 해제
+        if is_representative:
+            clear_representative(db, resume_id=resume_id)
+        portfolio = insert_returning(
+            db, Portfolio,
+            resume_id=resume_id,
+            is_representative=is_representative,
+            image=image_path,
+            project_url=project_url,
+            project_name=project_name,
+            project_intro=project_intro,
+            project_period=project_period,
+            role=role,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+    except IntegrityError:
+        db.rollback()
+        delete_media(image_path)
+        raise HTTPException(status_code=409, detail=REPRESENTATIVE_CONFLICT)
+    index_portfolio(db, portfolio)
+    record_change(db, "resume", [resume_id])
     db.commit()
-    db.refresh(portfolio)
     return portfolio
 
 @router.get(
@@ -193,7 +215,8 @@ def get_portfolios(
     """
     특정 이력서의 포트폴리오 목록을 조회합니다.
     """
-    return db.query(Portfolio).filter(Portfolio.resume_id == resume_id).all()
+    portfolios = db.query(Portfolio).filter(Portfolio.resume_id == resume_id)
+    return fast_json(to_rows(portfolios, PortfolioResponse))
 
 @router.patch(
     "/{portfolio_id}/representative", 
@@ -242,6 +265,16 @@ def get_portfolios(
                     }
                 }
             }
+        },
+        409: {
+            "description": "동시 요청으로 대표 포트폴리오 변경 충돌",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "다른 요청이 대표 포트폴리오를 먼저 변경했습니다. 다시 시도해 주세요."
+                    }
+                }
+            }
         }
     }
 )
@@ -254,14 +287,15 @@ def set_representative_portfolio(
     
     같은 이력서의 다른 포트폴리오는 자동으로 대표 해제됩니다.
     """
-    portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
+    try:
+        portfolio = set_representative(db, portfolio_id)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=REPRESENTATIVE_CONFLICT)
     if not portfolio:
         raise HTTPException(status_code=404, detail="포트폴리오를 찾을 수 없습니다.")
-    # 같은 이력서의 다른 포트폴리오 대표 해제
-    db.query(Portfolio).filter(Portfolio.resume_id == portfolio.resume_id).update({"is_representative": False})
-    portfolio.is_representative = True
+    record_change(db, "resume", [portfolio.resume_id])
     db.commit()
-    db.refresh(portfolio)
     return portfolio
 
 @router.delete(
@@ -272,7 +306,7 @@ def set_representative_portfolio(
     ## 특정 포트폴리오를 삭제합니다.
     
     ### 기능 설명
-    - 포트폴리오와 관련된 모든 데이터 삭제
+    - 포트폴리오와 소속 프로젝트(표준 기술 스택, 검색 문서 포함)를 함께 삭제
     - 삭제된 포트폴리오는 복구 불가
     
     ### 경로 파라미터
@@ -309,10 +343,8 @@ def delete_portfolio(
     
     포트폴리오와 관련된 모든 데이터가 영구적으로 삭제됩니다.
     """
-    portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
-    if not portfolio:
+    if not delete_portfolios(db, [portfolio_id]):
         raise HTTPException(status_code=404, detail="포트폴리오를 찾을 수 없습니다.")
-    db.delete(portfolio)
     db.commit()
     return
 
@@ -377,6 +409,16 @@ def delete_portfolio(
                     }
                 }
             }
+        },
+        409: {
+            "description": "동시 요청으로 대표 포트폴리오 변경 충돌",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "다른 요청이 대표 포트폴리오를 먼저 변경했습니다. 다시 시도해 주세요."
+                    }
+                }
+            }
         }
     }
 )
@@ -396,29 +438,32 @@ def update_portfolio(
     
     전송된 필드만 업데이트되며, 대표 포트폴리오 설정도 변경할 수 있습니다.
     """
-    portfolio = db.query(Portfolio).filter(Portfolio.id == portfolio_id).first()
+    fields = {
+        "is_representative": is_representative,
+        "project_url": project_url,
+        "project_name": project_name,
+        "project_intro": project_intro,
+        "project_period": project_period,
+        "role": role,
+    }
+    fields = {key: value for key, value in fields.items() if value is not None}
+    if image:
+        fields["image"] = save_profile_image(image)
+    try:
+        if is_representative:
+            # 대표 포트폴리오로 설정 시, 기존 대표 해제 후 설정
+            portfolio = set_representative(db, portfolio_id, updated_at=datetime.utcnow(), **fields)
+        else:
+            portfolio = update_returning(db, Portfolio, portfolio_id, updated_at=datetime.utcnow(), **fields)
+    except IntegrityError:
+        db.rollback()
+        delete_media(fields.get("image"))
+        raise HTTPException(status_code=409, detail=REPRESENTATIVE_CONFLICT)
     if not portfolio:
+        # 없는 포트폴리오: 별도 조회 없이 UPDATE ... RETURNING 결과로 판단하고 저장한 이미지는 삭제
+        delete_media(fields.get("image"))
         raise HTTPException(status_code=404, detail="포트폴리오를 찾을 수 없습니다.")
-
-    # 대표 포트폴리오로 설정 시, 기존 대표 해제
-    if is_representative is not None:
-        if is_representative:
-            db.query(Portfolio).filter(Portfolio.resume_id == portfolio.resume_id).update({"is_representative": False})
-        portfolio.is_representative = is_representative
-
-    if image:
-        portfolio.image = save_profile_image(image)
-    if project_url is not None:
-        portfolio.project_url = project_url
-    if project_name is not None:
-        portfolio.project_name = project_name
-    if project_intro is not None:
-        portfolio.project_intro = project_intro
-    if project_period is not None:
-        portfolio.project_period = project_period
-    if role is not None:
-        portfolio.role = role
-    portfolio.updated_at = datetime.utcnow()
+    index_portfolio(db, portfolio)
+    record_change(db, "resume", [portfolio.resume_id])
     db.commit()
-    db.refresh(portfolio)
     return portfolio 
\ No newline at end of file
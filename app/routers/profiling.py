@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from typing import Optional
+from app.utils.profiler import profile_store, is_admin
+
+# 요청 프로파일 조회 (관리자 전용, API 문서에는 노출하지 않음)
+router = APIRouter(prefix="/debug/profiles", include_in_schema=False)
+
+def require_admin(x_profile_token: Optional[str] = Header(None)):
+    if not is_admin(x_profile_token):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+
+@router.get("", dependencies=[Depends(require_admin)])
+async def list_profiles():
+    # 최근 프로파일 요약 (최신순)
+    return [profile.summary() for profile in profile_store.list()]
+
+@router.get("/{profile_id}", dependencies=[Depends(require_admin)], response_class=PlainTextResponse)
+async def get_profile(profile_id: str, kind: str = Query("wall", pattern="^(wall|cpu)$")):
+    """
+    접힌 스택 형식으로 반환: flamegraph.pl 또는 speedscope에 그대로 넣으면 됩니다.
+    프로파일은 요청을 처리한 워커에만 있으므로 다른 워커가 응답하면 404입니다. (ID 앞부분이 워커 pid)
+    """
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return PlainTextResponse(profile.folded(kind))
@@ -1,13 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Form, Query, Path
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session, aliased
 from app.schemas.project import ProjectResponse, ProjectCreate, ProjectUpdate
 from app.models.project import Project
 from app.core.config import SessionLocal
-from typing import List, Optional
+from app.utils.search import index_project, index_projects
+from app.utils.changes import record_change
+from app.crud.base import insert_returning, update_returning
+from app.utils.skills import assign_project_skills, assign_project_skills_many
+from app.crud.cascade import delete_projects
+from app.utils.serialization import fast_json, to_rows
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 
 router = APIRouter(prefix="/projects", tags=["Project"])
 
+MAX_PORTFOLIO_IDS = 100  # 한 번에 조회할 수 있는 포트폴리오 수
+
 def get_db():
     db = SessionLocal()
     try:
@@ -100,7 +109,8 @@ def create_project(
     포트폴리오에 연결된 개별 프로젝트의 상세 정보를 저장합니다.
     프로젝트의 기술 스택과 역할 정보를 포함합니다.
     """
-    project = Project(
+    project = insert_returning(
+        db, Project,
         portfolio_id=portfolio_id,
         project_name=project_name,
         project_period=project_period,
@@ -111,31 +121,91 @@ def create_project(
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow(),
     )
-    db.add(project)
+    index_project(db, project)
+    assign_project_skills(db, project.id, tech_stack)
+    record_change(db, "portfolio", [portfolio_id])
+    record_change(db, "project", [project.id])
     db.commit()
-    db.refresh(project)
     return project
 
+@router.post(
+    "/bulk",
+    response_model=List[ProjectResponse],
+    summary="프로젝트 일괄 생성",
+    description="""
+    ## 여러 프로젝트를 한 번의 요청으로 생성합니다.
+    
+    ### 기능 설명
+    - 요청 배열 전체를 검증한 뒤 하나의 트랜잭션에서 한 번의 INSERT로 저장
+    - 검색 인덱스와 표준 기술 스택도 같은 트랜잭션에서 반영
+    - 하나라도 실패하면 전체가 저장되지 않음
+    
+    ### 요청 데이터 (application/json)
+    - 프로젝트 객체 배열 (`portfolio_id`, `project_name`, `project_period`, `project_intro`, `description`, `role`, `tech_stack`, `github_url`)
+    
+    ### 응답 데이터
+    - 생성된 프로젝트 객체 배열 (요청 순서와 동일)
+    
+    ### 에러 응답
+    - `400 Bad Request`: 빈 배열
+    - `422 Unprocessable Entity`: 입력값 검증 실패
+    """,
+    responses={
+        200: {"description": "프로젝트 일괄 생성 성공"},
+        400: {
+            "description": "잘못된 요청",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "등록할 항목이 없습니다."
+                    }
+                }
+            }
+        }
+    }
+)
+def create_projects_bulk(projects: List[ProjectCreate], db: Session = Depends(get_db)):
+    """
+    여러 프로젝트를 한 번에 생성합니다.
+    """
+    if not projects:
+        raise HTTPException(status_code=400, detail="등록할 항목이 없습니다.")
+    now = datetime.utcnow()
+    rows = [dict(project.dict(), created_at=now, updated_at=now) for project in projects]
+    created = db.scalars(insert(Project).returning(Project, sort_by_parameter_order=True), rows).all()
+    index_projects(db, created)
+    assign_project_skills_many(db, [(project.id, project.tech_stack) for project in created])
+    record_change(db, "portfolio", {project.portfolio_id for project in created})
+    record_change(db, "project", [project.id for project in created])
+    db.commit()
+    return created
+
 @router.get(
     "/", 
-    response_model=List[ProjectResponse],
+    response_model=Union[List[ProjectResponse], Dict[int, List[ProjectResponse]]],
     summary="프로젝트 목록 조회",
     description="""
-    ## 특정 포트폴리오의 프로젝트 목록을 조회합니다.
+    ## 포트폴리오의 프로젝트 목록을 조회합니다.
     
     ### 기능 설명
     - 포트폴리오 ID로 연결된 모든 프로젝트 조회
+    - 여러 포트폴리오의 프로젝트를 한 번의 쿼리로 조회해 포트폴리오별로 묶어 반환
     - 프로젝트의 기본 정보 목록 반환
     
     ### 쿼리 파라미터
-    - `portfolio_id`: 조회할 포트폴리오 ID (필수)
+    - `portfolio_id`: 조회할 포트폴리오 ID
+    - `portfolio_ids`: 조회할 포트폴리오 ID 목록 (쉼표 구분, 최대 100개)
+    - `limit_per_portfolio`: 포트폴리오별 최대 프로젝트 수 (선택사항, `portfolio_ids`와 함께 사용)
+    - `portfolio_id`와 `portfolio_ids` 중 하나만 지정해야 합니다.
     
     ### 응답 데이터
-    - 프로젝트 객체 배열
+    - `portfolio_id`: 프로젝트 객체 배열
+    - `portfolio_ids`: `{포트폴리오 ID: 프로젝트 객체 배열}` (요청한 모든 ID 포함, 없으면 빈 배열)
     
     ### 예시
     ```
     GET /projects?portfolio_id=1
+    GET /projects?portfolio_ids=1,2,3&limit_per_portfolio=3
     ```
     """,
     responses={
@@ -171,13 +241,46 @@ def create_project(
     }
 )
 def get_projects(
-    portfolio_id: int = Query(..., description="조회할 포트폴리오 ID"), 
+    portfolio_id: Optional[int] = Query(None, description="조회할 포트폴리오 ID"), 
+    portfolio_ids: Optional[str] = Query(None, description="조회할 포트폴리오 ID 목록 (쉼표 구분, 예: 1,2,3)"),
+    limit_per_portfolio: Optional[int] = Query(None, ge=1, le=100, description="포트폴리오별 최대 프로젝트 수"),
     db: Session = Depends(get_db)
 ):
     """
-    특정 포트폴리오의 프로젝트 목록을 조회합니다.
+    포트폴리오의 프로젝트 목록을 조회합니다.
+    
+    portfolio_ids를 주면 portfolio_id 인덱스를 타는 IN 쿼리 한 번으로 조회해 포트폴리오별로 묶어 반환합니다.
     """
-    return db.query(Project).filter(Project.portfolio_id == portfolio_id).all()
+    if (portfolio_id is None) == (portfolio_ids is None):
+        raise HTTPException(status_code=400, detail="portfolio_id와 portfolio_ids 중 하나만 지정해야 합니다.")
+    if portfolio_id is not None:
+        return fast_json(to_rows(db.query(Project).filter(Project.portfolio_id == portfolio_id), ProjectResponse))
+
+    try:
+        ids = list(dict.fromkeys(int(value) for value in portfolio_ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="portfolio_ids는 쉼표로 구분한 숫자여야 합니다.")
+    if not ids or len(ids) > MAX_PORTFOLIO_IDS:
+        raise HTTPException(status_code=400, detail=f"portfolio_ids는 1개 이상 {MAX_PORTFOLIO_IDS}개 이하로 지정해야 합니다.")
+    if limit_per_portfolio is None:
+        projects = db.query(Project).filter(Project.portfolio_id.in_(ids)).order_by(Project.portfolio_id, Project.id)
+    else:
+        # 포트폴리오별 순번을 윈도 함수로 매겨 앞에서부터 limit_per_portfolio개만 (한 번의 쿼리)
+        ranked = (
+            select(Project, func.row_number().over(partition_by=Project.portfolio_id, order_by=Project.id).label("rank"))
+            .where(Project.portfolio_id.in_(ids))
+            .subquery()
+        )
+        ranked_project = aliased(Project, ranked)
+        projects = (
+            db.query(ranked_project)
+            .filter(ranked.c.rank <= limit_per_portfolio)
+            .order_by(ranked_project.portfolio_id, ranked_project.id)
+        )
+    grouped = {portfolio_id: [] for portfolio_id in ids}
+    for row in to_rows(projects, ProjectResponse):
+        grouped[row["portfolio_id"]].append(row)
+    return fast_json(grouped)
 
 @router.put(
     "/{project_id}", 
@@ -256,24 +359,24 @@ def update_project(
     
     전송된 필드만 업데이트되며, 프로젝트의 모든 정보를 수정할 수 있습니다.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    fields = {
+        "project_name": project_name,
+        "project_period": project_period,
+        "project_intro": project_intro,
+        "description": description,
+        "role": role,
+        "tech_stack": tech_stack,
+    }
+    fields = {key: value for key, value in fields.items() if value is not None}
+    project = update_returning(db, Project, project_id, updated_at=datetime.utcnow(), **fields)
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
-    if project_name is not None:
-        project.project_name = project_name
-    if project_period is not None:
-        project.project_period = project_period
-    if project_intro is not None:
-        project.project_intro = project_intro
-    if description is not None:
-        project.description = description
-    if role is not None:
-        project.role = role
     if tech_stack is not None:
-        project.tech_stack = tech_stack
-    project.updated_at = datetime.utcnow()
+        assign_project_skills(db, project.id, tech_stack)
+    index_project(db, project)
+    record_change(db, "portfolio", [project.portfolio_id])
+    record_change(db, "project", [project.id])
     db.commit()
-    db.refresh(project)
     return project
 
 @router.delete(
@@ -321,9 +424,7 @@ def delete_project(
     
     프로젝트와 관련된 모든 데이터가 영구적으로 삭제됩니다.
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    if not delete_projects(db, [project_id]):
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
-    db.delete(project)
     db.commit()
     return 
\ No newline at end of file
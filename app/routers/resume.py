@@ -1,21 +1,35 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Path
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Path, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.schemas.resume import ResumeBasicInfoResponse
+from app.schemas.resume import ResumeBasicInfoResponse, ResumeSave, ResumeDetailResponse
 from app.models.resume import ResumeBasicInfo
 from app.core.config import SessionLocal
-from app.utils.file import save_profile_image
-from typing import Optional
+from app.utils.file import save_profile_image, media_path
+from app.utils.archive import ZipStream
+from app.models.user import StudentProfile
+from app.utils.search import index_resume
+from app.utils.changes import record_change
+from app.crud.resume import load_resume_graph, load_resume_graphs, load_resume_fields, apply_resume_diff, RESUME_SECTIONS
+from app.utils.fields import parse_sections
+from app.utils.serialization import fast_json, to_row, to_rows
+from app.crud.base import insert_returning
+from app.crud.cascade import delete_resumes
+from app.crud.portfolio import REPRESENTATIVE_CONFLICT
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime
-from app.models.portfolio import Portfolio
-from app.models.project import Project
-from app.models.award import Award
-from app.models.education import Education
+from fastapi.responses import StreamingResponse
+from urllib.parse import quote
+import orjson
+import os
+from app.schemas.portfolio import PortfolioResponse
 from app.schemas.project import ProjectResponse
 from app.schemas.award import AwardResponse
 from app.schemas.education import EducationResponse
 
 router = APIRouter(prefix="/resumes", tags=["Resume"])
 
+EXPORT_BATCH_SIZE = 100  # 기수 내보내기 시 한 번에 조회하는 이력서 수
+
 def get_db():
     db = SessionLocal()
     try:
@@ -144,7 +158,8 @@ def create_resume_basic_info(
     if profile_image:
         image_path = save_profile_image(profile_image)
 
-    resume = ResumeBasicInfo(
+    resume = insert_returning(
+        db, ResumeBasicInfo,
         user_id=user_id,
         profile_image=image_path,
         name=name,
@@ -160,9 +175,9 @@ def create_resume_basic_info(
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow(),
     )
-    db.add(resume)
+    index_resume(db, resume)
+    record_change(db, "resume", [resume.id])
     db.commit()
-    db.refresh(resume)
     return resume
 
 @router.get(
@@ -170,7 +185,7 @@ def create_resume_basic_info(
     summary="이력서 상세 정보 전체 조회",
     description="""
     특정 이력서의 모든 정보를 상세하게 조회합니다.\n
-    - 이력서 기본 정보, 포트폴리오, 프로젝트, 수상 및 활동, 교육 이력 등\n    - 모든 데이터는 DB에 저장된 원본값 그대로(가공 없이) 반환됩니다.\n
+    - 이력서 기본 정보, 포트폴리오, 프로젝트, 수상 및 활동, 교육 이력 등\n    - 모든 데이터는 DB에 저장된 원본값 그대로(가공 없이) 반환됩니다.\n    - `fields`: 필요한 섹션/필드만 조회 (선택사항, 예: `resume(name,job_type),portfolios(id,project_name,image)`)\n      섹션 이름만 쓰면 해당 섹션의 모든 필드, 지정하지 않은 섹션은 조회하지 않고 응답에서도 제외됩니다.\n
     **응답:**\n    - `resume`: 이력서 기본 정보 객체\n    - `portfolios`: 포트폴리오 객체 리스트\n    - `projects`: 프로젝트 객체 리스트\n    - `awards`: 수상 및 활동 객체 리스트\n    - `educations`: 교육 이력 객체 리스트
     """,
     responses={
@@ -257,6 +272,7 @@ def create_resume_basic_info(
 )
 def get_resume_detail(
     resume_id: int = Path(..., description="조회할 이력서의 ID"), 
+    fields: Optional[str] = Query(None, description="조회할 섹션/필드 (예: resume(name,job_type),portfolios(id,project_name))"),
     db: Session = Depends(get_db)
 ):
     """
@@ -264,18 +280,202 @@ def get_resume_detail(
     이력서 기본 정보와 함께 관련된 포트폴리오, 프로젝트, 수상 내역, 교육 내역을 모두 포함하여,
     DB에 저장된 원본값 그대로(가공 없이) 반환합니다.
     """
-    resume = db.query(ResumeBasicInfo).filter(ResumeBasicInfo.id == resume_id).first()
-    if not resume:
+    if fields:
+        try:
+            sections = parse_sections(fields, RESUME_SECTIONS)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        graph = load_resume_fields(db, resume_id, sections)
+    else:
+        graph = load_resume_graph(db, resume_id)
+    if not graph:
         raise HTTPException(status_code=404, detail="이력서를 찾을 수 없습니다.")
-    portfolios = db.query(Portfolio).filter(Portfolio.resume_id == resume_id).all()
-    projects = db.query(Project).filter(Project.portfolio_id.in_([p.id for p in portfolios])).all()
-    awards = db.query(Award).filter(Award.resume_id == resume_id).all()
-    educations = db.query(Education).filter(Education.resume_id == resume_id).all()
+    if not fields:
+        graph = _graph_rows(graph)
     # 모든 필드를 원본값 그대로 반환
+    return fast_json(graph)
+
+def _graph_rows(graph: Dict[str, Any]) -> Dict[str, Any]:
     return {
-        "resume": resume,
-        "portfolios": portfolios,
-        "projects": projects,
-        "awards": awards,
-        "educations": educations
-    } 
\ No newline at end of file
+        "resume": to_row(graph["resume"], ResumeBasicInfoResponse),
+        "portfolios": to_rows(graph["portfolios"], PortfolioResponse),
+        "projects": to_rows(graph["projects"], ProjectResponse),
+        "awards": to_rows(graph["awards"], AwardResponse),
+        "educations": to_rows(graph["educations"], EducationResponse),
+    }
+
+def _export_archive(resume_ids: List[int]) -> Iterator[bytes]:
+    """
+    이력서를 EXPORT_BATCH_SIZE개씩 조회해 이력서 JSON과 이미지 파일을 ZIP 항목으로 차례대로 내보냅니다.
+    응답이 끝날 때까지 스트리밍하므로 요청 의존성(get_db)과 별도의 세션을 직접 열고 닫습니다.
+    """
+    archive = ZipStream()
+    db = SessionLocal()
+    try:
+        for start in range(0, len(resume_ids), EXPORT_BATCH_SIZE):
+            batch = resume_ids[start:start + EXPORT_BATCH_SIZE]
+            graphs = load_resume_graphs(db, batch)
+            # 다음 배치 조회 전에 세션을 비워 메모리 사용량을 배치 크기로 유지
+            db.expunge_all()
+            for resume_id in batch:
+                graph = graphs.get(resume_id)
+                if graph is None:
+                    continue  # 내보내는 도중 삭제된 이력서
+                folder = f"resume_{resume_id}"
+                yield archive.add_bytes(f"{folder}/resume.json", orjson.dumps(_graph_rows(graph), option=orjson.OPT_INDENT_2))
+                images = [("profile", graph["resume"].profile_image)]
+                images += [(f"portfolio_{p.id}", p.image) for p in graph["portfolios"]]
+                for name, url in images:
+                    path = media_path(url)
+                    if path:
+                        yield from archive.add_file(f"{folder}/{name}{os.path.splitext(path)[1]}", path)
+        yield archive.close()
+    finally:
+        db.close()
+
+@router.get(
+    "/export",
+    summary="기수별 이력서 일괄 내보내기 (ZIP)",
+    description="""
+    특정 기수(`course_generation`) 학생들의 이력서 전체를 ZIP 파일로 내려받습니다. (협력 기업 전달용)\n
+    - 이력서마다 `resume_{id}/resume.json`(`GET /resumes/{resume_id}/detail`과 같은 형식)과 프로필/포트폴리오 이미지가 포함됩니다.\n    - 압축 파일을 서버에 만들어 두지 않고, 이력서를 100개씩 조회하면서 바로 스트리밍합니다.\n
+    **응답:** `application/zip` 첨부 파일
+    """,
+    responses={
+        200: {"description": "내보내기 성공", "content": {"application/zip": {}}},
+        404: {
+            "description": "해당 기수의 이력서가 없음",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "해당 기수의 이력서가 없습니다."
+                    }
+                }
+            }
+        }
+    }
+)
+def export_resumes(
+    course_generation: str = Query(..., description="내보낼 기수 (예: 1기)"),
+    db: Session = Depends(get_db)
+):
+    """
+    기수에 속한 학생들의 이력서와 이미지를 ZIP으로 스트리밍합니다.
+    """
+    resume_ids = [
+        resume_id for (resume_id,) in
+        db.query(ResumeBasicInfo.id)
+        .join(StudentProfile, StudentProfile.user_id == ResumeBasicInfo.user_id)
+        .filter(StudentProfile.course_generation == course_generation)
+        .order_by(ResumeBasicInfo.id)
+    ]
+    if not resume_ids:
+        raise HTTPException(status_code=404, detail="해당 기수의 이력서가 없습니다.")
+    filename = quote(f"resumes_{course_generation}.zip")
+    return StreamingResponse(
+        _export_archive(resume_ids),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{filename}"},
+    )
+
+@router.put(
+    "/{resume_id}",
+    response_model=ResumeDetailResponse,
+    summary="이력서 전체 일괄 저장",
+    description="""
+    이력서 전체(기본 정보, 포트폴리오, 프로젝트, 수상 및 활동, 교육)의 변경분을 한 번에 저장합니다.\n
+    - 모든 변경은 하나의 트랜잭션에서 적용되며, 하나라도 실패하면 아무것도 저장되지 않습니다.\n    - `resume`: 수정할 기본 정보 필드 (보낸 필드만 수정)\n    - `portfolios`, `projects`, `awards`, `educations`: 각각 `create`(새 항목), `update`(`id` + 수정할 필드), `delete`(삭제할 ID 목록)\n    - 새 포트폴리오에 `ref`를 지정하면 같은 요청의 새 프로젝트가 `portfolio_ref`로 연결할 수 있습니다.\n    - 포트폴리오를 삭제하면 소속 프로젝트도 함께 삭제됩니다.\n    - 이미지(프로필, 포트폴리오)는 기존 업로드 API를 사용합니다.\n
+    **응답:** 저장 후의 이력서 전체 (`GET /resumes/{resume_id}/detail`과 동일한 형식)
+    """,
+    responses={
+        200: {"description": "이력서 전체 저장 성공"},
+        400: {
+            "description": "잘못된 요청",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "대표 포트폴리오는 하나만 지정할 수 있습니다."
+                    }
+                }
+            }
+        },
+        404: {
+            "description": "이력서 또는 항목을 찾을 수 없음",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "이력서를 찾을 수 없습니다."
+                    }
+                }
+            }
+        },
+        409: {
+            "description": "동시 요청으로 대표 포트폴리오 변경 충돌",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "다른 요청이 대표 포트폴리오를 먼저 변경했습니다. 다시 시도해 주세요."
+                    }
+                }
+            }
+        }
+    }
+)
+def save_resume(
+    diff: ResumeSave,
+    resume_id: int = Path(..., description="저장할 이력서의 ID"),
+    db: Session = Depends(get_db)
+):
+    """
+    이력서 전체 변경분을 하나의 트랜잭션으로 저장하고, 저장된 이력서 전체를 반환합니다.
+    """
+    try:
+        apply_resume_diff(db, resume_id, diff)
+        db.commit()
+    except LookupError as e:
+        db.rollback()
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError:
+        # 같은 이력서의 대표 포트폴리오를 다른 요청이 먼저 바꾼 경우 (uq_portfolio_representative)
+        db.rollback()
+        raise HTTPException(status_code=409, detail=REPRESENTATIVE_CONFLICT)
+    return load_resume_graph(db, resume_id)
+
+@router.delete(
+    "/{resume_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="이력서 삭제",
+    description="""
+    이력서와 연결된 모든 데이터를 삭제합니다.\n
+    - 포트폴리오와 소속 프로젝트, 수상 및 활동, 교육 이력, 검색 문서를 하나의 트랜잭션에서 함께 삭제합니다.\n    - 삭제된 이력서는 복구할 수 없습니다.\n
+    **응답:** `204 No Content` (응답 본문 없음)
+    """,
+    responses={
+        204: {"description": "이력서 삭제 성공"},
+        404: {
+            "description": "이력서를 찾을 수 없음",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "이력서를 찾을 수 없습니다."
+                    }
+                }
+            }
+        }
+    }
+)
+def delete_resume(
+    resume_id: int = Path(..., description="삭제할 이력서의 ID"),
+    db: Session = Depends(get_db)
+):
+    """
+    이력서와 하위 데이터를 모두 삭제합니다.
+    """
+    if not delete_resumes(db, [resume_id]):
+        db.rollback()
+        raise HTTPException(status_code=404, detail="이력서를 찾을 수 없습니다.")
+    db.commit()
+    return
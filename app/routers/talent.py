@@ -1,12 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.models.user import User, StudentProfile
 from app.models.portfolio import Portfolio
 from app.models.connect import ConnectRequest
+from app.models.similar import SimilarTalent
+from app.models.skill import StudentSkill
 from app.schemas.connect import ConnectRequestCreate, ConnectRequestResponse
+from app.schemas.talent import SearchHit, TalentMatchRequest, TalentMatch, TalentFilterResponse
 from app.core.config import SessionLocal
+from app.crud.base import insert_returning
 from app.utils.slack import send_slack_message
-from typing import List, Optional
+from app.utils.search import search
+from app.utils.matching import talent_matcher
+from app.utils.skills import split_skills
+from app.utils.fields import parse_field_list
+from app.utils.serialization import fast_json
+from app.utils.bitmap import bitmap_index, FilterSyntaxError
+from itertools import islice
+from sqlalchemy import func
+import app.utils.similar  # 변경 사항 구독 (유사 인재 목록 백그라운드 갱신)
+from typing import Iterator, List, Optional
+import csv
+import io
+import orjson
 
 router = APIRouter(prefix="/talents", tags=["Talent"])
 
@@ -19,13 +36,69 @@ def get_db():
     finally:
         db.close()
 
+# 인재 목록 응답 필드와 SELECT 컬럼 (fields 파라미터로 일부만 선택 가능)
+TALENT_COLUMNS = {
+    "portfolio_id": Portfolio.id,
+    "student_user_id": User.id,
+    "student_email": User.email,
+    "course_name": StudentProfile.course_name,
+    "tech_stack": StudentProfile.tech_stack,
+    "project_name": Portfolio.project_name,
+    "project_intro": Portfolio.project_intro,
+    "is_representative": Portfolio.is_representative,
+    "project_image_url": Portfolio.image,
+}
+EXPORT_BATCH_SIZE = 1000  # 내보내기 시 DB에서 한 번에 가져와 전송하는 행 수
+
+def _talent_query(db: Session, names: List[str], tech_stack: Optional[str], course_name: Optional[str]):
+    """
+    인재 탐색/내보내기 공통 쿼리: 지정한 컬럼만 SELECT 하고 기술 스택/과정명 조건을 적용합니다.
+    """
+    query = (
+        db.query(*[TALENT_COLUMNS[name].label(name) for name in names])
+        .select_from(Portfolio)
+        .join(User, Portfolio.resume_id == User.id)
+        .join(StudentProfile, StudentProfile.user_id == User.id)
+    )
+    if tech_stack:
+        skill_ids, unknown = split_skills(tech_stack)
+        if skill_ids:
+            # 표준 스킬 ID로 비교 (요청한 스킬을 모두 가진 학생)
+            matched = (
+                db.query(StudentSkill.user_id)
+                .filter(StudentSkill.skill_id.in_(skill_ids))
+                .group_by(StudentSkill.user_id)
+                .having(func.count() == len(skill_ids))
+            )
+            query = query.filter(StudentProfile.user_id.in_(matched))
+        # 사전에 없는 기술명은 기존처럼 문자열 포함 여부로 검색 (사전에 있는 기술과 함께 와도 조건에서 빠지지 않도록)
+        for name in unknown:
+            query = query.filter(StudentProfile.tech_stack.contains(name))
+    if course_name:
+        query = query.filter(StudentProfile.course_name == course_name)
+    return query
+
+def _talent_row(p: Portfolio, u: User, s: StudentProfile) -> dict:
+    # 간단한 dict 변환
+    return {
+        "portfolio_id": p.id,
+        "student_user_id": u.id,
+        "student_email": u.email,
+        "course_name": s.course_name,
+        "tech_stack": s.tech_stack,
+        "project_name": p.project_name,
+        "project_intro": p.project_intro,
+        "is_representative": p.is_representative,
+        "project_image_url": p.image,  # 대표 프로젝트 이미지 URL 추가
+    }
+
 @router.get(
     "/",
     response_model=List[dict],
     summary="인재 탐색 및 검색",
     description="""
     전체 인재(수료생) 목록을 탐색하거나, 기술 스택/과정명으로 필터링하여 검색합니다.\n
-    - 쿼리 파라미터 없이 호출 시 전체 인재 반환\n    - `tech_stack`: 검색할 기술 스택 (선택)\n    - `course_name`: 검색할 과정명 (선택)\n
+    - 쿼리 파라미터 없이 호출 시 전체 인재 반환\n    - `tech_stack`: 검색할 기술 스택 (선택)\n    - `course_name`: 검색할 과정명 (선택)\n    - `fields`: 응답에 포함할 필드 (선택, 쉼표 구분, 예: `portfolio_id,project_name,project_image_url`)\n
     **응답:**\n    - `portfolio_id`: 포트폴리오 ID\n    - `student_user_id`: 학생 사용자 ID\n    - `student_email`: 학생 이메일\n    - `course_name`: 과정명\n    - `tech_stack`: 기술 스택\n    - `project_name`: 프로젝트명\n    - `project_intro`: 프로젝트 소개\n    - `is_representative`: 대표 포트폴리오 여부\n    - `project_image_url`: 대표 프로젝트 이미지 URL
     """,
     responses={
@@ -65,6 +138,7 @@ def get_db():
 def list_talents(
     tech_stack: Optional[str] = Query(None, description="검색할 기술 스택 (예: React, Python)"),
     course_name: Optional[str] = Query(None, description="검색할 과정명 (예: 웹개발 과정)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: portfolio_id,project_name,project_image_url)"),
     db: Session = Depends(get_db),
 ):
     """
@@ -72,27 +146,304 @@ def list_talents(
     
     기술 스택과 과정명을 기준으로 필터링하여
     기업이 원하는 인재를 찾을 수 있도록 도와줍니다.
+    fields를 지정하면 해당 컬럼만 SELECT 합니다.
     """
-    query = db.query(Portfolio, User, StudentProfile).join(User, Portfolio.resume_id == User.id).join(StudentProfile, StudentProfile.user_id == User.id)
-    if tech_stack:
-        query = query.filter(StudentProfile.tech_stack.contains(tech_stack))
-    if course_name:
-        query = query.filter(StudentProfile.course_name == course_name)
-    results = query.all()
-    # 간단한 dict 변환
+    try:
+        names = parse_field_list(fields, TALENT_COLUMNS) if fields else list(TALENT_COLUMNS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return fast_json([row._asdict() for row in _talent_query(db, names, tech_stack, course_name)])
+
+def _export_lines(names: List[str], tech_stack: Optional[str], course_name: Optional[str], format: str) -> Iterator[bytes]:
+    """
+    인재 목록을 DB 커서에서 EXPORT_BATCH_SIZE행씩 읽어 NDJSON/CSV 바이트 묶음으로 내보냅니다.
+    응답이 끝날 때까지 스트리밍하므로 요청 의존성(get_db)과 별도의 세션을 직접 열고 닫습니다.
+    """
+    db = SessionLocal()
+    try:
+        query = _talent_query(db, names, tech_stack, course_name).order_by(Portfolio.id).yield_per(EXPORT_BATCH_SIZE)
+        if format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            buffer.write("\ufeff")  # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+            writer.writerow(names)
+            for count, row in enumerate(query, start=1):
+                writer.writerow(row)
+                if count % EXPORT_BATCH_SIZE == 0:
+                    yield buffer.getvalue().encode("utf-8")
+                    buffer.seek(0)
+                    buffer.truncate()
+            yield buffer.getvalue().encode("utf-8")
+        else:
+            lines = []
+            for row in query:
+                lines.append(orjson.dumps(row._asdict()))
+                if len(lines) == EXPORT_BATCH_SIZE:
+                    yield b"\n".join(lines) + b"\n"
+                    lines = []
+            if lines:
+                yield b"\n".join(lines) + b"\n"
+    finally:
+        db.close()
+
+@router.get(
+    "/export",
+    summary="인재 목록 내보내기 (NDJSON/CSV)",
+    description="""
+    인재 탐색과 같은 조건으로 검색한 전체 결과를 파일로 스트리밍합니다. (기업 ATS 연동용)\n
+    - `format`: `ndjson`(한 줄에 JSON 객체 하나) 또는 `csv` (기본값: ndjson)\n    - `tech_stack`, `course_name`, `fields`: `GET /talents/`와 동일\n    - 결과를 메모리에 모으지 않고 DB 커서에서 읽는 대로 전송하므로 결과 크기와 관계없이 메모리 사용량이 일정합니다.\n
+    **응답:** `application/x-ndjson` 또는 `text/csv` 첨부 파일
+    """,
+    responses={
+        200: {
+            "description": "내보내기 성공",
+            "content": {
+                "application/x-ndjson": {
+                    "example": '{"portfolio_id": 1, "student_user_id": 1, "student_email": "student@example.com", "course_name": "웹개발 과정"}\n'
+                },
+                "text/csv": {
+                    "example": "portfolio_id,student_user_id,student_email,course_name\n1,1,student@example.com,웹개발 과정\n"
+                }
+            }
+        },
+        400: {"description": "알 수 없는 필드"}
+    }
+)
+def export_talents(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="내보내기 형식 (ndjson, csv)"),
+    tech_stack: Optional[str] = Query(None, description="검색할 기술 스택 (예: React, Python)"),
+    course_name: Optional[str] = Query(None, description="검색할 과정명 (예: 웹개발 과정)"),
+    fields: Optional[str] = Query(None, description="포함할 필드 (쉼표 구분)"),
+):
+    """
+    조건에 맞는 인재 전체를 NDJSON 또는 CSV로 스트리밍합니다.
+    """
+    try:
+        names = parse_field_list(fields, TALENT_COLUMNS) if fields else list(TALENT_COLUMNS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    media_type = "text/csv; charset=utf-8" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _export_lines(names, tech_stack, course_name, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="talents.{format}"'},
+    )
+
+@router.get(
+    "/search",
+    response_model=List[SearchHit],
+    summary="인재 전문 검색",
+    description="""
+    포트폴리오/프로젝트/이력서 소개글 전체를 대상으로 자유 텍스트 검색을 수행합니다.\n
+    - `q`: 검색어 (필수, 한글은 2글자 단위 n-gram으로 색인됩니다)\n    - `limit`: 최대 결과 수 (기본값: 20)\n
+    **응답:** 관련도(`score`)가 높은 순으로 정렬된 문서 목록\n    - `doc_type`: 문서 종류 (`portfolio`, `project`, `resume`)\n    - `doc_id`: 문서 ID\n    - `resume_id`: 이력서 ID\n    - `score`: 관련도 점수 (SQLite: BM25, PostgreSQL: ts_rank_cd)
+    """,
+    responses={
+        200: {
+            "description": "전문 검색 성공",
+            "content": {
+                "application/json": {
+                    "example": [
+                        {"doc_type": "project", "doc_id": 3, "resume_id": 1, "score": 4.21},
+                        {"doc_type": "portfolio", "doc_id": 1, "resume_id": 1, "score": 2.87}
+                    ]
+                }
+            }
+        }
+    }
+)
+def search_talents(
+    q: str = Query(..., min_length=1, description="검색어 (예: 리액트 결제 시스템)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+    db: Session = Depends(get_db),
+):
+    """
+    전문 검색 인덱스를 이용해 인재 관련 문서를 관련도 순으로 검색합니다.
+    """
+    return search(db, q, limit)
+
+@router.get(
+    "/filter",
+    response_model=TalentFilterResponse,
+    summary="불리언 조건 인재 필터",
+    description="""
+    기술 스택, 과정, 기수, 대표 포트폴리오 여부를 AND/OR/NOT 조합으로 필터링합니다.\n
+    - `q`: 필터 식 (필수)\n        - `skill:<기술명>`: 기술 스택 (별칭/오타 허용, 예: `skill:리액트`)\n        - `course:<과정명>`: 과정명 (공백이 있으면 `course:"웹개발 과정"`)\n        - `gen:<기수>`: 기수 (예: `gen:12기`)\n        - `rep`: 대표 포트폴리오만\n        - `AND`, `OR`, `NOT`, 괄호 사용 가능 (AND는 생략 가능)\n    - `limit`, `offset`: 페이지네이션\n
+    예시: `(skill:React OR skill:Vue) AND skill:TypeScript AND gen:12기 AND rep`\n
+    **응답:** 전체 일치 건수(`count`)와 현재 페이지의 인재 목록(`results`, 인재 탐색과 동일한 형식)
+    """,
+    responses={
+        200: {
+            "description": "인재 필터 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "count": 1,
+                        "results": [
+                            {
+                                "portfolio_id": 1,
+                                "student_user_id": 1,
+                                "student_email": "student1@example.com",
+                                "course_name": "웹개발 과정",
+                                "tech_stack": "React, TypeScript",
+                                "project_name": "쇼핑몰 웹사이트",
+                                "project_intro": "React와 Node.js를 활용한 풀스택 쇼핑몰",
+                                "is_representative": True,
+                                "project_image_url": "/media/portfolio/1.png"
+                            }
+                        ]
+                    }
+                }
+            }
+        },
+        400: {
+            "description": "잘못된 필터 식",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "괄호가 닫히지 않았습니다."
+                    }
+                }
+            }
+        }
+    }
+)
+def filter_talents(
+    q: str = Query(..., min_length=1, description="필터 식 (예: skill:React AND gen:12기 AND rep)"),
+    limit: int = Query(50, ge=1, le=500, description="최대 결과 수"),
+    offset: int = Query(0, ge=0, description="건너뛸 결과 수"),
+    db: Session = Depends(get_db),
+):
+    """
+    비트맵 색인으로 불리언 필터를 평가한 뒤, 현재 페이지의 포트폴리오만 DB에서 조회합니다.
+    """
+    try:
+        matched = bitmap_index.evaluate(db, q)
+    except FilterSyntaxError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    page = list(islice(matched, offset, offset + limit))
+    results = []
+    if page:
+        results = (
+            db.query(Portfolio, User, StudentProfile)
+            .join(User, Portfolio.resume_id == User.id)
+            .join(StudentProfile, StudentProfile.user_id == User.id)
+            .filter(Portfolio.id.in_(page))
+            .order_by(Portfolio.id)
+            .all()
+        )
+    return {"count": len(matched), "results": [_talent_row(p, u, s) for p, u, s in results]}
+
+@router.post(
+    "/match",
+    response_model=List[TalentMatch],
+    summary="직무 설명 기반 인재 추천",
+    description="""
+    직무 설명과 필수 기술 스택에 가장 잘 맞는 인재(수료생) 상위 K명을 추천합니다.\n
+    - `job_description`: 직무 설명 (필수)\n    - `required_stack`: 필수 기술 스택 (선택, 본문보다 가중치가 높음)\n    - `top_k`: 추천 인원 수 (기본값: 20, 최대 200)\n
+    학생의 기술 스택, 포트폴리오, 프로젝트 내용을 TF-IDF 가중 해시 피처로 벡터화하여 유사도를 계산합니다.\n
+    **응답:** 유사도(`score`)가 높은 순으로 정렬된 인재 목록
+    """,
+    responses={
+        200: {
+            "description": "인재 추천 성공",
+            "content": {
+                "application/json": {
+                    "example": [
+                        {
+                            "student_user_id": 1,
+                            "student_email": "student1@example.com",
+                            "course_name": "웹개발 과정",
+                            "course_generation": "12기",
+                            "tech_stack": "React, Node.js, MongoDB",
+                            "score": 0.62
+                        }
+                    ]
+                }
+            }
+        }
+    }
+)
+def match_talents(
+    req: TalentMatchRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    직무 설명과 유사도가 높은 인재를 추천합니다.
+    """
+    ranked = talent_matcher.rank(db, req.job_description, req.required_stack, req.top_k)
+    if not ranked:
+        return []
+    rows = db.query(User.id, User.email, StudentProfile).join(StudentProfile, StudentProfile.user_id == User.id).filter(User.id.in_([user_id for user_id, _ in ranked])).all()
+    found = {user_id: (email, s) for user_id, email, s in rows}
+    return [
+        {
+            "student_user_id": user_id,
+            "student_email": found[user_id][0],
+            "course_name": found[user_id][1].course_name,
+            "course_generation": found[user_id][1].course_generation,
+            "tech_stack": found[user_id][1].tech_stack,
+            "score": score,
+        }
+        for user_id, score in ranked
+        if user_id in found
+    ]
+
+@router.get(
+    "/{student_user_id}/similar",
+    response_model=List[TalentMatch],
+    summary="유사 인재 조회",
+    description="""
+    특정 인재(수료생)와 기술 스택이 비슷한 인재 목록을 조회합니다.\n
+    - `student_user_id`: 기준 학생 사용자 ID\n
+    유사도는 백그라운드 작업에서 미리 계산되어 저장되며, 프로필/프로젝트 변경 시 영향받는 학생만 갱신됩니다.\n
+    **응답:** 유사도(`score`)가 높은 순으로 정렬된 인재 목록 (최대 10명)
+    """,
+    responses={
+        200: {
+            "description": "유사 인재 조회 성공",
+            "content": {
+                "application/json": {
+                    "example": [
+                        {
+                            "student_user_id": 7,
+                            "student_email": "student7@example.com",
+                            "course_name": "웹개발 과정",
+                            "course_generation": "12기",
+                            "tech_stack": "React, TypeScript",
+                            "score": 0.81
+                        }
+                    ]
+                }
+            }
+        }
+    }
+)
+def get_similar_talents(
+    student_user_id: int = Path(..., description="기준 학생 사용자 ID"),
+    db: Session = Depends(get_db),
+):
+    """
+    미리 계산된 유사 인재 목록을 조회합니다.
+    """
+    rows = (
+        db.query(SimilarTalent.score, User.id, User.email, StudentProfile)
+        .join(User, User.id == SimilarTalent.neighbour_user_id)
+        .join(StudentProfile, StudentProfile.user_id == User.id)
+        .filter(SimilarTalent.student_user_id == student_user_id)
+        .order_by(SimilarTalent.rank)
+        .all()
+    )
     return [
         {
-            "portfolio_id": p.id,
-            "student_user_id": u.id,
-            "student_email": u.email,
+            "student_user_id": user_id,
+            "student_email": email,
             "course_name": s.course_name,
+            "course_generation": s.course_generation,
             "tech_stack": s.tech_stack,
-            "project_name": p.project_name,
-            "project_intro": p.project_intro,
-            "is_representative": p.is_representative,
-            "project_image_url": p.image,  # 대표 프로젝트 이미지 URL 추가
+            "score": score,
         }
-        for p, u, s in results
+        for score, user_id, email, s in rows
     ]
 
 @router.post(
@@ -177,7 +528,8 @@ def create_connect_request(
             raise HTTPException(status_code=400, detail="이미 커넥트 요청이 존재합니다.")
         
         # 연결 요청 생성
-        connect = ConnectRequest(
+        connect = insert_returning(
+            db, ConnectRequest,
             company_user_id=req.company_user_id,
             student_user_id=req.student_user_id,
             portfolio_id=req.portfolio_id,
@@ -188,9 +540,7 @@ def create_connect_request(
             career_level=req.career_level,
             employment_type=req.employment_type
         )
-        db.add(connect)
         db.commit()
-        db.refresh(connect)
         
         # 슬랙 알림 전송 (실패해도 전체 요청은 성공)
         if SLACK_WEBHOOK_URL:
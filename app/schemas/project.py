@@ -10,7 +10,7 @@ class ProjectBase(BaseModel):
     description: str
     role: str
     tech_stack: str
-    github_url: Optional[str]
+    github_url: Optional[str] = None
 
 class ProjectCreate(ProjectBase):
     pass
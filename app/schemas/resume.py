@@ -1,6 +1,10 @@
 from pydantic import BaseModel, EmailStr, constr
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+from app.schemas.portfolio import PortfolioResponse
+from app.schemas.project import ProjectResponse
+from app.schemas.award import AwardResponse
+from app.schemas.education import EducationResponse
 
 class ResumeBasicInfoBase(BaseModel):
     name: str
@@ -26,4 +30,113 @@ class ResumeBasicInfoResponse(ResumeBasicInfoBase):
     updated_at: datetime
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+class ResumeBasicInfoUpdate(BaseModel):
+    name: Optional[str] = None
+    email: Optional[EmailStr] = None
+    phone: Optional[constr(min_length=10, max_length=15)] = None
+    job_type: Optional[str] = None
+    school: Optional[str] = None
+    major: Optional[str] = None
+    grade: Optional[str] = None
+    period: Optional[str] = None
+    short_intro: Optional[str] = None
+    intro: Optional[str] = None
+    age: Optional[int] = None
+
+# 이력서 일괄 저장: 섹션별로 생성(create) / 수정(update, 보낸 필드만) / 삭제(delete, ID 목록)를 전달
+class PortfolioDraft(BaseModel):
+    ref: Optional[str] = None  # 같은 요청의 새 프로젝트가 참조할 임시 키
+    is_representative: Optional[bool] = False
+    project_url: Optional[str] = None
+    project_name: str
+    project_intro: str
+    project_period: str
+    role: str
+
+class PortfolioChange(BaseModel):
+    id: int
+    is_representative: Optional[bool] = None
+    project_url: Optional[str] = None
+    project_name: Optional[str] = None
+    project_intro: Optional[str] = None
+    project_period: Optional[str] = None
+    role: Optional[str] = None
+
+class ProjectDraft(BaseModel):
+    portfolio_id: Optional[int] = None   # 기존 포트폴리오
+    portfolio_ref: Optional[str] = None  # 같은 요청에서 생성하는 포트폴리오의 ref
+    project_name: str
+    project_period: str
+    project_intro: str
+    description: str
+    role: str
+    tech_stack: str
+    github_url: Optional[str] = None
+
+class ProjectChange(BaseModel):
+    id: int
+    project_name: Optional[str] = None
+    project_period: Optional[str] = None
+    project_intro: Optional[str] = None
+    description: Optional[str] = None
+    role: Optional[str] = None
+    tech_stack: Optional[str] = None
+    github_url: Optional[str] = None
+
+class AwardDraft(BaseModel):
+    name: str
+    date: str
+    organization: str
+
+class AwardChange(BaseModel):
+    id: int
+    name: Optional[str] = None
+    date: Optional[str] = None
+    organization: Optional[str] = None
+
+class EducationDraft(BaseModel):
+    institution: str
+    period: str
+    name: str
+
+class EducationChange(BaseModel):
+    id: int
+    institution: Optional[str] = None
+    period: Optional[str] = None
+    name: Optional[str] = None
+
+class PortfolioDiff(BaseModel):
+    create: List[PortfolioDraft] = []
+    update: List[PortfolioChange] = []
+    delete: List[int] = []
+
+class ProjectDiff(BaseModel):
+    create: List[ProjectDraft] = []
+    update: List[ProjectChange] = []
+    delete: List[int] = []
+
+class AwardDiff(BaseModel):
+    create: List[AwardDraft] = []
+    update: List[AwardChange] = []
+    delete: List[int] = []
+
+class EducationDiff(BaseModel):
+    create: List[EducationDraft] = []
+    update: List[EducationChange] = []
+    delete: List[int] = []
+
+class ResumeSave(BaseModel):
+    resume: Optional[ResumeBasicInfoUpdate] = None
+    portfolios: PortfolioDiff = PortfolioDiff()
+    projects: ProjectDiff = ProjectDiff()
+    awards: AwardDiff = AwardDiff()
+    educations: EducationDiff = EducationDiff()
+
+class ResumeDetailResponse(BaseModel):
+    resume: ResumeBasicInfoResponse
+    portfolios: List[PortfolioResponse]
+    projects: List[ProjectResponse]
+    awards: List[AwardResponse]
+    educations: List[EducationResponse]
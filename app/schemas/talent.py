@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+class SearchHit(BaseModel):
+    doc_type: str  # portfolio / project / resume
+    doc_id: int
+    resume_id: Optional[int]
+    score: float
+
+class TalentMatchRequest(BaseModel):
+    job_description: str
+    required_stack: Optional[str] = None
+    top_k: int = Field(20, ge=1, le=200)
+
+class TalentMatch(BaseModel):
+    student_user_id: int
+    student_email: str
+    course_name: str
+    course_generation: str
+    tech_stack: str
+    score: float
+
+class AutocompleteSuggestion(BaseModel):
+    value: str
+    count: int
+
+class TalentFilterResponse(BaseModel):
+    count: int
+    results: List[dict]
\ No newline at end of file
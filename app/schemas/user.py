@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app.models.user import UserTypeEnum, OAuthProviderEnum
 
@@ -32,6 +32,16 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class StudentImportError(BaseModel):
+    line: int
+    email: Optional[str] = None
+    detail: str
+
+class StudentImportResponse(BaseModel):
+    created: int
+    failed: int
+    errors: List[StudentImportError]
+
 class LoginRequest(BaseModel):
     email: EmailStr
     password: str
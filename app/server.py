@@ -0,0 +1,413 @@
+import argparse
+import os
+import random
+import select
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+# 운영 서버 실행기: python -m app.server
+# - 마스터 프로세스가 앱을 미리 import한 뒤(preload) fork하므로 워커들이 import한 코드 메모리를 copy-on-write로 공유
+#   (인메모리 색인(자동완성, 비트맵, 매칭)은 fork 후 워커마다 startup에서 따로 구축)
+# - 워커마다 색인을 따로 가지므로, 다른 워커가 커밋한 변경은 change_log를 CHANGE_POLL_INTERVAL(기본 2초)마다 읽어 반영
+# - 워커 수에 맞춰 워커별 DB 커넥션 풀과 동기 엔드포인트 스레드 수를 나눠 DB 최대 연결 수를 넘지 않게 함
+# - 요청 수/메모리 기준으로 워커를 하나씩 교체(recycle)하고, 신호로 무중단 재시작과 워커 수 조절
+# - 워커별 메트릭을 METRICS_DIR의 스냅샷 파일로 모아 어느 워커의 /metrics에서나 전체 값을 응답
+#
+# 신호 (마스터 PID로 전송)
+#   SIGHUP          워커를 하나씩 새로 띄우고 기존 워커를 종료 (처리 중인 요청은 마무리)
+#   SIGTTIN/SIGTTOU 워커 1개 추가/감소
+#   SIGTERM/SIGINT  모든 워커에 종료 요청 후 GRACEFUL_TIMEOUT 동안 대기, 남은 워커는 강제 종료
+# 워커는 앱 startup(색인 구축 등)을 마치면 파이프로 마스터에 알립니다. 알리기 전에 종료하면 시작 실패로 보고,
+# 처음 띄운 워커가 하나도 시작하지 못하면 설정/DB 문제로 보고 마스터도 종료(코드 1)하며,
+# 운영 중 시작 실패는 BOOT_BACKOFF부터 두 배씩(최대 BOOT_BACKOFF_MAX) 기다렸다가 한 개씩 다시 띄웁니다.
+# preload 상태에서는 마스터가 이미 불러온 코드를 쓰므로, 새 코드 배포는 마스터 재시작 또는 --no-preload + SIGHUP으로 합니다.
+
+CHECK_INTERVAL = 1.0  # 마스터가 워커 상태를 확인하는 주기(초)
+BOOT_BACKOFF = 1.0  # 워커 시작 실패 후 다시 띄우기까지 대기(초), 연속 실패마다 두 배
+BOOT_BACKOFF_MAX = 60.0
+SIGNALS = (signal.SIGHUP, signal.SIGTTIN, signal.SIGTTOU, signal.SIGTERM, signal.SIGINT)
+
+def worker_count() -> int:
+    return int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+def size_pools(workers: int) -> Dict[str, int]:
+    """
+    DB_MAX_CONNECTIONS(모든 워커가 함께 쓸 DB 연결 수)를 워커 수로 나눠 워커별 풀/스레드 수를 정합니다.
+    직접 지정한 DB_POOL_SIZE/DB_MAX_OVERFLOW/THREADPOOL_SIZE 환경 변수가 있으면 그대로 둡니다.
+    """
+    total = int(os.environ.get("DB_MAX_CONNECTIONS", "80"))
+    per_worker = max(2, total // workers)
+    sizes = {
+        "DB_POOL_SIZE": per_worker,
+        "DB_MAX_OVERFLOW": 0,
+        # 풀보다 많은 스레드는 커넥션을 기다리며 묶이기만 하므로 풀 크기와 맞춤
+        "THREADPOOL_SIZE": per_worker,
+    }
+    for name, value in sizes.items():
+        os.environ.setdefault(name, str(value))
+    return {name: int(os.environ[name]) for name in sizes}
+
+def private_memory_mb(pid: int) -> Optional[float]:
+    """
+    워커 고유 메모리(공유되지 않은 페이지, MB). preload로 공유하는 페이지는 제외해야 워커별 증가분을 볼 수 있습니다.
+    /proc이 없는 환경(리눅스 외)에서는 None.
+    """
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            kb = sum(int(line.split()[1]) for line in f if line.startswith(("Private_Clean:", "Private_Dirty:")))
+        return kb / 1024
+    except (OSError, ValueError, IndexError):
+        return None
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+class Arbiter:
+    """
+    워커 프로세스를 띄우고 감시하는 마스터.
+    """
+
+    def __init__(self, args: argparse.Namespace, sock: socket.socket):
+        self.args = args
+        self.sock = sock
+        self.target = args.workers
+        self.workers: Dict[int, float] = {}   # pid -> 시작 시각
+        self.retiring: Dict[int, float] = {}  # 종료 요청을 보낸 pid -> 강제 종료 기한
+        self.booting: Dict[int, int] = {}     # 아직 시작 중인 pid -> 준비 알림 파이프(읽는 쪽)
+        self.replacing: Dict[int, int] = {}   # 교체용으로 띄운 새 pid -> 새 워커가 준비되면 종료할 기존 pid
+        self.restart_queue: List[int] = []    # SIGHUP 재시작에서 아직 교체하지 않은 기존 pid
+        self.restart_after = 0.0              # 재시작 중 다음 워커를 교체할 수 있는 시각
+        self.booted = False                   # 시작을 마친 워커가 한 번이라도 있었는지
+        self.boot_failures = 0                # 연속 시작 실패 수
+        self.spawn_after = 0.0                # 시작 실패 후 다음 워커를 띄울 수 있는 시각
+        self.ready_fd: Optional[int] = None   # (워커) 준비 알림 파이프(쓰는 쪽)
+        self.exit_code = 0
+        self.app = None
+        self.stopping = False
+        self.reload_requested = False
+
+    def preload(self) -> None:
+        from app.core.config import engine
+        from app.main import app
+        # 마스터에서 연 커넥션이 워커에 복제되지 않도록 (preload 중 연결했을 경우 대비)
+        engine.dispose()
+        self.app = app
+
+    # --- 워커 ---
+
+    def spawn(self) -> int:
+        # fork 직후 자식이 마스터의 신호 처리기를 물려받은 채 신호를 받지 않도록, 처리기를 되돌릴 때까지 신호를 막아 둠
+        ready_read, ready_write = os.pipe()
+        signal.pthread_sigmask(signal.SIG_BLOCK, SIGNALS)
+        pid = os.fork()
+        if pid:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, SIGNALS)
+            os.close(ready_write)
+            os.set_blocking(ready_read, False)
+            self.workers[pid] = time.monotonic()
+            self.booting[pid] = ready_read
+            return pid
+        for sig in SIGNALS:
+            signal.signal(sig, signal.SIG_DFL)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, SIGNALS)
+        os.close(ready_read)
+        for fd in self.booting.values():
+            os.close(fd)
+        self.ready_fd = ready_write
+        try:
+            self._run_worker()
+            code = 0
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        os._exit(code)
+
+    def _run_worker(self) -> None:
+        import uvicorn
+        random.seed()
+        if self.app is None:
+            from app.main import app
+        else:
+            app = self.app
+        from app.core.config import engine
+        # fork 전 부모의 커넥션은 닫지 않고 버림 (부모 소유)
+        engine.dispose(close=False)
+        ready_fd = self.ready_fd
+
+        class WorkerServer(uvicorn.Server):
+            async def startup(self, sockets=None) -> None:
+                await super().startup(sockets=sockets)
+                # 앱 startup이 실패하면 uvicorn은 should_exit만 세우고 정상 종료하므로 알리지 않음
+                if self.started and not self.should_exit:
+                    os.write(ready_fd, b"1")
+                os.close(ready_fd)
+
+        config = uvicorn.Config(
+            app,
+            lifespan="on",
+            proxy_headers=True,
+            forwarded_allow_ips=self.args.forwarded_allow_ips,
+            timeout_keep_alive=self.args.keep_alive,
+            timeout_graceful_shutdown=self.args.graceful_timeout,
+            limit_max_requests=self.args.max_requests or None,
+            limit_max_requests_jitter=self.args.max_requests_jitter,
+            access_log=self.args.access_log,
+        )
+        WorkerServer(config).run(sockets=[self.sock])
+
+    def retire(self, pid: int) -> None:
+        """
+        워커에 종료를 요청 (uvicorn은 새 연결을 받지 않고 처리 중인 요청을 마무리한 뒤 종료)
+        """
+        if pid in self.workers and pid not in self.retiring:
+            self.retiring[pid] = time.monotonic() + self.args.graceful_timeout + 5
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def active(self) -> list:
+        return [pid for pid in self.workers if pid not in self.retiring]
+
+    def replace(self, pid: int) -> None:
+        """
+        새 워커를 띄우고, 새 워커가 준비를 마친 뒤에 기존 워커를 종료 (check_ready)
+        새 워커가 시작하지 못하면 기존 워커는 계속 요청을 처리
+        """
+        self.replacing[self.spawn()] = pid
+
+    # --- 신호 ---
+
+    def install_signals(self) -> None:
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+        signal.signal(signal.SIGTTIN, self._on_scale)
+        signal.signal(signal.SIGTTOU, self._on_scale)
+
+    def _on_stop(self, signum, frame) -> None:
+        self.stopping = True
+
+    def _on_reload(self, signum, frame) -> None:
+        self.reload_requested = True
+
+    def _on_scale(self, signum, frame) -> None:
+        self.target = self.target + 1 if signum == signal.SIGTTIN else max(1, self.target - 1)
+        print(f"ℹ️ 워커 수 변경: {self.target}개", flush=True)
+
+    # --- 마스터 루프 ---
+
+    def _ready(self, pid: int) -> bool:
+        # 준비 알림을 받았으면 파이프를 닫고 True (워커가 알림 없이 끝났으면 EOF라 False)
+        fd = self.booting[pid]
+        try:
+            data = os.read(fd, 1)
+        except BlockingIOError:
+            return False
+        del self.booting[pid]
+        os.close(fd)
+        if data:
+            self.booted = True
+            self.boot_failures = 0
+        return bool(data)
+
+    def check_ready(self) -> None:
+        if self.booting:
+            readable, _, _ = select.select(list(self.booting.values()), [], [], 0)
+            for pid in [pid for pid, fd in self.booting.items() if fd in readable]:
+                if self._ready(pid) and pid in self.replacing:
+                    self.retire(self.replacing.pop(pid))
+                    self.restart_after = time.monotonic() + self.args.reload_delay
+
+    def boot_failed(self, pid: int, code: int) -> None:
+        self.boot_failures += 1
+        if not self.booted:
+            print(f"❌ 워커 {pid}가 시작하지 못했습니다 (코드 {code}). 설정과 DB 연결을 확인하세요. 서버를 종료합니다.", flush=True)
+            self.exit_code = 1
+            self.stopping = True
+            return
+        delay = min(BOOT_BACKOFF * 2 ** (self.boot_failures - 1), BOOT_BACKOFF_MAX)
+        self.spawn_after = time.monotonic() + delay
+        print(f"⚠️ 워커 {pid}가 시작하지 못했습니다 (코드 {code}, 연속 {self.boot_failures}회). {delay:.0f}초 후 다시 띄웁니다.", flush=True)
+
+    def serving(self) -> list:
+        # 워커 수 계산 대상 (교체용으로 띄운 워커는 기존 워커가 종료될 때까지 세지 않음)
+        return [pid for pid in self.active() if pid not in self.replacing]
+
+    def spawn_missing(self, active: list) -> None:
+        missing = self.target - len(active)
+        if missing <= 0 or time.monotonic() < self.spawn_after:
+            return
+        if self.boot_failures:
+            # 시작 실패가 이어지는 동안에는 한 번에 하나씩만 시험
+            missing = 0 if self.booting else 1
+        for _ in range(missing):
+            self.spawn()
+
+    def reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            self.workers.pop(pid, None)
+            expected = self.retiring.pop(pid, None) is not None
+            # 교체용 워커가 준비 전에 끝났으면 기존 워커를 유지, 기존 워커가 먼저 끝났으면 새 워커는 일반 워커가 됨
+            self.replacing.pop(pid, None)
+            self.replacing = {new: old for new, old in self.replacing.items() if old != pid}
+            code = os.waitstatus_to_exitcode(status)
+            booted = pid not in self.booting or self._ready(pid)
+            fd = self.booting.pop(pid, None)
+            if fd is not None:
+                os.close(fd)
+            self.retire_metrics(pid)
+            if expected or self.stopping:
+                continue
+            if not booted:
+                self.boot_failed(pid, code)
+            else:
+                # 요청 수 제한(limit_max_requests)에 도달한 정상 종료 포함
+                print(f"ℹ️ 워커 {pid} 종료 (코드 {code}), 새 워커를 띄웁니다.", flush=True)
+
+    def retire_metrics(self, pid: int) -> None:
+        # 종료된 워커의 카운터/히스토그램 누적값을 보존 (다음 수집에서 값이 줄어들지 않도록)
+        from app.utils.metrics import retire_snapshot
+        try:
+            retire_snapshot(os.environ["METRICS_DIR"], pid)
+        except OSError as e:
+            print(f"⚠️ 워커 {pid} 메트릭 정리 실패: {e}", flush=True)
+
+    def check_memory(self) -> None:
+        if not self.args.max_worker_memory:
+            return
+        replaced = set(self.replacing.values())
+        for pid in self.serving():
+            # 시작 중(색인 구축 중)이거나 이미 교체 중인 워커는 제외
+            if pid in self.booting or pid in replaced:
+                continue
+            if time.monotonic() < self.spawn_after:
+                return
+            memory = private_memory_mb(pid)
+            if memory is not None and memory > self.args.max_worker_memory:
+                print(f"ℹ️ 워커 {pid} 메모리 {memory:.0f}MB > {self.args.max_worker_memory}MB, 교체합니다.", flush=True)
+                self.replace(pid)
+
+    def kill_overdue(self) -> None:
+        now = time.monotonic()
+        for pid, deadline in list(self.retiring.items()):
+            if now > deadline:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+    def rolling_restart(self) -> None:
+        # 지금 있는 워커를 모두 교체 대상으로 등록 (실제 교체는 continue_restart에서 하나씩)
+        self.restart_queue = self.active()
+
+    def continue_restart(self) -> None:
+        # 워커를 하나씩 교체: 새 워커가 연결을 받을 준비가 된 뒤에 기존 워커를 종료하고 다음으로 넘어가 처리 용량을 유지
+        # 새 워커가 시작하지 못하면 기존 워커를 대기열에 남겨 두고 시작 실패 대기 시간 후 다시 시도
+        self.restart_queue = [pid for pid in self.restart_queue if pid in self.workers and pid not in self.retiring]
+        if not self.restart_queue or self.replacing or time.monotonic() < max(self.restart_after, self.spawn_after):
+            return
+        self.replace(self.restart_queue[0])
+
+    def run(self) -> int:
+        if self.args.preload:
+            self.preload()
+        self.install_signals()
+        print(f"🚀 http://{self.args.host}:{self.args.port} 마스터 {os.getpid()}, 워커 {self.target}개", flush=True)
+        while not self.stopping:
+            self.reap()
+            self.check_ready()
+            if self.stopping:
+                break
+            if self.reload_requested:
+                self.reload_requested = False
+                print("🔄 워커를 순서대로 재시작합니다...", flush=True)
+                self.rolling_restart()
+            self.continue_restart()
+            active = self.serving()
+            self.spawn_missing(active)
+            for pid in sorted(active, key=self.workers.get)[:max(0, len(active) - self.target)]:
+                self.retire(pid)
+            self.check_memory()
+            self.kill_overdue()
+            time.sleep(CHECK_INTERVAL)
+        return self.shutdown()
+
+    def shutdown(self) -> int:
+        print("🛑 종료 요청: 처리 중인 요청을 마무리합니다...", flush=True)
+        for pid in list(self.workers):
+            self.retire(pid)
+        deadline = time.monotonic() + self.args.graceful_timeout + 5
+        while self.workers and time.monotonic() < deadline:
+            self.reap()
+            time.sleep(0.1)
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        self.reap()
+        self.sock.close()
+        print("👋 서버를 종료했습니다.", flush=True)
+        return self.exit_code
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="LionConnect 운영 서버 (멀티 워커 uvicorn)")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=worker_count(), help="워커 수 (기본값: WEB_CONCURRENCY 또는 CPU 수)")
+    parser.add_argument("--no-preload", dest="preload", action="store_false", help="fork 전에 앱을 불러오지 않음 (SIGHUP 시 새 코드 적용)")
+    parser.add_argument("--max-requests", type=int, default=int(os.environ.get("MAX_REQUESTS", "0")),
+                        help="워커가 이만큼 요청을 처리하면 교체 (0이면 사용 안 함)")
+    parser.add_argument("--max-requests-jitter", type=int, default=int(os.environ.get("MAX_REQUESTS_JITTER", "0")),
+                        help="워커들이 동시에 교체되지 않도록 요청 수 제한에 더할 무작위 값의 최대치")
+    parser.add_argument("--max-worker-memory", type=int, default=int(os.environ.get("MAX_WORKER_MEMORY_MB", "0")),
+                        help="워커 고유 메모리(MB)가 이를 넘으면 교체 (0이면 사용 안 함)")
+    parser.add_argument("--graceful-timeout", type=int, default=int(os.environ.get("GRACEFUL_TIMEOUT", "30")),
+                        help="종료 시 처리 중인 요청을 기다리는 시간(초)")
+    parser.add_argument("--reload-delay", type=float, default=1.0, help="SIGHUP 재시작 시 워커 교체 간격(초)")
+    parser.add_argument("--keep-alive", type=int, default=int(os.environ.get("KEEP_ALIVE", "5")), help="keep-alive 유지 시간(초)")
+    parser.add_argument("--forwarded-allow-ips", default=os.environ.get("FORWARDED_ALLOW_IPS", "127.0.0.1"),
+                        help="X-Forwarded-* 헤더를 신뢰할 프록시 IP")
+    parser.add_argument("--no-access-log", dest="access_log", action="store_false", help="요청별 접근 로그 끄기")
+    args = parser.parse_args(argv)
+
+    # 앱(app.core.config)을 불러오기 전에 풀/스레드 크기를 환경 변수로 정해 둬야 함
+    sizes = size_pools(args.workers)
+    os.environ.setdefault("CHANGE_POLL_INTERVAL", "2")
+    print(f"ℹ️ 워커당 DB 풀 {sizes['DB_POOL_SIZE']}+{sizes['DB_MAX_OVERFLOW']}, 스레드 {sizes['THREADPOOL_SIZE']}개", flush=True)
+    # 워커 메트릭 스냅샷 디렉터리 (직접 지정하지 않으면 임시 디렉터리를 만들고 종료 시 삭제)
+    temporary = "METRICS_DIR" not in os.environ
+    if temporary:
+        os.environ["METRICS_DIR"] = tempfile.mkdtemp(prefix="lionconnect-metrics-")
+    else:
+        from app.utils.metrics import clear_snapshots
+        os.makedirs(os.environ["METRICS_DIR"], exist_ok=True)
+        clear_snapshots(os.environ["METRICS_DIR"])
+    sock = bind_socket(args.host, args.port)
+    try:
+        return Arbiter(args, sock).run()
+    finally:
+        if temporary:
+            shutil.rmtree(os.environ["METRICS_DIR"], ignore_errors=True)
+
+if __name__ == "__main__":
+    sys.exit(main())
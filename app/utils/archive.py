@@ -0,0 +1,64 @@
+import zipfile
+from typing import Iterator, List
+
+CHUNK_SIZE = 64 * 1024  # 이미지 파일을 읽어 압축 파일에 쓰는 단위
+
+class _Sink:
+    """
+    zipfile이 쓰는 바이트를 모아 두었다가 꺼내 가는 쓰기 전용 스트림.
+    seek/tell이 없으므로 zipfile은 각 항목 뒤에 데이터 디스크립터를 붙이는 스트리밍 모드로 동작합니다.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+class ZipStream:
+    """
+    압축 파일을 메모리에 모으지 않고 항목 단위로 만들어 내보내는 ZIP 작성기.
+    add_bytes/add_file이 돌려주는 바이트 조각을 그대로 응답으로 흘려보내고, 마지막에 close()의 결과를 보냅니다.
+    """
+
+    def __init__(self):
+        self._sink = _Sink()
+        self._zip = zipfile.ZipFile(self._sink, mode="w")
+
+    def add_bytes(self, name: str, data: bytes, compress: bool = True) -> bytes:
+        """
+        메모리에 있는 데이터(JSON 등)를 항목으로 추가하고, 그만큼의 ZIP 바이트를 반환합니다.
+        """
+        compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        self._zip.writestr(name, data, compress_type=compression)
+        return self._sink.drain()
+
+    def add_file(self, name: str, path: str) -> Iterator[bytes]:
+        """
+        디스크의 파일을 CHUNK_SIZE씩 읽어 항목으로 추가하며 ZIP 바이트를 조각 단위로 내보냅니다.
+        이미지는 이미 압축된 형식이므로 다시 압축하지 않습니다(STORED).
+        """
+        with open(path, "rb") as source, self._zip.open(name, mode="w") as target:
+            while True:
+                chunk = source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                target.write(chunk)
+                yield self._sink.drain()
+        yield self._sink.drain()
+
+    def close(self) -> bytes:
+        """
+        중앙 디렉터리를 기록해 압축 파일을 마무리하고, 남은 ZIP 바이트를 반환합니다.
+        """
+        self._zip.close()
+        return self._sink.drain()
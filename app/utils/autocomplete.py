@@ -0,0 +1,193 @@
+import re
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+from app.models.user import StudentProfile
+from app.models.resume import ResumeBasicInfo
+from app.models.skill import StudentSkill, ProjectSkill
+from app.utils.changes import subscribe
+from app.utils.skills import SKILLS, SKILL_NAMES
+
+FIELDS = ("skill", "school", "major", "course")
+TOP_K = 10  # 노드마다 미리 계산해 두는 추천 개수
+# 기술 스택은 표준 이름으로 추천하되 별칭(한글 표기 등)으로 입력해도 찾도록 추가 키로 등록
+SKILL_ALIASES: Dict[str, List[str]] = {name: aliases for _, name, aliases in SKILLS}
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"]
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 입력 중인 겹자모(ㄳ, ㅘ 등)도 낱자로 풀어서 비교
+_COMPAT = {"ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+           "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"}
+# NFKC는 호환 자모(ㅇ)를 첫가끝 자모로 바꾸므로 쓰지 않고 공백/구두점만 제거
+_STRIP_RE = re.compile(r"[\s.\-_]")
+
+def decompose(value: str) -> str:
+    """
+    한글 음절을 자모 단위로 분해합니다. (예: "리액트" -> "ㄹㅣㅇㅐㄱㅌㅡ")
+    입력 중인 "리ㅇ", "리애" 같은 미완성 글자도 접두사로 일치하게 됩니다.
+    """
+    result = []
+    for char in _STRIP_RE.sub("", value.lower()):
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            result.append(_CHOSEONG[code // 588])
+            result.append(_JUNGSEONG[(code % 588) // 28])
+            result.append(_JONGSEONG[code % 28])
+        else:
+            result.append(_COMPAT.get(char, char))
+    return "".join(result)
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[Tuple[int, str]] = []  # (빈도, 값) 빈도 내림차순
+
+def _order(entry: Tuple[int, str]) -> Tuple[int, str]:
+    return -entry[0], entry[1]
+
+class PrefixTrie:
+    """
+    자모 분해 키로 만든 접두사 트라이.
+    각 노드가 하위 값 중 빈도 상위 TOP_K를 캐시하므로 조회는 접두사 길이만큼만 걷습니다.
+    aliases로 값마다 추가 검색 키(예: "React" -> "리액트")를 주면 어느 키로 입력해도 같은 값을 추천합니다.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None):
+        self.root = _Node()
+        self.counts: Dict[str, int] = {}
+        self.keys: Dict[str, List[str]] = {}
+        self.aliases = aliases or {}
+
+    def _keys(self, value: str) -> List[str]:
+        keys = self.keys.get(value)
+        if keys is None:
+            keys = list(dict.fromkeys(decompose(key) for key in [value] + self.aliases.get(value, [])))
+        return keys
+
+    def add(self, value: str, delta: int) -> None:
+        keys = self._keys(value)
+        count = max(self.counts.get(value, 0) + delta, 0)
+        if count:
+            self.counts[value] = count
+            self.keys[value] = keys
+        else:
+            self.counts.pop(value, None)
+            self.keys.pop(value, None)
+        for key in keys:
+            node = self.root
+            for depth in range(len(key) + 1):
+                if depth:
+                    node = node.children.setdefault(key[depth - 1], _Node())
+                entries = [entry for entry in node.top if entry[1] != value]
+                was_listed = len(entries) < len(node.top)
+                if count:
+                    entries.append((count, value))
+                entries.sort(key=_order)
+                if delta < 0 and was_listed and len(node.top) >= TOP_K:
+                    # 빈도가 줄어든 값이 상위 목록에 있었다면, 밖에 있던 값이 올라올 수 있으므로 다시 계산
+                    prefix = key[:depth]
+                    entries = sorted(
+                        ((c, v) for v, c in self.counts.items() if any(k.startswith(prefix) for k in self.keys[v])),
+                        key=_order,
+                    )
+                node.top = entries[:TOP_K]
+
+    def suggest(self, q: str, limit: int) -> List[Tuple[str, int]]:
+        node = self.root
+        for char in decompose(q):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [(value, count) for count, value in node.top[:limit]]
+
+class Autocomplete:
+    """
+    필드별(skill/school/major/course) 접두사 트라이를 관리합니다.
+    시작 시 DB에서 전체를 구축하고, 커밋된 변경은 다음 조회 때 해당 행만 다시 읽어 빈도를 조정합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tries: Dict[str, PrefixTrie] = self._new_tries()
+        # 출처(행)별로 기여한 값 목록 - 변경 시 이전 기여분을 빼기 위해 보관
+        self._sources: Dict[Tuple[str, int], List[Tuple[str, str]]] = {}
+        self._dirty: Dict[str, Set[int]] = {"student": set(), "resume": set(), "project": set()}
+        self._built = False
+
+    @staticmethod
+    def _new_tries() -> Dict[str, PrefixTrie]:
+        return {field: PrefixTrie(SKILL_ALIASES if field == "skill" else None) for field in FIELDS}
+
+    def on_change(self, changes: Dict[str, Set[int]]) -> None:
+        with self._lock:
+            for kind in self._dirty:
+                self._dirty[kind] |= changes.get(kind, set())
+
+    def _load(self, db: Session, kind: str, ids: Optional[Set[int]]) -> Dict[Tuple[str, int], List[Tuple[str, str]]]:
+        sources: Dict[Tuple[str, int], List[Tuple[str, str]]] = {}
+        if kind == "student":
+            profiles = db.query(StudentProfile.user_id, StudentProfile.course_name)
+            skills = db.query(StudentSkill.user_id, StudentSkill.skill_id)
+            if ids is not None:
+                profiles = profiles.filter(StudentProfile.user_id.in_(ids))
+                skills = skills.filter(StudentSkill.user_id.in_(ids))
+            for user_id, course_name in profiles:
+                sources.setdefault((kind, user_id), []).append(("course", course_name.strip()))
+            for user_id, skill_id in skills:
+                sources.setdefault((kind, user_id), []).append(("skill", SKILL_NAMES[skill_id]))
+        elif kind == "resume":
+            resumes = db.query(ResumeBasicInfo.id, ResumeBasicInfo.school, ResumeBasicInfo.major)
+            if ids is not None:
+                resumes = resumes.filter(ResumeBasicInfo.id.in_(ids))
+            for resume_id, school, major in resumes:
+                sources[(kind, resume_id)] = [("school", school.strip()), ("major", major.strip())]
+        else:
+            skills = db.query(ProjectSkill.project_id, ProjectSkill.skill_id)
+            if ids is not None:
+                skills = skills.filter(ProjectSkill.project_id.in_(ids))
+            for project_id, skill_id in skills:
+                sources.setdefault((kind, project_id), []).append(("skill", SKILL_NAMES[skill_id]))
+        return sources
+
+    def _apply(self, key: Tuple[str, int], values: List[Tuple[str, str]]) -> None:
+        for field, value in self._sources.pop(key, []):
+            self._tries[field].add(value, -1)
+        values = [(field, value) for field, value in values if value]
+        for field, value in values:
+            self._tries[field].add(value, 1)
+        if values:
+            self._sources[key] = values
+
+    def build(self, db: Session) -> None:
+        """
+        DB 전체에서 트라이를 새로 구축합니다. (앱 시작 시 호출)
+        """
+        with self._lock:
+            self._tries = self._new_tries()
+            self._sources = {}
+            for kind in self._dirty:
+                self._dirty[kind].clear()
+                for key, values in self._load(db, kind, None).items():
+                    self._apply(key, values)
+            self._built = True
+
+    def suggest(self, db: Session, field: str, q: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        접두사 q로 시작하는 값을 빈도 순으로 반환합니다. [(값, 빈도), ...]
+        """
+        if not self._built:
+            self.build(db)
+        with self._lock:
+            for kind, ids in self._dirty.items():
+                if ids:
+                    loaded = self._load(db, kind, ids)
+                    for source_id in ids:
+                        self._apply((kind, source_id), loaded.get((kind, source_id), []))
+                    ids.clear()
+            return self._tries[field].suggest(q, limit)
+
+autocomplete = Autocomplete()
+subscribe(autocomplete.on_change)
@@ -0,0 +1,446 @@
+import hashlib
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Union
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.config import BITMAP_SNAPSHOT_PATH
+from app.models.user import StudentProfile
+from app.models.portfolio import Portfolio
+from app.models.skill import StudentSkill
+from app.utils.changes import subscribe
+from app.utils.skills import resolve_skill
+
+ARRAY_LIMIT = 4096  # 이 개수를 넘으면 배열 컨테이너를 비트맵 컨테이너로 변환
+SNAPSHOT_VERSION = 2
+
+try:
+    import fcntl  # 스냅샷 저장 잠금 (리눅스/맥)
+except ImportError:
+    fcntl = None
+
+Container = Union[array, int]  # 정렬된 uint16 배열 또는 65536비트 정수
+
+def _to_int(container: Container) -> int:
+    if isinstance(container, int):
+        return container
+    bits = np.zeros(65536, dtype=bool)
+    bits[np.frombuffer(container, dtype=np.uint16)] = True
+    return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+
+def _positions(bits: int) -> np.ndarray:
+    data = np.frombuffer(bits.to_bytes(8192, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder="little")).astype(np.uint16)
+
+def _np(container: array) -> np.ndarray:
+    return np.frombuffer(container, dtype=np.uint16)
+
+def _array(values: np.ndarray) -> Optional[array]:
+    return array("H", values.astype(np.uint16).tobytes()) if len(values) else None
+
+def _iter_int(bits: int) -> Iterator[int]:
+    return iter(_positions(bits).tolist())
+
+def _normalize(bits: int) -> Optional[Container]:
+    count = bits.bit_count()
+    if count == 0:
+        return None
+    if count <= ARRAY_LIMIT:
+        return array("H", _positions(bits).tobytes())
+    return bits
+
+def _cardinality(container: Container) -> int:
+    return container.bit_count() if isinstance(container, int) else len(container)
+
+class RoaringBitmap:
+    """
+    Roaring 방식의 압축 비트맵.
+    정수를 상위 16비트로 나눈 청크마다, 원소가 적으면 정렬된 uint16 배열,
+    많으면 65536비트 정수(비트셋) 컨테이너에 저장합니다.
+    """
+    __slots__ = ("containers",)
+
+    def __init__(self, values: Iterable[int] = ()):
+        self.containers: Dict[int, Container] = {}
+        for value in values:
+            self.add(value)
+
+    def add(self, value: int) -> None:
+        high, low = value >> 16, value & 0xFFFF
+        container = self.containers.get(high)
+        if container is None:
+            self.containers[high] = array("H", [low])
+        elif isinstance(container, int):
+            self.containers[high] = container | (1 << low)
+        else:
+            index = bisect_left(container, low)
+            if index < len(container) and container[index] == low:
+                return
+            container.insert(index, low)
+            if len(container) > ARRAY_LIMIT:
+                self.containers[high] = _to_int(container)
+
+    def discard(self, value: int) -> None:
+        high, low = value >> 16, value & 0xFFFF
+        container = self.containers.get(high)
+        if container is None:
+            return
+        if isinstance(container, int):
+            normalized = _normalize(container & ~(1 << low))
+        else:
+            index = bisect_left(container, low)
+            if index < len(container) and container[index] == low:
+                del container[index]
+            normalized = container if len(container) else None
+        if normalized is None:
+            del self.containers[high]
+        else:
+            self.containers[high] = normalized
+
+    def __contains__(self, value: int) -> bool:
+        container = self.containers.get(value >> 16)
+        if container is None:
+            return False
+        low = value & 0xFFFF
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        index = bisect_left(container, low)
+        return index < len(container) and container[index] == low
+
+    def __and__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        result = RoaringBitmap()
+        for high in self.containers.keys() & other.containers.keys():
+            a, b = self.containers[high], other.containers[high]
+            if isinstance(a, int) and isinstance(b, int):
+                merged = _normalize(a & b)
+            elif isinstance(a, int) or isinstance(b, int):
+                merged = _normalize(_to_int(a) & _to_int(b))
+            else:
+                merged = _array(np.intersect1d(_np(a), _np(b), assume_unique=True))
+            if merged is not None:
+                result.containers[high] = merged
+        return result
+
+    def __or__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        result = RoaringBitmap()
+        for high in self.containers.keys() | other.containers.keys():
+            a, b = self.containers.get(high), other.containers.get(high)
+            if a is None or b is None:
+                merged = a if b is None else b
+                merged = merged if isinstance(merged, int) else array("H", merged)
+            elif isinstance(a, int) or isinstance(b, int) or len(a) + len(b) > ARRAY_LIMIT:
+                merged = _normalize(_to_int(a) | _to_int(b))
+            else:
+                merged = _array(np.union1d(_np(a), _np(b)))
+            result.containers[high] = merged
+        return result
+
+    def __sub__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        result = RoaringBitmap()
+        for high, a in self.containers.items():
+            b = other.containers.get(high)
+            if b is None:
+                merged = a if isinstance(a, int) else array("H", a)
+            elif isinstance(a, int):
+                merged = _normalize(a & ~_to_int(b))
+            elif isinstance(b, int):
+                merged = _normalize(_to_int(a) & ~b)
+            else:
+                merged = _array(np.setdiff1d(_np(a), _np(b), assume_unique=True))
+            if merged is not None:
+                result.containers[high] = merged
+        return result
+
+    def __len__(self) -> int:
+        return sum(_cardinality(container) for container in self.containers.values())
+
+    def __iter__(self) -> Iterator[int]:
+        for high in sorted(self.containers):
+            container = self.containers[high]
+            base = high << 16
+            values = _iter_int(container) if isinstance(container, int) else container
+            for low in values:
+                yield base + low
+
+    @classmethod
+    def from_sorted(cls, values: np.ndarray) -> "RoaringBitmap":
+        """
+        정렬된 중복 없는 정수 배열로 한 번에 만듭니다. (스냅샷 복원용)
+        """
+        result = cls()
+        values = values.astype(np.int64)
+        highs = values >> 16
+        bounds = np.flatnonzero(np.diff(highs)) + 1
+        for chunk in np.split(values, bounds):
+            if len(chunk):
+                container = array("H", (chunk & 0xFFFF).astype(np.uint16).tobytes())
+                result.containers[int(chunk[0] >> 16)] = _to_int(container) if len(container) > ARRAY_LIMIT else container
+        return result
+
+# ====== 불리언 필터 식 파서 ======
+# 예: (skill:React OR skill:Vue) AND skill:TypeScript AND gen:12기 AND rep
+_TOKEN_RE = re.compile(r'\s*(\(|\)|[^\s()"]*"[^"]*"|[^\s()]+)')
+
+class FilterSyntaxError(ValueError):
+    pass
+
+def _term_key(term: str) -> str:
+    if term.lower() in ("rep", "representative"):
+        return "rep"
+    field, sep, value = term.partition(":")
+    field = field.lower()
+    value = value.strip('"').strip()
+    if not sep or not value:
+        raise FilterSyntaxError(f"잘못된 조건입니다: {term}")
+    if field == "skill":
+        skill_id = resolve_skill(value)
+        return f"skill:{skill_id}" if skill_id is not None else f"skill:?{value}"
+    if field in ("course", "gen"):
+        return f"{field}:{value}"
+    raise FilterSyntaxError(f"지원하지 않는 필드입니다: {field} (skill, course, gen, rep 사용 가능)")
+
+class _Parser:
+    def __init__(self, index: "BitmapIndex", expression: str):
+        self.index = index
+        self.tokens = _TOKEN_RE.findall(expression)
+        self.position = 0
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise FilterSyntaxError("식이 예상보다 일찍 끝났습니다.")
+        self.position += 1
+        return token
+
+    def parse(self) -> RoaringBitmap:
+        result = self._or()
+        if self._peek() is not None:
+            raise FilterSyntaxError(f"예상하지 못한 토큰입니다: {self._peek()}")
+        return result
+
+    def _or(self) -> RoaringBitmap:
+        result = self._and()
+        while (self._peek() or "").upper() == "OR":
+            self._next()
+            result = result | self._and()
+        return result
+
+    def _and(self) -> RoaringBitmap:
+        result = self._not()
+        while self._peek() is not None and self._peek() != ")" and self._peek().upper() != "OR":
+            if self._peek().upper() == "AND":
+                self._next()
+            result = result & self._not()
+        return result
+
+    def _not(self) -> RoaringBitmap:
+        token = self._peek()
+        if token is not None and token.upper() == "NOT":
+            self._next()
+            return self.index.bitmap("all") - self._not()
+        if token == "(":
+            self._next()
+            result = self._or()
+            if self._next() != ")":
+                raise FilterSyntaxError("괄호가 닫히지 않았습니다.")
+            return result
+        return self.index.bitmap(_term_key(self._next()))
+
+class BitmapIndex:
+    """
+    포트폴리오 ID를 원소로 하는 비트맵 역색인.
+    - `skill:<스킬 ID>`: 학생 기술 스택 (표준 스킬 ID)
+    - `course:<과정명>`, `gen:<기수>`: 학생 프로필
+    - `rep`: 대표 포트폴리오
+    - `all`: 전체 포트폴리오 (NOT 연산용)
+    시작 시 스냅샷 파일에서 읽고, 커밋된 변경은 다음 조회 때 해당 학생의 포트폴리오만 다시 색인합니다.
+    """
+
+    def __init__(self, snapshot_path: str = BITMAP_SNAPSHOT_PATH):
+        self.snapshot_path = snapshot_path
+        self._lock = threading.Lock()
+        self._bitmaps: Dict[str, RoaringBitmap] = {}
+        self._keys_of: Dict[int, List[str]] = {}          # 포트폴리오별 소속 키 (갱신 시 제거용)
+        self._portfolios_of: Dict[int, Set[int]] = {}     # 학생(resume_id)별 포트폴리오
+        self._dirty_students: Set[int] = set()
+        self._built = False
+
+    def on_change(self, changes: Dict[str, Set[int]]) -> None:
+        with self._lock:
+            self._dirty_students |= changes.get("student", set()) | changes.get("resume", set())
+
+    def bitmap(self, key: str) -> RoaringBitmap:
+        return self._bitmaps.get(key) or RoaringBitmap()
+
+    def signature(self, db: Session) -> str:
+        """
+        색인의 입력 전체(포트폴리오, 학생 과정/기수, 스킬) 체크섬. 스냅샷이 현재 DB와 맞는지 확인합니다.
+        개수나 최대 ID가 그대로인 수정(과정명 변경, 같은 수의 스킬 교체 등)도 감지합니다.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for query in (
+            select(Portfolio.id, Portfolio.resume_id, Portfolio.is_representative).order_by(Portfolio.id),
+            select(StudentProfile.user_id, StudentProfile.course_name, StudentProfile.course_generation).order_by(StudentProfile.user_id),
+            select(StudentSkill.user_id, StudentSkill.skill_id).order_by(StudentSkill.user_id, StudentSkill.skill_id),
+        ):
+            for rows in db.execute(query).tuples().partitions(10000):
+                digest.update(repr(rows).encode())
+            digest.update(b"|")
+        return digest.hexdigest()
+
+    def _index(self, portfolio_id: int, keys: List[str]) -> None:
+        for key in self._keys_of.pop(portfolio_id, []):
+            bitmap = self._bitmaps.get(key)
+            if bitmap is not None:
+                bitmap.discard(portfolio_id)
+                if not bitmap.containers:
+                    del self._bitmaps[key]
+        if keys:
+            for key in keys:
+                self._bitmaps.setdefault(key, RoaringBitmap()).add(portfolio_id)
+            self._keys_of[portfolio_id] = keys
+
+    def _load(self, db: Session, student_ids: Optional[Set[int]]) -> None:
+        portfolios = db.query(Portfolio.id, Portfolio.resume_id, Portfolio.is_representative)
+        profiles = db.query(StudentProfile.user_id, StudentProfile.course_name, StudentProfile.course_generation)
+        skills = db.query(StudentSkill.user_id, StudentSkill.skill_id)
+        if student_ids is not None:
+            portfolios = portfolios.filter(Portfolio.resume_id.in_(student_ids))
+            profiles = profiles.filter(StudentProfile.user_id.in_(student_ids))
+            skills = skills.filter(StudentSkill.user_id.in_(student_ids))
+        student_keys: Dict[int, List[str]] = {}
+        for user_id, course_name, course_generation in profiles:
+            student_keys[user_id] = [f"course:{course_name}", f"gen:{course_generation}"]
+        for user_id, skill_id in skills:
+            if user_id in student_keys:
+                student_keys[user_id].append(f"skill:{skill_id}")
+
+        seen: Dict[int, Set[int]] = {user_id: set() for user_id in (student_ids or ())}
+        for portfolio_id, resume_id, is_representative in portfolios:
+            # 인재 탐색과 동일하게 portfolio.resume_id를 학생 user_id로 취급
+            keys = ["all"] + student_keys.get(resume_id, [])
+            if is_representative:
+                keys.append("rep")
+            self._index(portfolio_id, keys)
+            seen.setdefault(resume_id, set()).add(portfolio_id)
+        for resume_id, current in seen.items():
+            for removed in self._portfolios_of.get(resume_id, set()) - current:
+                self._index(removed, [])
+            if current:
+                self._portfolios_of[resume_id] = current
+            else:
+                self._portfolios_of.pop(resume_id, None)
+
+    def build(self, db: Session) -> None:
+        """
+        스냅샷이 최신이면 불러오고, 아니면 DB 전체로 다시 구축한 뒤 스냅샷을 저장합니다.
+        """
+        with self._lock:
+            signature = self.signature(db)
+            if not self._restore(signature):
+                self._bitmaps, self._keys_of, self._portfolios_of = {}, {}, {}
+                self._load(db, None)
+                self._dirty_students.clear()
+                self._save(signature)
+            self._built = True
+
+    # 스냅샷 형식: 실행 코드가 없는 numpy 배열 묶음(npz, allow_pickle=False)
+    # - keys: 키 문자열 목록, member_key/member_portfolio: (키 번호, 포트폴리오 ID) 쌍
+    # - owner_resume/owner_portfolio: (학생 resume_id, 포트폴리오 ID) 쌍
+
+    def _restore(self, signature: str) -> bool:
+        if not os.path.exists(self.snapshot_path):
+            return False
+        try:
+            with np.load(self.snapshot_path, allow_pickle=False) as snapshot:
+                if int(snapshot["version"]) != SNAPSHOT_VERSION or str(snapshot["signature"]) != signature:
+                    return False
+                keys = snapshot["keys"].tolist()
+                member_key, member_portfolio = snapshot["member_key"], snapshot["member_portfolio"]
+                owner_resume, owner_portfolio = snapshot["owner_resume"], snapshot["owner_portfolio"]
+        except (OSError, ValueError, KeyError):
+            return False
+        order = np.lexsort((member_portfolio, member_key))
+        member_key, member_portfolio = member_key[order], member_portfolio[order]
+        bounds = np.searchsorted(member_key, np.arange(len(keys) + 1))
+        bitmaps: Dict[str, RoaringBitmap] = {}
+        for index, key in enumerate(keys):
+            if bounds[index] < bounds[index + 1]:
+                bitmaps[key] = RoaringBitmap.from_sorted(member_portfolio[bounds[index]:bounds[index + 1]])
+        keys_of: Dict[int, List[str]] = {}
+        for key_index, portfolio_id in zip(member_key.tolist(), member_portfolio.tolist()):
+            keys_of.setdefault(portfolio_id, []).append(keys[key_index])
+        portfolios_of: Dict[int, Set[int]] = {}
+        for resume_id, portfolio_id in zip(owner_resume.tolist(), owner_portfolio.tolist()):
+            portfolios_of.setdefault(resume_id, set()).add(portfolio_id)
+        self._bitmaps, self._keys_of, self._portfolios_of = bitmaps, keys_of, portfolios_of
+        return True
+
+    def _save(self, signature: str) -> None:
+        keys = sorted({key for keys in self._keys_of.values() for key in keys})
+        numbers = {key: index for index, key in enumerate(keys)}
+        pairs = [(numbers[key], portfolio_id) for portfolio_id, keys_of in self._keys_of.items() for key in keys_of]
+        owners = [(resume_id, portfolio_id) for resume_id, portfolio_ids in self._portfolios_of.items() for portfolio_id in portfolio_ids]
+        # 여러 워커가 동시에 종료하며 저장해도 임시 파일이 겹치지 않도록 프로세스별 이름 사용
+        temp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                version=np.array(SNAPSHOT_VERSION),
+                signature=np.array(signature),
+                keys=np.array(keys, dtype=str),
+                member_key=np.array([k for k, _ in pairs], dtype=np.int32),
+                member_portfolio=np.array([p for _, p in pairs], dtype=np.int64),
+                owner_resume=np.array([r for r, _ in owners], dtype=np.int64),
+                owner_portfolio=np.array([p for _, p in owners], dtype=np.int64),
+            )
+        os.replace(temp_path, self.snapshot_path)
+
+    def save_snapshot(self, db: Session, sync: Optional[Callable[[], None]] = None) -> None:
+        """
+        현재 색인을 스냅샷 파일로 저장합니다. (앱 종료 시 호출)
+        체크섬을 먼저 구한 뒤 다른 프로세스의 변경을 받아(sync) 반영하고 저장하므로,
+        체크섬 이전의 커밋은 모두 색인에 들어 있고 이후의 커밋은 체크섬이 달라져 다음 시작 때 다시 구축됩니다.
+        여러 워커가 함께 종료할 때는 잠금을 먼저 얻은 한 프로세스만 저장합니다.
+        """
+        if not self._built:
+            return
+        with open(f"{self.snapshot_path}.lock", "a") as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return
+            signature = self.signature(db)
+            # 잠금(self._lock) 밖에서 호출: 전달된 변경은 on_change에서 같은 잠금을 잡음
+            if sync is not None:
+                sync()
+            with self._lock:
+                self._apply_changes(db)
+                self._save(signature)
+
+    def _apply_changes(self, db: Session) -> None:
+        if self._dirty_students:
+            self._load(db, set(self._dirty_students))
+            self._dirty_students.clear()
+
+    def evaluate(self, db: Session, expression: str) -> RoaringBitmap:
+        """
+        불리언 필터 식을 평가해 조건을 만족하는 포트폴리오 ID 비트맵을 반환합니다.
+        """
+        if not self._built:
+            self.build(db)
+        with self._lock:
+            self._apply_changes(db)
+            # 내부 비트맵이 이후 갱신되어도 결과가 바뀌지 않도록 복사본 반환
+            return RoaringBitmap() | _Parser(self, expression).parse()
+
+bitmap_index = BitmapIndex()
+subscribe(bitmap_index.on_change)
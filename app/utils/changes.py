@@ -0,0 +1,161 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Set
+from sqlalchemy import delete, event, func, insert, or_
+from sqlalchemy.orm import Session
+from app.core.config import SessionLocal, CHANGE_POLL_INTERVAL
+from app.models.change_log import Base as ChangeLogBase, ChangeLog
+
+logger = logging.getLogger(__name__)
+
+# 여러 워커 프로세스(app/server.py)에서는 after_commit 콜백이 커밋한 프로세스에서만 불리므로,
+# CHANGE_POLL_INTERVAL이 설정되면 커밋할 때 변경 사항을 change_log 테이블에도 남기고
+# 각 워커의 ChangePoller가 다른 프로세스의 기록을 읽어 remote 콜백에 전달합니다.
+CHANGE_LOG_RETENTION = timedelta(minutes=10)  # 이보다 오래된 기록은 삭제
+PRUNE_EVERY = 100                              # 조회 몇 번마다 오래된 기록을 지울지
+GAP_TIMEOUT = 60.0                             # 건너뛴 ID(아직 커밋 전인 트랜잭션)를 다시 확인하는 시간(초)
+
+Listener = Callable[[Dict[str, Set[int]]], None]
+
+# 커밋된 변경 사항을 전달받을 콜백 목록 (인메모리 인덱스 갱신용)
+_listeners: List[Listener] = []
+# 그중 다른 프로세스의 변경도 전달받을 콜백
+_remote_listeners: List[Listener] = []
+
+_HOST = socket.gethostname()
+
+def _origin() -> str:
+    # preload 후 fork된 워커마다 달라야 하므로 호출할 때 pid를 읽음
+    return f"{_HOST}:{os.getpid()}"
+
+def subscribe(callback: Listener, remote: bool = True) -> None:
+    """
+    커밋이 완료된 변경 사항을 전달받을 콜백을 등록합니다.
+    콜백은 {"student": {...}, "resume": {...}, "portfolio": {...}, "project": {...}} 형태의 dict를 받습니다.
+    remote=True면 다른 워커 프로세스에서 커밋된 변경도 CHANGE_POLL_INTERVAL 안에 전달됩니다.
+    결과를 DB에 쓰는 작업처럼 커밋한 프로세스 한 곳에서만 처리하면 되는 콜백은 False로 등록합니다.
+    """
+    if callback not in _listeners:
+        _listeners.append(callback)
+    if remote and callback not in _remote_listeners:
+        _remote_listeners.append(callback)
+
+def ensure_change_log_table(bind) -> None:
+    """
+    변경 기록 테이블(change_log)을 생성합니다. (이미 있으면 무시)
+    """
+    ChangeLogBase.metadata.create_all(bind=bind)
+
+def record_change(db: Session, kind: str, ids: Iterable[int]) -> None:
+    """
+    현재 트랜잭션에서 변경된 엔티티를 기록합니다.
+    - `student`: 학생 user_id
+    - `resume`: 이력서 ID (포트폴리오의 resume_id)
+    - `portfolio`: 포트폴리오 ID (프로젝트의 portfolio_id)
+    - `project`: 프로젝트 ID
+    커밋되면 등록된 콜백으로 전달되고, 롤백되면 버려집니다.
+    """
+    pending = db.info.setdefault("changes", {})
+    pending.setdefault(kind, set()).update(i for i in ids if i is not None)
+
+def _notify(listeners: List[Listener], changes: Dict[str, Set[int]]) -> None:
+    for callback in listeners:
+        try:
+            callback(changes)
+        except Exception as e:
+            # 인덱스 갱신 실패가 요청 자체를 실패시키지 않도록 로그만 남김
+            logger.error(f"변경 사항 전달 중 오류: {str(e)}")
+
+@event.listens_for(SessionLocal, "before_commit")
+def _log_changes(session: Session) -> None:
+    # 같은 트랜잭션으로 기록하므로 롤백되면 기록도 남지 않음
+    changes = session.info.get("changes")
+    if not CHANGE_POLL_INTERVAL or not changes:
+        return
+    payload = json.dumps({kind: sorted(ids) for kind, ids in changes.items()})
+    session.execute(insert(ChangeLog).values(origin=_origin(), changes=payload, created_at=datetime.utcnow()))
+
+@event.listens_for(SessionLocal, "after_commit")
+def _dispatch_changes(session: Session) -> None:
+    changes = session.info.pop("changes", None)
+    if changes:
+        _notify(_listeners, changes)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop("changes", None)
+
+class ChangePoller:
+    """
+    다른 프로세스가 change_log에 남긴 변경 사항을 interval마다 읽어 remote 콜백에 전달하는 스레드.
+    PostgreSQL은 ID 순서와 커밋 순서가 다를 수 있으므로, 건너뛴 ID는 GAP_TIMEOUT 동안 다시 확인합니다.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.last_id = 0
+        self._gaps: Dict[int, float] = {}  # 아직 보지 못한 ID -> 처음 건너뛴 시각
+        self._polls = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="change-poller", daemon=True)
+
+    def start(self) -> None:
+        # 인덱스를 구축하기 전에 시작 위치를 정해야 구축 중에 커밋된 변경을 놓치지 않음
+        db = SessionLocal()
+        try:
+            self.last_id = db.query(func.max(ChangeLog.id)).scalar() or 0
+        finally:
+            db.close()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        # 마지막 조회 이후의 변경까지 받아 두고 종료 (종료 시 저장하는 색인 스냅샷이 뒤처지지 않도록)
+        try:
+            self.poll()
+        except Exception as e:
+            logger.error(f"변경 사항 조회 중 오류: {str(e)}")
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"변경 사항 조회 중 오류: {str(e)}")
+
+    def poll(self) -> None:
+        now = time.monotonic()
+        self._gaps = {change_id: seen for change_id, seen in self._gaps.items() if now - seen < GAP_TIMEOUT}
+        condition = ChangeLog.id > self.last_id
+        if self._gaps:
+            condition = or_(condition, ChangeLog.id.in_(self._gaps))
+        db = SessionLocal()
+        try:
+            rows = db.query(ChangeLog.id, ChangeLog.origin, ChangeLog.changes).filter(condition).order_by(ChangeLog.id).all()
+            self._polls += 1
+            if self._polls % PRUNE_EVERY == 0:
+                db.execute(delete(ChangeLog).where(ChangeLog.created_at < datetime.utcnow() - CHANGE_LOG_RETENTION))
+                db.commit()
+        finally:
+            db.close()
+        origin = _origin()
+        merged: Dict[str, Set[int]] = {}
+        for change_id, change_origin, payload in rows:
+            self._gaps.pop(change_id, None)
+            if change_id > self.last_id:
+                for skipped in range(self.last_id + 1, change_id):
+                    self._gaps[skipped] = now
+                self.last_id = change_id
+            # 이 프로세스의 변경은 커밋할 때 이미 전달됨
+            if change_origin == origin:
+                continue
+            for kind, ids in json.loads(payload).items():
+                merged.setdefault(kind, set()).update(ids)
+        if merged:
+            _notify(_remote_listeners, merged)
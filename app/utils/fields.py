@@ -0,0 +1,44 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+# fields 파라미터 문법: "resume(name,job_type),portfolios(id,project_name),awards"
+# - 섹션(필드1,필드2,...) : 해당 섹션에서 지정한 필드만
+# - 섹션                  : 해당 섹션의 모든 필드
+_SECTION_RE = re.compile(r"\s*([a-z_]+)\s*(?:\(([^()]*)\))?\s*(,|$)")
+
+def _names(value: str) -> List[str]:
+    return list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+
+def parse_field_list(spec: str, allowed: Iterable[str]) -> List[str]:
+    """
+    쉼표로 구분한 필드 목록을 검증해 반환합니다. (예: "portfolio_id,project_name")
+    알 수 없는 필드가 있으면 ValueError를 발생시킵니다.
+    """
+    allowed = list(allowed)
+    names = _names(spec)
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)} (사용 가능: {', '.join(allowed)})")
+    if not names:
+        raise ValueError("fields에 하나 이상의 필드를 지정해야 합니다.")
+    return names
+
+def parse_sections(spec: str, allowed: Dict[str, Iterable[str]]) -> Dict[str, Optional[List[str]]]:
+    """
+    섹션별 필드 지정을 파싱합니다. {섹션: 필드 목록 또는 None(전체)}
+    지정하지 않은 섹션은 결과에 포함되지 않으며, 문법 오류나 알 수 없는 섹션/필드는 ValueError를 발생시킵니다.
+    """
+    sections: Dict[str, Optional[List[str]]] = {}
+    position = 0
+    while position < len(spec):
+        match = _SECTION_RE.match(spec, position)
+        if not match or match.end() == position:
+            raise ValueError(f"fields 형식이 올바르지 않습니다: {spec[position:]!r}")
+        section, names, _ = match.groups()
+        if section not in allowed:
+            raise ValueError(f"알 수 없는 섹션입니다: {section} (사용 가능: {', '.join(allowed)})")
+        sections[section] = None if names is None else parse_field_list(names, allowed[section])
+        position = match.end()
+    if not sections:
+        raise ValueError("fields에 하나 이상의 섹션을 지정해야 합니다.")
+    return sections
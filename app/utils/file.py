@@ -1,6 +1,8 @@
 import os
+from typing import Optional
 from fastapi import UploadFile, HTTPException
 from uuid import uuid4
+from app.utils.metrics import UPLOAD_BYTES
 
 PROFILE_DIR = "app/media/profile"
 
@@ -31,10 +33,34 @@ def save_profile_image(file: UploadFile) -> str:
         
         with open(file_path, "wb") as f:
             f.write(file.file.read())
+        UPLOAD_BYTES.inc(file_size)
         
         return f"/media/profile/{filename}"
     
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"파일 업로드 중 오류가 발생했습니다: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"파일 업로드 중 오류가 발생했습니다: {str(e)}") 
+
+MEDIA_ROOT = "app/media"
+
+def media_path(url: Optional[str]) -> Optional[str]:
+    """
+    "/media/..." 형식의 이미지 URL을 디스크 경로로 바꿉니다.
+    media 디렉토리 밖을 가리키거나 파일이 없으면 None을 반환합니다.
+    """
+    if not url or not url.startswith("/media/"):
+        return None
+    root = os.path.realpath(MEDIA_ROOT)
+    path = os.path.realpath(os.path.join(root, url[len("/media/"):]))
+    if not path.startswith(root + os.sep) or not os.path.isfile(path):
+        return None
+    return path
+
+def delete_media(url: Optional[str]) -> None:
+    """
+    저장한 이미지 파일을 지웁니다. (DB 반영에 실패해 참조하는 행이 없을 때 정리용)
+    """
+    path = media_path(url)
+    if path:
+        os.remove(path)
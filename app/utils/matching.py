@@ -0,0 +1,183 @@
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+from scipy import sparse
+from sqlalchemy.orm import Session
+from app.models.user import StudentProfile
+from app.models.portfolio import Portfolio
+from app.models.project import Project
+from app.utils.changes import subscribe
+from app.utils.search import tokenize
+
+N_FEATURES = 2 ** 18        # 해시 피처 공간 크기
+STACK_WEIGHT = 2            # 기술 스택 토큰 가중치 (본문 대비)
+COMPACT_THRESHOLD = 1000    # 변경된 행이 이만큼 쌓이면 행렬을 다시 조립
+MAX_AGE_SECONDS = 600       # 다른 워커의 변경 반영을 위한 전체 재구축 주기
+
+def _features(weighted_texts: List[Tuple[Optional[str], int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    텍스트를 해시 피처 (인덱스, 가중치) 벡터로 변환합니다.
+    가중치는 sublinear TF(1 + log tf) 후 L2 정규화합니다.
+    """
+    counts: Dict[int, float] = {}
+    for value, weight in weighted_texts:
+        for token in tokenize(value):
+            index = zlib.crc32(token.encode("utf-8")) & (N_FEATURES - 1)
+            counts[index] = counts.get(index, 0) + weight
+    if not counts:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    indices = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+    values = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+    values /= np.linalg.norm(values)
+    order = np.argsort(indices)
+    return indices[order], values[order].astype(np.float32)
+
+def _to_csr(rows: List[Tuple[np.ndarray, np.ndarray]]) -> sparse.csr_matrix:
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    if rows:
+        indptr[1:] = np.cumsum([len(indices) for indices, _ in rows])
+        indices = np.concatenate([indices for indices, _ in rows])
+        data = np.concatenate([values for _, values in rows])
+    else:
+        indices = np.empty(0, dtype=np.int32)
+        data = np.empty(0, dtype=np.float32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), N_FEATURES))
+
+class TalentMatcher:
+    """
+    학생별 (기술 스택 + 포트폴리오 + 프로젝트) 문서를 해시 피처 희소 행렬로 유지하고,
+    직무 설명과의 내적으로 상위 K명을 찾습니다.
+
+    쓰기 경로에서 기록된 변경 사항(app.utils.changes)은 다음 조회 시 해당 학생만
+    다시 벡터화하며, 변경된 행은 행렬을 재조립하지 않고 별도의 델타 행으로 관리합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._ids = np.empty(0, dtype=np.int64)
+        self._matrix = _to_csr([])
+        self._stale = np.zeros(0, dtype=bool)          # 델타로 대체된 행렬 행
+        self._row_of: Dict[int, int] = {}
+        self._features: Dict[int, np.ndarray] = {}     # 학생별 피처 인덱스 (DF 갱신용)
+        self._delta: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._df = np.zeros(N_FEATURES, dtype=np.int32)
+        self._dirty_students: Set[int] = set()
+        self._dirty_portfolios: Set[int] = set()
+
+    def on_change(self, changes: Dict[str, Set[int]]) -> None:
+        with self._lock:
+            self._dirty_students |= changes.get("student", set()) | changes.get("resume", set())
+            self._dirty_portfolios |= changes.get("portfolio", set())
+
+    def _load_documents(self, db: Session, user_ids: Optional[Set[int]] = None) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        profiles = db.query(StudentProfile.user_id, StudentProfile.tech_stack)
+        portfolios = db.query(Portfolio.id, Portfolio.resume_id, Portfolio.project_name, Portfolio.project_intro, Portfolio.role)
+        if user_ids is not None:
+            profiles = profiles.filter(StudentProfile.user_id.in_(user_ids))
+            portfolios = portfolios.filter(Portfolio.resume_id.in_(user_ids))
+        texts: Dict[int, List[Tuple[Optional[str], int]]] = {}
+        for user_id, tech_stack in profiles:
+            texts[user_id] = [(tech_stack, STACK_WEIGHT)]
+        owner: Dict[int, int] = {}
+        for portfolio_id, resume_id, name, intro, role in portfolios:
+            # 인재 탐색과 동일하게 portfolio.resume_id를 학생 user_id로 취급
+            if resume_id in texts:
+                owner[portfolio_id] = resume_id
+                texts[resume_id].extend([(name, 1), (intro, 1), (role, 1)])
+        if owner:
+            projects = db.query(Project.portfolio_id, Project.project_name, Project.project_intro, Project.description, Project.tech_stack)
+            if user_ids is not None:
+                projects = projects.filter(Project.portfolio_id.in_(owner.keys()))
+            for portfolio_id, name, intro, description, tech_stack in projects:
+                if portfolio_id in owner:
+                    texts[owner[portfolio_id]].extend([(name, 1), (intro, 1), (description, 1), (tech_stack, STACK_WEIGHT)])
+        return {user_id: _features(weighted) for user_id, weighted in texts.items()}
+
+    def _rebuild(self, db: Session) -> None:
+        documents = self._load_documents(db)
+        self._ids = np.fromiter(documents.keys(), dtype=np.int64, count=len(documents))
+        self._matrix = _to_csr(list(documents.values()))
+        self._stale = np.zeros(len(documents), dtype=bool)
+        self._row_of = {user_id: row for row, user_id in enumerate(documents)}
+        self._features = {user_id: indices for user_id, (indices, _) in documents.items()}
+        self._delta = {}
+        self._df = np.zeros(N_FEATURES, dtype=np.int32)
+        np.add.at(self._df, self._matrix.indices, 1)
+        self._dirty_students.clear()
+        self._dirty_portfolios.clear()
+        self._loaded_at = time.monotonic()
+
+    def _refresh(self, db: Session) -> None:
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > MAX_AGE_SECONDS:
+            self._rebuild(db)
+            return
+        if self._dirty_portfolios:
+            owners = db.query(Portfolio.resume_id).filter(Portfolio.id.in_(self._dirty_portfolios))
+            self._dirty_students.update(resume_id for (resume_id,) in owners)
+            self._dirty_portfolios.clear()
+        if not self._dirty_students:
+            return
+        dirty = set(self._dirty_students)
+        self._dirty_students.clear()
+        documents = self._load_documents(db, dirty)
+        for user_id in dirty:
+            old = self._features.pop(user_id, None)
+            if old is not None:
+                np.subtract.at(self._df, old, 1)
+            if user_id in self._row_of:
+                self._stale[self._row_of[user_id]] = True
+            self._delta.pop(user_id, None)
+            if user_id in documents:
+                indices, values = documents[user_id]
+                self._delta[user_id] = (indices, values)
+                self._features[user_id] = indices
+                np.add.at(self._df, indices, 1)
+        if len(self._delta) > COMPACT_THRESHOLD:
+            self._compact()
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(~self._stale)
+        rows = [(self._matrix.indices[self._matrix.indptr[r]:self._matrix.indptr[r + 1]],
+                 self._matrix.data[self._matrix.indptr[r]:self._matrix.indptr[r + 1]]) for r in keep]
+        ids = list(self._ids[keep])
+        for user_id, row in self._delta.items():
+            ids.append(user_id)
+            rows.append(row)
+        self._ids = np.asarray(ids, dtype=np.int64)
+        self._matrix = _to_csr(rows)
+        self._stale = np.zeros(len(ids), dtype=bool)
+        self._row_of = {int(user_id): row for row, user_id in enumerate(ids)}
+        self._delta = {}
+
+    def rank(self, db: Session, job_description: str, required_stack: Optional[str] = None, top_k: int = 20) -> List[Tuple[int, float]]:
+        """
+        직무 설명(과 필수 기술 스택)에 가장 잘 맞는 학생 상위 K명을 (user_id, 점수) 목록으로 반환합니다.
+        """
+        indices, values = _features([(job_description, 1), (required_stack, STACK_WEIGHT)])
+        with self._lock:
+            self._refresh(db)
+            if not len(indices):
+                return []
+            n_docs = len(self._features)
+            idf = np.log((1 + n_docs) / (1 + self._df[indices])) + 1.0
+            query = np.zeros(N_FEATURES, dtype=np.float32)
+            query[indices] = values * idf
+            scores = self._matrix.dot(query)
+            scores[self._stale] = 0.0
+            ids = self._ids
+            if self._delta:
+                delta_ids = np.fromiter(self._delta.keys(), dtype=np.int64, count=len(self._delta))
+                scores = np.concatenate([scores, _to_csr(list(self._delta.values())).dot(query)])
+                ids = np.concatenate([ids, delta_ids])
+        k = min(top_k, int(np.count_nonzero(scores > 0)))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+talent_matcher = TalentMatcher()
+subscribe(talent_matcher.on_change)
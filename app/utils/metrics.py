@@ -0,0 +1,377 @@
+import bisect
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Prometheus 텍스트 형식(0.0.4) 메트릭
+# 값은 스레드별 샤드에 기록하고(기록 시 잠금 없음), /metrics 조회 때만 모든 샤드를 합산합니다.
+# 잠금은 스레드가 처음 기록할 때 샤드를 등록하는 순간과, 끝난 스레드의 샤드를 합칠 때만 사용합니다.
+#
+# 멀티 워커(app/server.py)에서는 워커마다 값이 따로 쌓이므로, 각 워커가 METRICS_DIR에
+# 자기 스냅샷({pid}.json)을 주기적으로 쓰고 /metrics를 받은 워커가 다른 워커들의 파일을 더해 응답합니다.
+# 종료된 워커의 누적값(카운터/히스토그램)은 마스터가 retired.json에 합쳐 두므로 줄어들지 않습니다.
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+LabelValues = Tuple[str, ...]
+
+class _Holder:
+    __slots__ = ("values", "__weakref__")
+
+    def __init__(self):
+        self.values: dict = {}
+
+class _Shards:
+    """
+    스레드마다 따로 쓰는 {레이블 값: 값} 딕셔너리 묶음.
+    스레드가 끝나면(thread-local이 지워지면) 그 샤드를 base에 합치고 목록에서 빼므로,
+    AnyIO 워커 스레드가 교체되어도 샤드 수는 살아 있는 스레드 수를 넘지 않습니다.
+    """
+
+    def __init__(self, fold: Callable[[dict, dict], None]):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all: List[dict] = []
+        self._base: dict = {}
+        self._fold = fold
+
+    def mine(self) -> dict:
+        try:
+            return self._local.holder.values
+        except AttributeError:
+            holder = _Holder()
+            with self._lock:
+                self._all.append(holder.values)
+            weakref.finalize(holder, self._retire, holder.values)
+            self._local.holder = holder
+            return holder.values
+
+    def _retire(self, values: dict) -> None:
+        with self._lock:
+            self._fold(self._base, values)
+            self._all = [shard for shard in self._all if shard is not values]
+
+    def all(self) -> List[dict]:
+        # base는 합칠 때 값을 새 객체로 바꾸므로 얕은 복사로 충분
+        with self._lock:
+            return [dict(self._base)] + self._all
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+class _Metric:
+    kind = ""
+    shared = True      # 워커 간 합산 대상 (False면 /metrics를 받은 워커의 값만)
+    cumulative = True  # 종료된 워커의 값도 계속 더함 (카운터/히스토그램)
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._shards = _Shards(self._fold)
+
+    @staticmethod
+    def _fold(into: dict, values: dict) -> None:
+        for key, value in list(values.items()):
+            into[key] = into.get(key, 0) + value
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def snapshot(self) -> dict:
+        merged: dict = {}
+        for shard in self._shards.all():
+            self._fold(merged, shard)
+        return merged
+
+    def _merged(self, others: Sequence[dict] = ()) -> dict:
+        merged = self.snapshot()
+        for values in others:
+            self._fold(merged, values)
+        return merged
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        values = self._shards.mine()
+        key = self._key(labels)
+        values[key] = values.get(key, 0) + amount
+
+    def render(self, others: Sequence[dict] = ()) -> List[str]:
+        return self.header() + [
+            f"{self.name}{_labels(self.labelnames, key)} {_number(value)}" for key, value in sorted(self._merged(others).items())
+        ]
+
+class Gauge(Counter):
+    """
+    증감 게이지 (진행 중인 요청 수 등). 증가와 감소가 다른 스레드에서 일어나도 합산하면 맞습니다.
+    """
+    kind = "gauge"
+    cumulative = False
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+class GaugeFunc(_Metric):
+    """
+    조회 시점에 콜백으로 값을 읽는 게이지 (DB 풀, 스레드 제한기 등).
+    콜백은 [(레이블 값 튜플, 값), ...]을 반환합니다. 프로세스별 상태라 워커 간 합산하지 않습니다.
+    """
+    kind = "gauge"
+    shared = False
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], callback: Callable[[], Iterable[Tuple[LabelValues, float]]]):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def render(self, others: Sequence[dict] = ()) -> List[str]:
+        try:
+            samples = list(self.callback())
+        except Exception:
+            samples = []
+        return self.header() + [f"{self.name}{_labels(self.labelnames, key)} {_number(value)}" for key, value in samples]
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    @staticmethod
+    def _fold(into: dict, values: dict) -> None:
+        # 기존 목록을 고치지 않고 새 목록으로 바꿈 (_Shards.all()의 얕은 복사가 안전하도록)
+        for key, state in list(values.items()):
+            total = into.get(key)
+            into[key] = list(state) if total is None else [a + b for a, b in zip(total, state)]
+
+    def observe(self, value: float, **labels: str) -> None:
+        values = self._shards.mine()
+        key = self._key(labels)
+        state = values.get(key)
+        if state is None:
+            # 버킷별 개수(+Inf 포함), 합계
+            state = values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def render(self, others: Sequence[dict] = ()) -> List[str]:
+        lines = self.header()
+        for key, state in sorted(self._merged(others).items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state):
+                cumulative += count
+                le = 'le="%s"' % _number(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(state[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self, others: Sequence[Dict[str, dict]] = ()) -> str:
+        """
+        others: 다른 워커들의 스냅샷 [{메트릭 이름: {레이블 값: 값}}, ...]
+        """
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render([snapshot[metric.name] for snapshot in others if metric.name in snapshot]))
+        return "\n".join(lines) + "\n"
+
+    def get(self, name: str) -> _Metric:
+        return next(metric for metric in self._metrics if metric.name == name)
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {metric.name: metric.snapshot() for metric in self._metrics if metric.shared}
+
+    def cumulative(self) -> set:
+        return {metric.name for metric in self._metrics if metric.shared and metric.cumulative}
+
+registry = Registry()
+
+# --- 워커 간 합산 (METRICS_DIR) ---
+
+RETIRED_FILE = "retired.json"
+
+def _encode(snapshot: Dict[str, dict]) -> Dict[str, list]:
+    return {name: [[list(key), value] for key, value in values.items()] for name, values in snapshot.items()}
+
+def _decode(data: Dict[str, list]) -> Dict[str, dict]:
+    return {name: {tuple(key): value for key, value in values} for name, values in data.items()}
+
+def _read_json(path: str) -> Optional[Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_json(path: str, data: Any) -> None:
+    temp = f"{path}.tmp"
+    with open(temp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(temp, path)
+
+def write_snapshot(directory: str) -> None:
+    """
+    이 워커의 현재 값을 {directory}/{pid}.json으로 씁니다.
+    """
+    _write_json(os.path.join(directory, f"{os.getpid()}.json"), _encode(registry.snapshot()))
+
+def read_snapshots(directory: str) -> List[Dict[str, dict]]:
+    """
+    이 워커를 뺀 다른 워커들과 종료된 워커들(retired.json)의 스냅샷을 읽습니다.
+    """
+    retired = _read_json(os.path.join(directory, RETIRED_FILE)) or {}
+    merged_pids = set(retired.get("pids", []))
+    snapshots = [_decode(retired.get("metrics", {}))]
+    for filename in os.listdir(directory):
+        pid, ext = os.path.splitext(filename)
+        if ext != ".json" or not pid.isdigit() or int(pid) == os.getpid() or int(pid) in merged_pids:
+            continue
+        data = _read_json(os.path.join(directory, filename))
+        if data is not None:
+            snapshots.append(_decode(data))
+    return snapshots
+
+def retire_snapshot(directory: str, pid: int) -> None:
+    """
+    종료된 워커의 누적값을 retired.json에 합치고 파일을 지웁니다. (마스터가 워커를 회수할 때 호출)
+    합친 pid를 기록해 두므로, 파일을 지우기 전에 읽는 워커도 같은 값을 두 번 더하지 않습니다.
+    """
+    path = os.path.join(directory, f"{pid}.json")
+    data = _read_json(path)
+    if data is None:
+        return
+    retired_path = os.path.join(directory, RETIRED_FILE)
+    retired = _read_json(retired_path) or {}
+    metrics = _decode(retired.get("metrics", {}))
+    cumulative = registry.cumulative()
+    for name, values in _decode(data).items():
+        if name in cumulative:
+            registry.get(name)._fold(metrics.setdefault(name, {}), values)
+    # 파일이 이미 지워진 pid는 다시 읽힐 일이 없으므로 목록에서 뺌
+    pids = [p for p in retired.get("pids", []) if os.path.exists(os.path.join(directory, f"{p}.json"))]
+    _write_json(retired_path, {"pids": pids + [pid], "metrics": _encode(metrics)})
+    os.remove(path)
+
+def clear_snapshots(directory: str) -> None:
+    for filename in os.listdir(directory):
+        if filename.endswith((".json", ".tmp")):
+            os.remove(os.path.join(directory, filename))
+
+class SnapshotWriter:
+    """
+    METRICS_FLUSH_INTERVAL마다 이 워커의 스냅샷을 쓰는 스레드. 다른 워커에는 그만큼 늦게 반영됩니다.
+    """
+
+    def __init__(self, directory: str, interval: float):
+        self.directory = directory
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-snapshot", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            write_snapshot(self.directory)
+
+    def start(self) -> None:
+        write_snapshot(self.directory)
+        self._thread.start()
+
+    def stop(self) -> None:
+        # 종료 직전 값까지 남겨 마스터가 retired.json에 합치도록
+        self._stopped.set()
+        self._thread.join()
+        write_snapshot(self.directory)
+
+REQUESTS = registry.register(Counter("http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status")))
+LATENCY = registry.register(Histogram("http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ("method", "route")))
+RESPONSE_SIZE = registry.register(Histogram("http_response_size_bytes", "HTTP 응답 본문 크기(바이트)", ("method", "route"), SIZE_BUCKETS))
+IN_FLIGHT = registry.register(Gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수"))
+UPLOAD_BYTES = registry.register(Counter("upload_bytes_total", "업로드된 이미지 파일 크기 합계(바이트)"))
+SLACK_LATENCY = registry.register(Histogram("slack_send_duration_seconds", "Slack 알림 전송 시간(초)"))
+SLACK_FAILURES = registry.register(Counter("slack_send_failures_total", "Slack 알림 전송 실패 수"))
+
+def _pool_samples():
+    from app.core.config import engine
+    pool = engine.pool
+    for state in ("size", "checkedin", "checkedout", "overflow"):
+        getter = getattr(pool, state, None)
+        if getter is not None:
+            yield (state,), getter()
+
+registry.register(GaugeFunc("db_pool_connections", "DB 커넥션 풀 상태 (size/checkedin/checkedout/overflow)", ("state",), _pool_samples))
+
+def _limiter_samples():
+    # AnyIO 기본 스레드 제한기는 이벤트 루프 안에서만 조회 가능 (/metrics는 async 엔드포인트)
+    import anyio.to_thread
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    yield ("total",), limiter.total_tokens
+    yield ("borrowed",), limiter.borrowed_tokens
+
+registry.register(GaugeFunc("anyio_thread_limiter_tokens", "동기 엔드포인트용 스레드 제한기 토큰 (total/borrowed)", ("state",), _limiter_samples))
+
+class MetricsMiddleware:
+    """
+    요청 수/처리 시간/응답 크기/진행 중 요청 수를 기록하는 ASGI 미들웨어.
+    경로는 실제 URL이 아니라 라우트 템플릿(/resumes/{resume_id}/detail)으로 묶어 레이블 수를 제한합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = "500"
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            IN_FLIGHT.dec()
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            REQUESTS.inc(method=method, route=template, status=status)
+            LATENCY.observe(elapsed, method=method, route=template)
+            RESPONSE_SIZE.observe(size, method=method, route=template)
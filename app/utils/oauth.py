@@ -1,7 +1,6 @@
-from authlib.integrations.starlette_client import OAuth
-from starlette.config import Config
+from functools import lru_cache
 from app.core.config import (
-    GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET,
+    config, GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET,
     KAKAO_CLIENT_ID, KAKAO_CLIENT_SECRET,
     OAUTH_REDIRECT_URL
 )
@@ -9,35 +8,40 @@ from app.models.user import User, OAuthProviderEnum, UserTypeEnum
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any
 
-# OAuth 설정
-config = Config('.env')
-oauth = OAuth(config)
+@lru_cache(maxsize=None)
+def get_oauth():
+    """
+    OAuth 클라이언트를 처음 사용할 때 authlib을 불러와 등록합니다. (.env는 app.core.config에서 한 번만 읽음)
+    """
+    from authlib.integrations.starlette_client import OAuth
+    oauth = OAuth(config)
 
-# Google OAuth 설정
-oauth.register(
-    name='google',
-    client_id=GOOGLE_CLIENT_ID,
-    client_secret=GOOGLE_CLIENT_SECRET,
-    server_metadata_url='https://accounts.google.com/.well-known/openid_configuration',
-    client_kwargs={
-        'scope': 'openid email profile'
-    }
-)
+    # Google OAuth 설정
+    oauth.register(
+        name='google',
+        client_id=GOOGLE_CLIENT_ID,
+        client_secret=GOOGLE_CLIENT_SECRET,
+        server_metadata_url='https://accounts.google.com/.well-known/openid_configuration',
+        client_kwargs={
+            'scope': 'openid email profile'
+        }
+    )
 
-# Kakao OAuth 설정
-oauth.register(
-    name='kakao',
-    client_id=KAKAO_CLIENT_ID,
-    client_secret=KAKAO_CLIENT_SECRET,
-    access_token_url='https://kauth.kakao.com/oauth/token',
-    access_token_params=None,
-    authorize_url='https://kauth.kakao.com/oauth/authorize',
-    authorize_params=None,
-    api_base_url='https://kapi.kakao.com/',
-    client_kwargs={
-        'scope': 'profile_nickname profile_image account_email'
-    }
-)
+    # Kakao OAuth 설정
+    oauth.register(
+        name='kakao',
+        client_id=KAKAO_CLIENT_ID,
+        client_secret=KAKAO_CLIENT_SECRET,
+        access_token_url='https://kauth.kakao.com/oauth/token',
+        access_token_params=None,
+        authorize_url='https://kauth.kakao.com/oauth/authorize',
+        authorize_params=None,
+        api_base_url='https://kapi.kakao.com/',
+        client_kwargs={
+            'scope': 'profile_nickname profile_image account_email'
+        }
+    )
+    return oauth
 
 def get_or_create_user(db: Session, oauth_provider: OAuthProviderEnum, 
                       oauth_data: Dict[str, Any], user_type: UserTypeEnum = UserTypeEnum.student) -> User:
@@ -106,7 +110,7 @@ def get_kakao_user_info(token: Dict[str, Any]) -> Dict[str, Any]:
     Kakao OAuth 토큰에서 사용자 정보를 추출합니다.
     """
     # Kakao API에서 사용자 정보 가져오기
-    resp = oauth.kakao.get('v2/user/me', token=token)
+    resp = get_oauth().kakao.get('v2/user/me', token=token)
     user_info = resp.json()
     
     account = user_info.get('kakao_account', {})
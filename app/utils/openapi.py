@@ -0,0 +1,88 @@
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+from fastapi import FastAPI, Request
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import Response
+
+# 정적 OpenAPI 스키마
+# 스키마는 배포 빌드 때 export_openapi.py로 한 번만 생성하고, 운영 서버는 그 파일을 읽어 그대로 내려줍니다.
+# (워커마다 첫 /openapi.json 요청에서 전체 라우트를 훑어 스키마를 만드는 비용 제거)
+
+OPENAPI_URL = "/openapi.json"
+# 스키마는 배포 단위로만 바뀌므로 ETag로 재검증하면서 1시간 캐시
+CACHE_CONTROL = "public, max-age=3600"
+
+def build_schema(app: FastAPI) -> Dict[str, Any]:
+    """
+    앱 라우트와 문서 메타데이터로 OpenAPI 스키마를 생성합니다. (개발 모드의 app.openapi()와 같은 결과)
+    """
+    from app.core.api_docs import api_metadata
+    metadata = api_metadata()
+    return get_openapi(
+        title=metadata["title"],
+        version=metadata["version"],
+        openapi_version=app.openapi_version,
+        description=metadata["description"],
+        routes=app.routes,
+        tags=metadata["openapi_tags"],
+        contact=metadata["contact"],
+        license_info=metadata["license_info"],
+    )
+
+def dump_schema(schema: Dict[str, Any]) -> bytes:
+    # JSONResponse와 같은 형식 (한글 그대로, 공백 없음)
+    return json.dumps(schema, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+class StaticSchema:
+    """
+    스키마 파일을 첫 요청 때 한 번만 읽어 본문과 ETag를 보관합니다.
+    파일이 없으면(빌드 단계 누락) 그때 한 번 직접 생성합니다.
+    """
+
+    def __init__(self, app: FastAPI, path: str):
+        self.app = app
+        self.path = path
+        self._cached: Optional[Tuple[bytes, str]] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Tuple[bytes, str]:
+        if self._cached is None:
+            with self._lock:
+                if self._cached is None:
+                    try:
+                        with open(self.path, "rb") as f:
+                            body = f.read()
+                    except FileNotFoundError:
+                        body = dump_schema(build_schema(self.app))
+                    self._cached = (body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"')
+        return self._cached
+
+def install_static_docs(app: FastAPI, path: str) -> None:
+    """
+    openapi_url=None으로 만든 앱에 정적 스키마와 /docs, /redoc을 등록합니다.
+    """
+    schema = StaticSchema(app, path)
+    oauth2_redirect_url = "/docs/oauth2-redirect"
+
+    @app.get(OPENAPI_URL, include_in_schema=False)
+    def openapi(request: Request):
+        body, etag = schema.load()
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    @app.get("/docs", include_in_schema=False)
+    async def swagger_ui():
+        return get_swagger_ui_html(openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI", oauth2_redirect_url=oauth2_redirect_url)
+
+    @app.get(oauth2_redirect_url, include_in_schema=False)
+    async def swagger_ui_redirect():
+        return get_swagger_ui_oauth2_redirect_html()
+
+    @app.get("/redoc", include_in_schema=False)
+    async def redoc():
+        return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
@@ -0,0 +1,202 @@
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from app.core.config import PROFILE_TOKEN, PROFILE_SAMPLE_RATE, PROFILE_INTERVAL, PROFILE_BUFFER_SIZE
+
+# 요청 단위 통계적(스택 샘플링) 프로파일러
+# - 관리자 헤더(X-Profile-Token) 또는 샘플링 비율(PROFILE_SAMPLE_RATE)로 선택된 요청만 프로파일링
+# - PROFILE_INTERVAL마다 해당 요청을 처리 중인 스레드의 스택을 읽어 wall/CPU 기준으로 집계
+# - 결과는 flamegraph.pl/speedscope에서 바로 읽는 접힌 스택(folded) 형식으로 최근 PROFILE_BUFFER_SIZE개만 보관
+# 꺼져 있으면(토큰 없음, 비율 0) 미들웨어는 요청마다 불리언 하나만 확인하고 그대로 통과시킵니다.
+# 프로파일은 워커 프로세스 메모리에 보관되므로, 멀티 워커(app/server.py)에서는 요청을 처리한 워커에서만 조회됩니다.
+# ID에 워커 pid를 붙여("{pid}-{번호}") 워커끼리 겹치지 않게 하고, 다른 워커가 받은 조회 요청은 404가 되므로
+# 찾을 때까지 다시 요청하거나 --workers 1로 띄운 서버에서 프로파일링하세요.
+
+PROFILE_HEADER = b"x-profile-token"
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def _stack(frame) -> List[Any]:
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+def _thread_cpu_time(ident: int) -> Optional[float]:
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (AttributeError, OSError):
+        return None
+
+class RequestProfile:
+    """
+    한 요청의 샘플링 결과. stacks는 {접힌 스택: [wall 표본 수, CPU 초]} 형태입니다.
+    """
+
+    def __init__(self, profile_id: str, method: str, path: str):
+        self.id = profile_id
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.started_at = datetime.utcnow()
+        self.duration = 0.0
+        self.samples = 0
+        self.stacks: Dict[str, List[float]] = {}
+
+    def add(self, stack: str, cpu: float) -> None:
+        entry = self.stacks.get(stack)
+        if entry is None:
+            entry = self.stacks[stack] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += cpu
+
+    def folded(self, kind: str) -> str:
+        """
+        접힌 스택 텍스트: "바깥;...;안쪽 값" (wall은 표본 수, cpu는 마이크로초)
+        """
+        lines = []
+        for stack, (count, cpu) in sorted(self.stacks.items()):
+            value = count if kind == "wall" else int(cpu * 1e6)
+            if value:
+                lines.append(f"{stack} {value}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id, "method": self.method, "path": self.path, "route": self.route,
+            "started_at": self.started_at, "duration_ms": round(self.duration * 1000, 2), "samples": self.samples,
+        }
+
+class _Sampler(threading.Thread):
+    """
+    요청이 끝날 때까지 interval마다 스택을 읽는 스레드.
+    - 이벤트 루프 스레드: 이 요청의 미들웨어 프레임이 스택에 있을 때만 (다른 요청의 코루틴은 제외)
+    - 워커 스레드(동기 엔드포인트): 이 요청의 엔드포인트 함수가 스택에 있을 때만
+      같은 엔드포인트를 동시에 처리 중인 다른 요청의 표본이 섞일 수 있습니다.
+    """
+
+    def __init__(self, profile: RequestProfile, loop_thread: int, anchor, scope: Dict[str, Any], interval: float):
+        super().__init__(name=f"profiler-{profile.id}", daemon=True)
+        self.profile = profile
+        self.loop_thread = loop_thread
+        self.anchor = anchor
+        self.scope = scope
+        self.interval = interval
+        self.stopped = threading.Event()
+        self._cpu: Dict[int, float] = {}
+
+    def run(self) -> None:
+        own = threading.get_ident()
+        cpu_start = _thread_cpu_time(self.loop_thread)
+        if cpu_start is not None:
+            self._cpu[self.loop_thread] = cpu_start
+        while not self.stopped.wait(self.interval):
+            endpoint = self.scope.get("endpoint")
+            target = getattr(endpoint, "__code__", None)
+            frames_by_thread = sys._current_frames()
+            # 스택을 읽는 사이 요청이 끝났으면 (미들웨어가 이 스레드를 기다리는 중) 버림
+            if self.stopped.is_set():
+                break
+            for ident, frame in frames_by_thread.items():
+                if ident == own:
+                    continue
+                frames = _stack(frame)
+                if ident == self.loop_thread:
+                    if not any(f is self.anchor for f in frames):
+                        continue
+                elif target is None or not any(f.f_code is target for f in frames):
+                    continue
+                cpu_now = _thread_cpu_time(ident)
+                cpu = 0.0
+                if cpu_now is not None:
+                    cpu = max(cpu_now - self._cpu.get(ident, cpu_now), 0.0)
+                    self._cpu[ident] = cpu_now
+                self.profile.add(";".join(_frame_name(f) for f in frames), cpu)
+                self.profile.samples += 1
+
+class ProfileStore:
+    """
+    최근 프로파일을 보관하는 고정 크기 링 버퍼.
+    """
+
+    def __init__(self, size: int):
+        self._profiles = deque(maxlen=size)
+        self._ids = itertools.count(1)
+
+    def new(self, method: str, path: str) -> RequestProfile:
+        # preload 후 fork된 워커는 카운터 상태를 물려받으므로 pid로 구분
+        return RequestProfile(f"{os.getpid()}-{next(self._ids)}", method, path)
+
+    def add(self, profile: RequestProfile) -> None:
+        self._profiles.append(profile)
+
+    def list(self) -> List[RequestProfile]:
+        return list(reversed(self._profiles))
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        for profile in list(self._profiles):
+            if profile.id == profile_id:
+                return profile
+        return None
+
+profile_store = ProfileStore(PROFILE_BUFFER_SIZE)
+
+def is_admin(token: Optional[str]) -> bool:
+    return bool(PROFILE_TOKEN) and token == PROFILE_TOKEN
+
+class ProfileMiddleware:
+    """
+    선택된 요청을 샘플링 프로파일링하고, 응답 헤더 X-Profile-Id로 프로파일 ID를 알려 줍니다.
+    (조회: GET /debug/profiles/{id}?kind=wall|cpu)
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.enabled = bool(PROFILE_TOKEN) or PROFILE_SAMPLE_RATE > 0
+
+    def _selected(self, scope) -> bool:
+        if PROFILE_TOKEN:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return value.decode("latin-1") == PROFILE_TOKEN
+        return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+    async def __call__(self, scope, receive, send):
+        if not self.enabled or scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+        await self._profiled(scope, receive, send)
+
+    async def _profiled(self, scope, receive, send):
+        profile = profile_store.new(scope["method"], scope["path"])
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile.id.encode()))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        # 이 코루틴의 프레임: 이벤트 루프 스레드에서 이 요청이 실행 중인지 판별하는 기준
+        anchor = sys._getframe()
+        sampler = _Sampler(profile, threading.get_ident(), anchor, scope, PROFILE_INTERVAL)
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stopped.set()
+            sampler.join()
+            profile.duration = time.perf_counter() - start
+            profile.route = getattr(scope.get("route"), "path", None)
+            profile_store.add(profile)
@@ -0,0 +1,210 @@
+import re
+from typing import Iterable, List, Optional, Dict, Any, Tuple
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+# 문서 종류별 코드 (rowid/doc_key = doc_id * 4 + 코드)
+DOC_TYPES = {"portfolio": 1, "project": 2, "resume": 3}
+DOC_TYPE_NAMES = {code: name for name, code in DOC_TYPES.items()}
+
+# 한글 음절 구간 / 영문·숫자 토큰 (node.js, c++, c# 같은 표기 유지)
+_TOKEN_RE = re.compile(r"[가-힣]+|[a-z0-9][a-z0-9+#.]*")
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """
+    텍스트를 검색 토큰으로 분리합니다.
+    한글은 음절 bigram(2-gram)으로, 영문/숫자는 단어 단위로 토큰화합니다.
+    """
+    if not value:
+        return []
+    tokens = []
+    for word in _TOKEN_RE.findall(value.lower()):
+        if "가" <= word[0] <= "힣":
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            word = word.rstrip(".")
+            if word:
+                tokens.append(word)
+    return tokens
+
+def _doc_key(doc_type: str, doc_id: int) -> int:
+    return doc_id * 4 + DOC_TYPES[doc_type]
+
+def _body(values: Iterable[Optional[str]]) -> str:
+    return " ".join(token for value in values for token in tokenize(value))
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+def ensure_search_index(bind) -> None:
+    """
+    전문 검색 인덱스 테이블을 생성합니다. (이미 있으면 무시)
+    - SQLite: FTS5 가상 테이블 (BM25 랭킹)
+    - PostgreSQL: tsvector GIN 인덱스 + pg_trgm 트라이그램 인덱스
+    """
+    with bind.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+                "doc_type UNINDEXED, doc_id UNINDEXED, resume_id UNINDEXED, body, "
+                "tokenize = \"unicode61 tokenchars '+#.'\")"
+            ))
+        else:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            conn.execute(text(
+                "CREATE TABLE IF NOT EXISTS search_document ("
+                "doc_key BIGINT PRIMARY KEY, doc_type VARCHAR NOT NULL, doc_id INTEGER NOT NULL, "
+                "resume_id INTEGER, content TEXT NOT NULL, document TSVECTOR NOT NULL)"
+            ))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_search_document_document "
+                "ON search_document USING GIN (document)"
+            ))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_search_document_content_trgm "
+                "ON search_document USING GIN (content gin_trgm_ops)"
+            ))
+
+Document = Tuple[int, Dict[str, Any], List[Optional[str]]]  # (문서 ID, 추가 파라미터, 본문 값)
+
+def _upsert(db: Session, doc_type: str, resume_id_sql: str, docs: Iterable[Document]) -> None:
+    # 같은 종류의 문서 여러 개를 DELETE 한 번 + executemany INSERT 한 번으로 반영
+    docs = {doc_id: (params, values) for doc_id, params, values in docs}  # 같은 문서가 여러 번 오면 마지막 값
+    if not docs:
+        return
+    rows = [
+        dict(params, key=_doc_key(doc_type, doc_id), doc_type=doc_type, doc_id=doc_id, body=_body(values))
+        for doc_id, (params, values) in docs.items()
+    ]
+    if _dialect(db) == "sqlite":
+        remove_documents(db, doc_type, docs)
+        db.execute(text(
+            "INSERT INTO search_index (rowid, doc_type, doc_id, resume_id, body) "
+            f"VALUES (:key, :doc_type, :doc_id, {resume_id_sql}, :body)"
+        ), rows)
+    else:
+        for row, (_, values) in zip(rows, docs.values()):
+            row["content"] = " ".join(value for value in values if value)
+        db.execute(text(
+            "INSERT INTO search_document (doc_key, doc_type, doc_id, resume_id, content, document) "
+            f"VALUES (:key, :doc_type, :doc_id, {resume_id_sql}, :content, to_tsvector('simple', :body)) "
+            "ON CONFLICT (doc_key) DO UPDATE SET resume_id = EXCLUDED.resume_id, "
+            "content = EXCLUDED.content, document = EXCLUDED.document"
+        ), rows)
+
+def index_portfolio(db: Session, portfolio) -> None:
+    """
+    포트폴리오를 검색 인덱스에 반영합니다. (커밋은 호출한 쪽의 트랜잭션에서 수행)
+    """
+    index_portfolios(db, [portfolio])
+
+def index_portfolios(db: Session, portfolios: Iterable) -> None:
+    """
+    여러 포트폴리오를 한 번의 DELETE/INSERT 문으로 검색 인덱스에 반영합니다.
+    """
+    _upsert(db, "portfolio", ":resume_id", (
+        (portfolio.id, {"resume_id": portfolio.resume_id}, [portfolio.project_name, portfolio.project_intro, portfolio.role])
+        for portfolio in portfolios
+    ))
+
+def index_project(db: Session, project) -> None:
+    """
+    프로젝트를 검색 인덱스에 반영합니다. 이력서 ID는 포트폴리오에서 같은 문장 안에서 조회합니다.
+    """
+    index_projects(db, [project])
+
+def index_projects(db: Session, projects: Iterable) -> None:
+    """
+    여러 프로젝트를 한 번의 DELETE/INSERT 문으로 검색 인덱스에 반영합니다.
+    """
+    _upsert(db, "project", "(SELECT resume_id FROM portfolio WHERE id = :portfolio_id)", (
+        (project.id, {"portfolio_id": project.portfolio_id},
+         [project.project_name, project.project_intro, project.description, project.tech_stack])
+        for project in projects
+    ))
+
+def index_resume(db: Session, resume) -> None:
+    """
+    이력서 기본 정보(소개글)를 검색 인덱스에 반영합니다.
+    """
+    _upsert(db, "resume", ":resume_id", [(resume.id, {"resume_id": resume.id}, [resume.job_type, resume.short_intro, resume.intro])])
+
+def remove_document(db: Session, doc_type: str, doc_id: int) -> None:
+    """
+    검색 인덱스에서 문서를 삭제합니다.
+    """
+    remove_documents(db, doc_type, [doc_id])
+
+def remove_documents(db: Session, doc_type: str, doc_ids: Iterable[int]) -> None:
+    """
+    검색 인덱스에서 여러 문서를 한 문장으로 삭제합니다.
+    """
+    keys = [_doc_key(doc_type, doc_id) for doc_id in doc_ids]
+    if not keys:
+        return
+    if _dialect(db) == "sqlite":
+        statement = text("DELETE FROM search_index WHERE rowid IN :keys")
+    else:
+        statement = text("DELETE FROM search_document WHERE doc_key IN :keys")
+    db.execute(statement.bindparams(bindparam("keys", expanding=True)), {"keys": keys})
+
+def search(db: Session, q: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    검색어와 일치하는 문서를 관련도 순으로 반환합니다.
+    SQLite는 BM25, PostgreSQL은 ts_rank_cd 점수를 사용하며 점수가 클수록 관련도가 높습니다.
+    """
+    tokens = list(dict.fromkeys(tokenize(q)))
+    if not tokens:
+        return []
+    if _dialect(db) == "sqlite":
+        match = " ".join('"{}"'.format(token.replace('"', '""')) for token in tokens)
+        rows = db.execute(text(
+            "SELECT rowid, resume_id, -bm25(search_index) AS score FROM search_index "
+            "WHERE search_index MATCH :match ORDER BY bm25(search_index) LIMIT :limit"
+        ), {"match": match, "limit": limit}).all()
+    else:
+        query = " & ".join("'{}'".format(token.replace("'", "''")) for token in tokens)
+        rows = db.execute(text(
+            "SELECT doc_key, resume_id, ts_rank_cd(document, query) AS score "
+            "FROM search_document, to_tsquery('simple', :query) AS query "
+            "WHERE document @@ query ORDER BY score DESC LIMIT :limit"
+        ), {"query": query, "limit": limit}).all()
+        if not rows:
+            # 오타 등으로 일치하는 토큰이 없으면 트라이그램 유사도로 대체
+            rows = db.execute(text(
+                "SELECT doc_key, resume_id, similarity(content, :q) AS score FROM search_document "
+                "WHERE content % :q ORDER BY score DESC LIMIT :limit"
+            ), {"q": q, "limit": limit}).all()
+    return [
+        {
+            "doc_type": DOC_TYPE_NAMES[key % 4],
+            "doc_id": key // 4,
+            "resume_id": resume_id,
+            "score": float(score),
+        }
+        for key, resume_id, score in rows
+    ]
+
+def rebuild_search_index(db: Session) -> int:
+    """
+    기존 데이터 전체를 검색 인덱스에 다시 반영합니다. (최초 도입/복구용)
+    """
+    from app.models.portfolio import Portfolio
+    from app.models.project import Project
+    from app.models.resume import ResumeBasicInfo
+
+    count = 0
+    for portfolio in db.query(Portfolio).yield_per(500):
+        index_portfolio(db, portfolio)
+        count += 1
+    for project in db.query(Project).yield_per(500):
+        index_project(db, project)
+        count += 1
+    for resume in db.query(ResumeBasicInfo).yield_per(500):
+        index_resume(db, resume)
+        count += 1
+    db.commit()
+    return count
@@ -0,0 +1,48 @@
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+# 조회 전용 핫 경로용 직렬화
+# DB에서 읽은 행은 이미 스키마 타입과 일치하므로 pydantic 검증과 jsonable_encoder를 건너뛰고,
+# 스키마 필드 목록으로 미리 만든 attrgetter로 dict를 만든 뒤 orjson으로 바로 인코딩합니다.
+
+@lru_cache(maxsize=None)
+def _getter(schema: Type[BaseModel]) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    names = tuple(schema.model_fields)
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        return names, lambda obj: (getter(obj),)
+    return names, getter
+
+def to_row(obj: Any, schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    ORM 객체를 스키마 필드만 담은 dict로 변환합니다.
+    """
+    names, getter = _getter(schema)
+    return dict(zip(names, getter(obj)))
+
+def to_rows(objects: Iterable[Any], schema: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """
+    ORM 객체 목록을 스키마 필드만 담은 dict 목록으로 변환합니다.
+    """
+    names, getter = _getter(schema)
+    return [dict(zip(names, getter(obj))) for obj in objects]
+
+class FastJSONResponse(Response):
+    """
+    orjson으로 인코딩하는 JSON 응답. (datetime은 ISO 8601, dict의 정수 키는 문자열로 변환)
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+def fast_json(content: Any) -> FastJSONResponse:
+    """
+    이미 직렬화 가능한 형태(dict/list, datetime 포함)의 응답을 orjson으로 바로 인코딩합니다.
+    response_model 검증을 거치지 않으므로 스키마와 같은 필드를 담아서 넘겨야 합니다.
+    """
+    return FastJSONResponse(content)
@@ -0,0 +1,227 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+from scipy import sparse
+from sqlalchemy import delete, func, insert
+from sqlalchemy.orm import Session
+from app.core.config import SessionLocal
+from app.models.user import StudentProfile
+from app.models.portfolio import Portfolio
+from app.models.project import Project
+from app.models.similar import Base as SimilarBase, SimilarTalent
+from app.models.skill import StudentSkill, ProjectSkill
+from app.utils.changes import subscribe
+from app.utils.skills import SKILL_NAMES
+
+logger = logging.getLogger(__name__)
+
+TOP_N = 10            # 학생별로 저장할 이웃 수
+BLOCK_SIZE = 256      # 한 번에 유사도를 계산할 행 수 (메모리: BLOCK_SIZE x 학생 수)
+DEBOUNCE_SECONDS = 5  # 변경 사항을 모아서 처리하는 대기 시간
+
+def ensure_similar_table(bind) -> None:
+    """
+    유사 인재 테이블(similar_talent)을 생성합니다. (이미 있으면 무시)
+    """
+    SimilarBase.metadata.create_all(bind=bind)
+
+def load_skill_vectors(db: Session, user_ids: Optional[Set[int]] = None) -> Tuple[np.ndarray, sparse.csr_matrix]:
+    """
+    학생별 표준 스킬 ID(프로필 + 프로젝트)를 L2 정규화된 희소 벡터로 만듭니다.
+    - `user_ids`: 지정하면 해당 학생의 행만 읽음 (없는 학생은 결과에서 빠짐)
+    반환값: (user_id 배열, 학생 수 x 스킬 ID CSR 행렬)
+    """
+    profiles = db.query(StudentProfile.user_id)
+    skills = db.query(StudentSkill.user_id, StudentSkill.skill_id)
+    # 인재 탐색과 동일하게 portfolio.resume_id를 학생 user_id로 취급
+    projects = (
+        db.query(Portfolio.resume_id, ProjectSkill.skill_id)
+        .join(Project, Project.portfolio_id == Portfolio.id)
+        .join(ProjectSkill, ProjectSkill.project_id == Project.id)
+    )
+    if user_ids is not None:
+        profiles = profiles.filter(StudentProfile.user_id.in_(user_ids))
+        skills = skills.filter(StudentSkill.user_id.in_(user_ids))
+        projects = projects.filter(Portfolio.resume_id.in_(user_ids))
+
+    counts: Dict[int, Dict[int, int]] = {}
+    for (user_id,) in profiles:
+        counts[user_id] = {}
+    for user_id, skill_id in skills:
+        if user_id in counts:
+            counts[user_id][skill_id] = counts[user_id].get(skill_id, 0) + 1
+    for user_id, skill_id in projects:
+        if user_id in counts:
+            counts[user_id][skill_id] = counts[user_id].get(skill_id, 0) + 1
+
+    rows, cols, data = [], [], []
+    ids = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    for row, bag in enumerate(counts.values()):
+        for skill_id, count in bag.items():
+            rows.append(row)
+            cols.append(skill_id)
+            data.append(1.0 + np.log(count))
+    matrix = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float32), (rows, cols)),
+        shape=(len(ids), max(SKILL_NAMES) + 1),
+    )
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    matrix = sparse.diags(1.0 / norms).dot(matrix).tocsr()
+    return ids, matrix
+
+def replace_skill_vectors(
+    db: Session, ids: np.ndarray, matrix: sparse.csr_matrix, user_ids: Set[int]
+) -> Tuple[np.ndarray, sparse.csr_matrix]:
+    """
+    이미 만든 벡터에서 지정한 학생의 행만 DB에서 다시 읽어 교체합니다.
+    삭제된 학생의 행은 빠지고, 새 학생의 행은 끝에 추가됩니다.
+    """
+    if not user_ids:
+        return ids, matrix
+    new_ids, new_rows = load_skill_vectors(db, user_ids)
+    keep = ~np.isin(ids, np.fromiter(user_ids, dtype=np.int64, count=len(user_ids)))
+    return np.concatenate([ids[keep], new_ids]), sparse.vstack([matrix[keep], new_rows], format="csr")
+
+def _neighbours(ids: np.ndarray, matrix: sparse.csr_matrix, rows: np.ndarray) -> Iterable[Tuple[int, List[Tuple[int, float]]]]:
+    """
+    지정한 행들의 상위 TOP_N 이웃을 블록 단위 코사인 유사도로 계산합니다.
+    """
+    transposed = matrix.T.tocsc()
+    for start in range(0, len(rows), BLOCK_SIZE):
+        block = rows[start:start + BLOCK_SIZE]
+        scores = matrix[block].dot(transposed).toarray()
+        scores[np.arange(len(block)), block] = 0.0  # 자기 자신 제외
+        k = min(TOP_N, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for i, row in enumerate(block):
+            order = top[i][np.argsort(-scores[i, top[i]])]
+            yield int(ids[row]), [(int(ids[j]), float(scores[i, j])) for j in order if scores[i, j] > 0]
+
+def _store(db: Session, results: Iterable[Tuple[int, List[Tuple[int, float]]]], user_ids: Optional[List[int]]) -> int:
+    if user_ids is None:
+        db.execute(delete(SimilarTalent))
+    elif user_ids:
+        db.execute(delete(SimilarTalent).where(SimilarTalent.student_user_id.in_(user_ids)))
+    now = datetime.utcnow()
+    batch = []
+    count = 0
+    for user_id, neighbours in results:
+        count += 1
+        batch.extend(
+            {"student_user_id": user_id, "rank": rank, "neighbour_user_id": neighbour, "score": score, "updated_at": now}
+            for rank, (neighbour, score) in enumerate(neighbours, start=1)
+        )
+        if len(batch) >= 5000:
+            db.execute(insert(SimilarTalent), batch)
+            batch = []
+    if batch:
+        db.execute(insert(SimilarTalent), batch)
+    db.commit()
+    return count
+
+def rebuild_similar_talents(db: Session) -> int:
+    """
+    전체 학생의 유사 인재 목록을 다시 계산해 저장합니다.
+    """
+    ids, matrix = load_skill_vectors(db)
+    return _store(db, _neighbours(ids, matrix, np.arange(len(ids))), None)
+
+def refresh_similar_talents(db: Session, changed: Set[int], ids: np.ndarray, matrix: sparse.csr_matrix) -> int:
+    """
+    변경된 학생과, 그 변경으로 이웃 목록이 달라질 수 있는 학생의 행만 다시 계산합니다.
+    - 변경된 학생 본인
+    - 변경된 학생을 이웃으로 가지고 있던 학생
+    - 변경된 학생과의 유사도가 현재 N번째 이웃 점수보다 높은 학생
+    `ids`/`matrix`는 변경된 학생의 행까지 최신으로 맞춘 벡터 (load_skill_vectors/replace_skill_vectors)
+    """
+    row_of = {int(user_id): row for row, user_id in enumerate(ids)}
+    affected = set(changed)
+    holders = db.query(SimilarTalent.student_user_id).filter(SimilarTalent.neighbour_user_id.in_(changed))
+    affected.update(user_id for (user_id,) in holders)
+
+    changed_rows = [row_of[user_id] for user_id in changed if user_id in row_of]
+    if changed_rows:
+        best = np.asarray(matrix.dot(matrix[changed_rows].T).max(axis=1).todense()).ravel()
+        thresholds = np.zeros(len(ids), dtype=np.float32)
+        stored = db.query(SimilarTalent.student_user_id, func.min(SimilarTalent.score), func.count()).group_by(SimilarTalent.student_user_id)
+        for user_id, min_score, count in stored:
+            if user_id in row_of and count >= TOP_N:
+                thresholds[row_of[user_id]] = min_score
+        affected.update(int(user_id) for user_id in ids[best > thresholds])
+
+    rows = np.asarray(sorted(row_of[user_id] for user_id in affected if user_id in row_of), dtype=np.int64)
+    # 삭제된 학생은 이웃 목록도 비움
+    return _store(db, _neighbours(ids, matrix, rows), list(affected))
+
+class SimilarTalentJob:
+    """
+    변경 사항을 모아 백그라운드 스레드에서 유사 인재 목록을 부분 갱신합니다.
+    스킬 벡터(CSR 행렬)는 처음 한 번만 전체를 읽고, 이후에는 변경된 학생의 행만 교체합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._students: Set[int] = set()
+        self._portfolios: Set[int] = set()
+        # 다른 워커에서 커밋된 변경: 목록은 그 워커가 갱신하므로 벡터 행만 다음 실행 때 교체
+        self._stale_students: Set[int] = set()
+        self._stale_portfolios: Set[int] = set()
+        self._timer: Optional[threading.Timer] = None
+        self._ids: Optional[np.ndarray] = None
+        self._matrix: Optional[sparse.csr_matrix] = None
+
+    def invalidate(self, changes: Dict[str, Set[int]]) -> None:
+        with self._lock:
+            self._stale_students |= changes.get("student", set()) | changes.get("resume", set())
+            self._stale_portfolios |= changes.get("portfolio", set())
+
+    def on_change(self, changes: Dict[str, Set[int]]) -> None:
+        with self._lock:
+            self._students |= changes.get("student", set()) | changes.get("resume", set())
+            self._portfolios |= changes.get("portfolio", set())
+            if self._timer is None:
+                self._timer = threading.Timer(DEBOUNCE_SECONDS, self.run)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def run(self) -> None:
+        with self._lock:
+            self._timer = None
+            if not self._students and not self._portfolios:
+                return
+            students, portfolios = self._students, self._portfolios
+            stale_students = self._stale_students | students
+            stale_portfolios = self._stale_portfolios | portfolios
+            self._students, self._portfolios = set(), set()
+            self._stale_students, self._stale_portfolios = set(), set()
+        db = SessionLocal()
+        try:
+            with self._run_lock:
+                if stale_portfolios:
+                    owners = db.query(Portfolio.id, Portfolio.resume_id).filter(Portfolio.id.in_(stale_portfolios))
+                    for portfolio_id, resume_id in owners:
+                        stale_students.add(resume_id)
+                        if portfolio_id in portfolios:
+                            students.add(resume_id)
+                if self._ids is None:
+                    self._ids, self._matrix = load_skill_vectors(db)
+                else:
+                    self._ids, self._matrix = replace_skill_vectors(db, self._ids, self._matrix, stale_students)
+                refresh_similar_talents(db, students, self._ids, self._matrix)
+        except Exception as e:
+            db.rollback()
+            # 벡터가 DB와 어긋났을 수 있으므로 다음 실행 때 전체를 다시 읽음
+            self._ids = self._matrix = None
+            logger.error(f"유사 인재 목록 갱신 중 오류: {str(e)}")
+        finally:
+            db.close()
+
+similar_talent_job = SimilarTalentJob()
+# 결과를 DB(similar_talent)에 쓰므로 커밋한 워커에서만 갱신
+subscribe(similar_talent_job.on_change, remote=False)
+# 다른 워커의 변경도 받아 보관 중인 벡터의 해당 행을 교체
+subscribe(similar_talent_job.invalidate)
@@ -0,0 +1,238 @@
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+from app.models.skill import Base as SkillBase, StudentSkill, ProjectSkill
+
+# 표준 기술 스택 사전: (스킬 ID, 표준 이름, 별칭 목록)
+# ID는 DB에 저장되므로 한 번 부여한 값은 바꾸지 말고 뒤에 추가만 할 것
+SKILLS: List[Tuple[int, str, List[str]]] = [
+    (1, "JavaScript", ["js", "자바스크립트", "ecmascript", "es6"]),
+    (2, "TypeScript", ["ts", "타입스크립트"]),
+    (3, "React", ["reactjs", "react.js", "리액트"]),
+    (4, "Vue.js", ["vue", "vuejs", "뷰", "뷰js"]),
+    (5, "Angular", ["angularjs", "앵귤러"]),
+    (6, "Svelte", ["스벨트"]),
+    (7, "Next.js", ["next", "nextjs", "넥스트"]),
+    (8, "Nuxt.js", ["nuxt", "nuxtjs"]),
+    (9, "Node.js", ["node", "nodejs", "노드", "노드js"]),
+    (10, "Express", ["expressjs", "express.js", "익스프레스"]),
+    (11, "NestJS", ["nest", "nest.js", "네스트"]),
+    (12, "Python", ["py", "파이썬"]),
+    (13, "Django", ["장고"]),
+    (14, "Flask", ["플라스크"]),
+    (15, "FastAPI", ["fast api", "패스트api"]),
+    (16, "Java", ["자바"]),
+    (17, "Spring", ["spring framework", "스프링"]),
+    (18, "Spring Boot", ["springboot", "스프링부트"]),
+    (19, "JPA", ["hibernate"]),
+    (20, "Kotlin", ["코틀린"]),
+    (21, "Swift", ["스위프트"]),
+    (22, "Flutter", ["플러터"]),
+    (23, "React Native", ["reactnative", "rn", "리액트네이티브"]),
+    (24, "Android", ["안드로이드"]),
+    (25, "iOS", ["ios"]),
+    (26, "C", ["c언어"]),
+    (27, "C++", ["cpp", "c plus plus"]),
+    (28, "C#", ["csharp", "c sharp"]),
+    (29, "Go", ["golang", "고랭"]),
+    (30, "Rust", ["러스트"]),
+    (31, "PHP", []),
+    (32, "Ruby", ["루비"]),
+    (33, "Ruby on Rails", ["rails", "ror"]),
+    (34, "HTML", ["html5"]),
+    (35, "CSS", ["css3"]),
+    (36, "Sass", ["scss"]),
+    (37, "Tailwind CSS", ["tailwind", "tailwindcss"]),
+    (38, "Redux", ["리덕스"]),
+    (39, "MySQL", ["마이에스큐엘"]),
+    (40, "PostgreSQL", ["postgres", "postgre", "포스트그레스"]),
+    (41, "MongoDB", ["mongo", "몽고db", "몽고디비"]),
+    (42, "Redis", ["레디스"]),
+    (43, "SQLite", []),
+    (44, "Oracle", ["oracle db", "오라클"]),
+    (45, "Firebase", ["파이어베이스"]),
+    (46, "AWS", ["amazon web services", "아마존웹서비스"]),
+    (47, "GCP", ["google cloud", "google cloud platform"]),
+    (48, "Azure", ["microsoft azure"]),
+    (49, "Docker", ["도커"]),
+    (50, "Kubernetes", ["k8s", "쿠버네티스"]),
+    (51, "Git", ["깃"]),
+    (52, "GitHub Actions", ["github action", "gh actions"]),
+    (53, "Jenkins", ["젠킨스"]),
+    (54, "Linux", ["리눅스"]),
+    (55, "Nginx", ["엔진엑스"]),
+    (56, "GraphQL", ["그래프큐엘"]),
+    (57, "TensorFlow", ["tf", "텐서플로", "텐서플로우"]),
+    (58, "PyTorch", ["torch", "파이토치"]),
+    (59, "scikit-learn", ["sklearn", "사이킷런"]),
+    (60, "Pandas", ["판다스"]),
+    (61, "NumPy", ["넘파이"]),
+    (62, "Figma", ["피그마"]),
+    (63, "Unity", ["유니티"]),
+    (64, "JWT", ["json web token"]),
+    (65, "JSP", []),
+    (66, "jQuery", ["제이쿼리"]),
+    (67, "Elasticsearch", ["elastic search", "엘라스틱서치"]),
+    (68, "Kafka", ["apache kafka", "카프카"]),
+    (69, "Spark", ["apache spark", "스파크"]),
+    (70, "LangChain", ["랭체인"]),
+]
+
+SKILL_NAMES: Dict[int, str] = {skill_id: name for skill_id, name, _ in SKILLS}
+
+_SEPARATOR_RE = re.compile(r"[,/|·]")
+_STRIP_RE = re.compile(r"[\s.\-_]")
+
+def normalize_key(value: str) -> str:
+    """
+    비교용 키로 정규화합니다. (NFKC, 소문자, 공백/점/하이픈/밑줄 제거)
+    """
+    return _STRIP_RE.sub("", unicodedata.normalize("NFKC", value).lower())
+
+class SkillTrie:
+    """
+    별칭 키로 만든 문자 트라이.
+    정확히 일치하는 키를 찾고, 없으면 편집 거리 기반 유사 검색을 수행합니다.
+    """
+    END = "\0"
+
+    def __init__(self):
+        self.root: Dict[str, dict] = {}
+
+    def add(self, key: str, skill_id: int) -> None:
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[self.END] = skill_id
+
+    def get(self, key: str) -> Optional[int]:
+        node = self.root
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node.get(self.END)
+
+    def fuzzy(self, key: str, max_distance: int) -> Optional[int]:
+        """
+        편집 거리(레벤슈타인)가 max_distance 이하인 가장 가까운 키의 스킬 ID를 반환합니다.
+        트라이를 따라가며 DP 행을 갱신하므로 거리 초과 가지는 바로 잘라냅니다.
+        """
+        best: List = [max_distance + 1, None]
+        first_row = list(range(len(key) + 1))
+
+        def walk(node: dict, char: str, previous: List[int]) -> None:
+            row = [previous[0] + 1]
+            for i in range(1, len(key) + 1):
+                cost = 0 if key[i - 1] == char else 1
+                row.append(min(row[i - 1] + 1, previous[i] + 1, previous[i - 1] + cost))
+            if self.END in node and row[-1] < best[0]:
+                best[0], best[1] = row[-1], node[self.END]
+            if min(row) < best[0]:
+                for next_char, child in node.items():
+                    if next_char != self.END:
+                        walk(child, next_char, row)
+
+        for char, child in self.root.items():
+            if char != self.END:
+                walk(child, char, first_row)
+        return best[1]
+
+def _build_trie() -> SkillTrie:
+    trie = SkillTrie()
+    for skill_id, name, aliases in SKILLS:
+        for alias in [name] + aliases:
+            trie.add(normalize_key(alias), skill_id)
+    return trie
+
+_trie = _build_trie()
+
+def resolve_skill(value: str) -> Optional[int]:
+    """
+    자유 입력 기술명을 표준 스킬 ID로 변환합니다. (사전에 없으면 None)
+    짧은 키는 오탐을 막기 위해 정확히 일치할 때만 인정합니다.
+    """
+    key = normalize_key(value)
+    if not key:
+        return None
+    skill_id = _trie.get(key)
+    if skill_id is None and len(key) >= 5:
+        skill_id = _trie.fuzzy(key, 1 if len(key) < 9 else 2)
+    return skill_id
+
+def parse_skill_ids(tech_stack: Optional[str]) -> List[int]:
+    """
+    콤마 등으로 구분된 기술 스택 문자열을 중복 없는 표준 스킬 ID 목록으로 변환합니다.
+    """
+    if not tech_stack:
+        return []
+    ids = (resolve_skill(part) for part in _SEPARATOR_RE.split(tech_stack))
+    return list(dict.fromkeys(skill_id for skill_id in ids if skill_id is not None))
+
+def ensure_skill_tables(bind) -> None:
+    """
+    표준 스킬 테이블(student_skill, project_skill)을 생성합니다. (이미 있으면 무시)
+    기존 데이터의 기술 스택 변환은 migrate_skills.py로 따로 실행합니다.
+    """
+    SkillBase.metadata.create_all(bind=bind)
+
+def split_skills(tech_stack: Optional[str]) -> Tuple[List[int], List[str]]:
+    """
+    기술 스택 문자열을 (표준 스킬 ID 목록, 사전에 없는 기술명 목록)으로 나눕니다.
+    """
+    if not tech_stack:
+        return [], []
+    ids: List[int] = []
+    unknown: List[str] = []
+    for part in _SEPARATOR_RE.split(tech_stack):
+        part = part.strip()
+        if not part:
+            continue
+        skill_id = resolve_skill(part)
+        if skill_id is None:
+            unknown.append(part)
+        elif skill_id not in ids:
+            ids.append(skill_id)
+    return ids, list(dict.fromkeys(unknown))
+
+def assign_student_skills(db: Session, user_id: int, tech_stack: Optional[str]) -> None:
+    """
+    학생 프로필의 기술 스택을 표준 스킬 ID로 저장합니다. (커밋은 호출한 쪽에서 수행)
+    """
+    db.execute(delete(StudentSkill).where(StudentSkill.user_id == user_id))
+    ids = parse_skill_ids(tech_stack)
+    if ids:
+        db.execute(insert(StudentSkill), [{"user_id": user_id, "skill_id": skill_id} for skill_id in ids])
+
+def assign_student_skills_many(db: Session, students: List[Tuple[int, Optional[str]]]) -> None:
+    """
+    여러 학생의 기술 스택을 한 번의 DELETE/INSERT로 저장합니다. [(학생 user_id, 기술 스택), ...]
+    """
+    if not students:
+        return
+    db.execute(delete(StudentSkill).where(StudentSkill.user_id.in_([user_id for user_id, _ in students])))
+    rows = [{"user_id": user_id, "skill_id": skill_id} for user_id, tech_stack in students for skill_id in parse_skill_ids(tech_stack)]
+    if rows:
+        db.execute(insert(StudentSkill), rows)
+
+def assign_project_skills(db: Session, project_id: int, tech_stack: Optional[str]) -> None:
+    """
+    프로젝트의 기술 스택을 표준 스킬 ID로 저장합니다. (커밋은 호출한 쪽에서 수행)
+    """
+    db.execute(delete(ProjectSkill).where(ProjectSkill.project_id == project_id))
+    ids = parse_skill_ids(tech_stack)
+    if ids:
+        db.execute(insert(ProjectSkill), [{"project_id": project_id, "skill_id": skill_id} for skill_id in ids])
+
+def assign_project_skills_many(db: Session, projects: List[Tuple[int, Optional[str]]]) -> None:
+    """
+    여러 프로젝트의 기술 스택을 한 번의 DELETE/INSERT로 저장합니다. [(프로젝트 ID, 기술 스택), ...]
+    """
+    if not projects:
+        return
+    db.execute(delete(ProjectSkill).where(ProjectSkill.project_id.in_([project_id for project_id, _ in projects])))
+    rows = [{"project_id": project_id, "skill_id": skill_id} for project_id, tech_stack in projects for skill_id in parse_skill_ids(tech_stack)]
+    if rows:
+        db.execute(insert(ProjectSkill), rows)
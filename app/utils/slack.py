@@ -1,5 +1,6 @@
-import requests
 import logging
+import time
+from app.utils.metrics import SLACK_LATENCY, SLACK_FAILURES
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,9 @@ def send_slack_message(webhook_url: str, message: str) -> bool:
     Returns:
         bool: 전송 성공 여부
     """
+    # requests는 알림을 처음 보낼 때 불러옴 (앱 시작 시간 단축)
+    import requests
+    start = time.perf_counter()
     try:
         payload = {"text": message}
         response = requests.post(webhook_url, json=payload, timeout=10)
@@ -23,11 +27,16 @@ def send_slack_message(webhook_url: str, message: str) -> bool:
             return True
         else:
             logger.warning(f"Slack 메시지 전송 실패: {response.status_code} - {response.text}")
+            SLACK_FAILURES.inc()
             return False
             
     except requests.exceptions.RequestException as e:
         logger.error(f"Slack 메시지 전송 중 네트워크 오류: {str(e)}")
+        SLACK_FAILURES.inc()
         return False
     except Exception as e:
         logger.error(f"Slack 메시지 전송 중 예상치 못한 오류: {str(e)}")
-        return False 
\ No newline at end of file
+        SLACK_FAILURES.inc()
+        return False
+    finally:
+        SLACK_LATENCY.observe(time.perf_counter() - start) 
\ No newline at end of file
@@ -0,0 +1,215 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+import httpx
+from app.core.config import SessionLocal, SQLALCHEMY_DATABASE_URL
+from app.models.user import User, StudentProfile, UserTypeEnum
+from app.models.portfolio import Portfolio
+from app.models.resume import ResumeBasicInfo
+from app.models.connect import ConnectRequest
+from seed_data import DEFAULT_PASSWORD
+
+# 실제 앱(app.main:app)을 httpx ASGI 전송으로 프로세스 안에서 호출하는 엔드포인트 벤치마크
+# DATABASE_URL에 seed_data.py로 만든 벤치마크 전용 DB를 지정해서 실행하세요.
+# (연결 요청/업로드 시나리오는 DB에 행을 추가하므로 운영 DB에서 실행하면 안 됩니다)
+
+DEFAULT_BASELINE = "bench_baseline.json"
+PERCENTILES = (50, 95, 99)
+WARMUP = 5  # 시나리오마다 측정 전에 버리는 요청 수
+
+# 1x1 PNG (업로드 시나리오용)
+PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+Request = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+def load_fixtures(rng: random.Random) -> Dict[str, List[Any]]:
+    """
+    요청에 사용할 ID/이메일을 DB에서 샘플링합니다.
+    """
+    db = SessionLocal()
+    try:
+        def sample(query, size: int = 1000) -> List[Any]:
+            rows = [tuple(row) if len(row) > 1 else row[0] for row in query.limit(size * 10)]
+            return rng.sample(rows, min(size, len(rows)))
+
+        fixtures = {
+            "resume_ids": sample(db.query(ResumeBasicInfo.id)),
+            "courses": [course for (course,) in db.query(StudentProfile.course_name).distinct()],
+            # 인재 탐색과 같은 규칙으로 portfolio.resume_id = 학생 user_id
+            "portfolios": sample(db.query(Portfolio.id, Portfolio.resume_id), 5000),
+            "companies": sample(db.query(User.id).filter(User.user_type == UserTypeEnum.company)),
+            "students": sample(db.query(User.email).filter(User.user_type == UserTypeEnum.student, User.password_hash.isnot(None))),
+        }
+        connect_offset = db.query(ConnectRequest.id).count()
+    finally:
+        db.close()
+    missing = [name for name, values in fixtures.items() if not values]
+    if missing:
+        print(f"⚠️ 벤치마크용 데이터가 없습니다 ({', '.join(missing)}). seed_data.py를 먼저 실행하세요.")
+        sys.exit(1)
+    fixtures["connect_offset"] = [connect_offset]
+    return fixtures
+
+def build_scenarios(fixtures: Dict[str, List[Any]], rng: random.Random) -> Dict[str, Request]:
+    resume_ids = fixtures["resume_ids"]
+    courses = fixtures["courses"]
+    students = fixtures["students"]
+    companies = fixtures["companies"]
+    portfolios = fixtures["portfolios"]
+    # 같은 (기업, 학생, 포트폴리오) 조합은 중복 요청으로 거절되므로, 이전 실행에서 만든 요청 수만큼 건너뛰어 매번 다른 조합 사용
+    offset = fixtures["connect_offset"][0]
+
+    def talents(client: httpx.AsyncClient, i: int):
+        return client.get("/talents/", params={"course_name": courses[i % len(courses)]})
+
+    def resume_detail(client: httpx.AsyncClient, i: int):
+        return client.get(f"/resumes/{resume_ids[i % len(resume_ids)]}/detail")
+
+    def connect_request(client: httpx.AsyncClient, i: int):
+        n = offset + i
+        company = companies[n % len(companies)]
+        portfolio_id, student_user_id = portfolios[(n // len(companies)) % len(portfolios)]
+        return client.post("/talents/connect-request", json={
+            "company_user_id": company, "student_user_id": student_user_id, "portfolio_id": portfolio_id,
+            "message": "벤치마크 연결 요청입니다.", "position": "백엔드 개발자",
+        })
+
+    def login(client: httpx.AsyncClient, i: int):
+        return client.post("/auth/login", json={"email": students[i % len(students)], "password": DEFAULT_PASSWORD})
+
+    def upload(client: httpx.AsyncClient, i: int):
+        return client.post("/resumes/basic-info/", files={"profile_image": ("bench.png", PNG, "image/png")}, data={
+            "name": "벤치마크", "email": f"bench{i}@example.com", "phone": "010-0000-0000", "job_type": "백엔드 개발자",
+            "school": "서울대학교", "major": "컴퓨터공학과", "grade": "4학년", "period": "2020-2024",
+            "short_intro": "벤치마크", "intro": "벤치마크용 이력서입니다.",
+        })
+
+    return {
+        "talents": talents,
+        "resume_detail": resume_detail,
+        "connect_request": connect_request,
+        "login": login,
+        "upload": upload,
+    }
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+async def run_scenario(client: httpx.AsyncClient, request: Request, requests: int, concurrency: int) -> Dict[str, Any]:
+    """
+    동시에 concurrency개씩 요청을 보내 지연 시간 분포와 처리량을 측정합니다.
+    """
+    latencies: List[float] = []
+    errors = 0
+    uploaded: List[str] = []
+    counter = iter(range(requests))
+
+    def track_upload(response: httpx.Response) -> None:
+        if response.status_code < 400 and response.request.url.path == "/resumes/basic-info/":
+            uploaded.append(response.json().get("profile_image") or "")
+
+    for i in range(WARMUP):
+        track_upload(await request(client, requests + i))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            response = await request(client, i)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+            track_upload(response)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    # 업로드 시나리오가 만든 이미지 파일 정리
+    for url in uploaded:
+        path = os.path.join("app", url.lstrip("/"))
+        if url.startswith("/media/") and os.path.isfile(path):
+            os.remove(path)
+    latencies.sort()
+    result = {f"p{p}_ms": round(percentile(latencies, p) * 1000, 2) for p in PERCENTILES}
+    result.update(requests=requests, errors=errors, rps=round(requests / elapsed, 1))
+    return result
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    from app.main import app
+    import app.routers.talent as talent_router
+    # 벤치마크 중 연결 요청마다 실제 Slack 알림이 나가지 않도록 비활성화
+    talent_router.SLACK_WEBHOOK_URL = ""
+
+    rng = random.Random(args.seed)
+    fixtures = load_fixtures(rng)
+    scenarios = build_scenarios(fixtures, rng)
+    names = args.scenarios or list(scenarios)
+    results = {}
+    # ASGI 전송은 lifespan을 실행하지 않으므로 시작/종료 이벤트(색인 구축 등)를 직접 실행
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name in names:
+                results[name] = await run_scenario(client, scenarios[name], args.requests, args.concurrency)
+                print(f"{name:<16} p50 {results[name]['p50_ms']:8.2f} ms  p95 {results[name]['p95_ms']:8.2f} ms  "
+                      f"p99 {results[name]['p99_ms']:8.2f} ms  {results[name]['rps']:8.1f} req/s  오류 {results[name]['errors']}건")
+    return results
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], threshold: float) -> List[str]:
+    """
+    기준선 대비 p95 지연이 threshold 비율 이상 늘었거나 처리량이 그만큼 줄어든 시나리오를 찾습니다.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {base['p95_ms']} ms -> {result['p95_ms']} ms")
+        if result["rps"] < base["rps"] / (1 + threshold):
+            regressions.append(f"{name}: 처리량 {base['rps']} -> {result['rps']} req/s")
+        if result["errors"] > base["errors"]:
+            regressions.append(f"{name}: 오류 {base['errors']} -> {result['errors']}건")
+    return regressions
+
+def main(args: argparse.Namespace) -> int:
+    print(f"DB: {SQLALCHEMY_DATABASE_URL}, 시나리오당 {args.requests}회, 동시 {args.concurrency}개")
+    results = asyncio.run(run(args))
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"✅ 기준선을 저장했습니다: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"ℹ️ 기준선 파일이 없습니다. --save로 먼저 저장하세요: {args.baseline}")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions = compare(results, json.load(f), args.threshold)
+    if regressions:
+        print(f"❌ 기준선 대비 {args.threshold:.0%} 넘게 느려졌습니다:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print(f"✅ 기준선 대비 {args.threshold:.0%} 이내입니다.")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="엔드포인트 지연 시간/처리량 벤치마크")
+    parser.add_argument("--requests", type=int, default=200, help="시나리오당 측정 요청 수 (기본값: 200)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수 (기본값: 8)")
+    parser.add_argument("--scenarios", nargs="*", choices=["talents", "resume_detail", "connect_request", "login", "upload"],
+                        help="실행할 시나리오 (기본값: 전체)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help=f"기준선 JSON 파일 (기본값: {DEFAULT_BASELINE})")
+    parser.add_argument("--save", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용 회귀 비율 (기본값: 0.2 = 20%%)")
+    parser.add_argument("--seed", type=int, default=42, help="요청 순서 난수 시드")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,63 @@
+import sys
+import time
+from datetime import datetime
+from typing import List
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from app.models.project import Project
+from app.schemas.project import ProjectResponse
+from app.utils.serialization import fast_json, to_rows
+
+ROWS = 10000
+REPEAT = 5
+
+def make_projects(count: int) -> List[Project]:
+    """
+    DB 없이 직렬화 비용만 재기 위한 프로젝트 객체를 만듭니다.
+    """
+    now = datetime.utcnow()
+    return [
+        Project(
+            id=i, portfolio_id=i // 5, project_name=f"프로젝트 {i}", project_period="2024.01 - 2024.03",
+            project_intro="온라인 쇼핑몰의 결제 시스템 개발", description="사용자가 상품을 선택하고 결제할 수 있는 시스템을 개발했습니다. " * 3,
+            role="백엔드 개발", tech_stack="Node.js, Express, MongoDB, JWT", github_url=None, created_at=now, updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+def bench(label: str, func, rows: int) -> float:
+    best = float("inf")
+    size = 0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        size = len(func())
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} 전체 {best * 1000:8.1f} ms  행당 {best / rows * 1e6:6.2f} µs  ({size / 1024:.0f} KiB)")
+    return best
+
+def main(rows: int = ROWS) -> None:
+    projects = make_projects(rows)
+    adapter = TypeAdapter(List[ProjectResponse])
+    print(f"프로젝트 {rows}행 직렬화 (최소 {REPEAT}회 중 최솟값)")
+    # response_model=List[ProjectResponse]: ORM 객체를 스키마로 검증한 뒤 pydantic이 JSON 바이트로 직렬화
+    validated = bench("response_model 검증 + pydantic dump_json", lambda: adapter.dump_json(
+        adapter.validate_python(projects, from_attributes=True)), rows)
+    # response_model 없이 ORM 객체를 그대로 반환 (jsonable_encoder가 vars()를 순회)
+    encoded = bench("jsonable_encoder + JSONResponse", lambda: JSONResponse(jsonable_encoder(projects)).body, rows)
+    fast = bench("to_rows + orjson (fast_json)", lambda: fast_json(to_rows(projects, ProjectResponse)).body, rows)
+    print(f"검증 경로 대비 {validated / fast:.1f}배, jsonable_encoder 대비 {encoded / fast:.1f}배 빠름")
+
+    # 인재 목록처럼 이미 dict로 만든 행: response_model=List[dict] 재검증 vs orjson 직접 인코딩
+    talents = [{"portfolio_id": p.portfolio_id, "student_user_id": p.id, "student_email": f"user{p.id}@example.com",
+                "course_name": "웹개발 과정", "tech_stack": p.tech_stack, "project_name": p.project_name,
+                "project_intro": p.project_intro, "is_representative": p.id % 5 == 0, "project_image_url": None}
+               for p in projects]
+    dict_adapter = TypeAdapter(List[dict])
+    print(f"\n인재 목록 dict {rows}행 직렬화")
+    validated = bench("response_model=List[dict] + dump_json", lambda: dict_adapter.dump_json(dict_adapter.validate_python(talents)), rows)
+    fast = bench("orjson (fast_json)", lambda: fast_json(talents).body, rows)
+    print(f"검증 경로 대비 {validated / fast:.1f}배 빠름")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS)
@@ -0,0 +1,101 @@
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# 앱 시작(import app.main) 시간 벤치마크
+# 새 프로세스에서 python -X importtime으로 app.main을 불러와 모듈별 import 시간을 집계하고,
+# 기준선 대비 느려졌거나 지연 로딩해야 할 모듈이 시작 시점에 불러와지면 실패(종료 코드 1)합니다.
+
+DEFAULT_BASELINE = "startup_baseline.json"
+# 드물게 쓰이는 기능이라 처음 사용할 때 불러와야 하는 모듈 (OAuth, Slack 알림, 입력 폼 템플릿, 비밀번호 해시)
+LAZY_MODULES = ("authlib", "requests", "jinja2", "passlib")
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+def measure() -> Tuple[float, List[Tuple[str, int, int]]]:
+    """
+    새 프로세스에서 app.main을 한 번 불러오고 (전체 소요 시간(초), [(모듈, 자체 µs, 누적 µs)])를 반환합니다.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True, env=dict(os.environ, PYTHONWARNINGS="ignore"),
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        sys.exit(1)
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            modules.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return elapsed, modules
+
+def by_package(modules: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    # 최상위 패키지별 자체 import 시간 합계 (µs)
+    totals: Dict[str, int] = {}
+    for name, self_us, _ in modules:
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + self_us
+    return totals
+
+def run(runs: int, top: int) -> Dict[str, float]:
+    measure()  # 바이트코드 캐시(__pycache__) 생성용으로 한 번 버림
+    samples = [measure() for _ in range(runs)]
+    elapsed = [e for e, _ in samples]
+    imports = [next((c for name, _, c in modules if name == "app.main"), 0) / 1000 for _, modules in samples]
+    _, modules = samples[len(samples) // 2]
+
+    print(f"{'패키지':<28}{'import 시간':>12}")
+    for package, total in sorted(by_package(modules).items(), key=lambda item: -item[1])[:top]:
+        print(f"{package:<28}{total / 1000:>9.1f} ms")
+    return {
+        "process_ms": round(statistics.median(elapsed) * 1000, 1),
+        "import_ms": round(statistics.median(imports), 1),
+        "modules": len(modules),
+        "eager": sorted({name.split(".")[0] for name, _, _ in modules} & set(LAZY_MODULES)),
+    }
+
+def main(args: argparse.Namespace) -> int:
+    result = run(args.runs, args.top)
+    print(f"\nimport app.main {result['import_ms']} ms (프로세스 전체 {result['process_ms']} ms, 모듈 {result['modules']}개, {args.runs}회 중앙값)")
+    failures = []
+    if result["eager"]:
+        failures.append(f"시작 시점에 불러온 지연 로딩 대상: {', '.join(result['eager'])}")
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"✅ 기준선을 저장했습니다: {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if result["import_ms"] > baseline["import_ms"] * (1 + args.threshold):
+            failures.append(f"import 시간 {baseline['import_ms']} ms -> {result['import_ms']} ms")
+    else:
+        print(f"ℹ️ 기준선 파일이 없습니다. --save로 먼저 저장하세요: {args.baseline}")
+    if args.budget_ms and result["import_ms"] > args.budget_ms:
+        failures.append(f"import 시간 {result['import_ms']} ms가 예산 {args.budget_ms} ms 초과")
+    if failures:
+        print("❌ 시작 시간 점검 실패:")
+        for line in failures:
+            print(f"  - {line}")
+        return 1
+    print("✅ 시작 시간 점검 통과")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="앱 시작(import) 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (기본값: 5)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 패키지 수 (기본값: 15)")
+    parser.add_argument("--budget-ms", type=float, default=0, help="import 시간 절대 예산 (ms, 0이면 사용 안 함)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help=f"기준선 JSON 파일 (기본값: {DEFAULT_BASELINE})")
+    parser.add_argument("--save", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용 회귀 비율 (기본값: 0.2 = 20%%)")
+    sys.exit(main(parser.parse_args()))
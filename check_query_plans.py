@@ -0,0 +1,190 @@
+import argparse
+import importlib
+import json
+import pkgutil
+import re
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from app.core.config import engine, SessionLocal, SQLALCHEMY_DATABASE_URL
+from app.models.user import User, StudentProfile, UserTypeEnum
+from app.models.portfolio import Portfolio
+from app.models.project import Project
+from app.models.resume import ResumeBasicInfo
+
+# 핫 경로 쿼리 실행 계획 점검
+# 각 라우트를 프로세스 안에서 호출하며 실제로 실행된 SELECT를 모두 기록한 뒤,
+# SQLite는 EXPLAIN QUERY PLAN, PostgreSQL은 EXPLAIN (FORMAT JSON)으로 실행 계획을 받아
+# 큰 테이블을 인덱스 없이 전체 스캔하는 쿼리가 있으면 실패(종료 코드 1)합니다.
+# 스키마 변경으로 인덱스가 빠지면 운영에 나가기 전에 잡아내기 위한 용도이며,
+# 계획이 데이터 분포에 따라 달라지므로 seed_data.py로 만든 DB에서 실행하세요.
+# 쓰기 라우트(연결 요청 생성)도 실제로 호출하지만, 모든 요청을 끝에 롤백하는 트랜잭션 안에서 실행하므로 DB는 바뀌지 않습니다.
+
+# 전체 스캔이 허용되지 않는 큰 테이블
+LARGE_TABLES = {
+    "user", "student_profile", "resume_basic_info", "portfolio", "project", "award", "education",
+    "connect_request", "student_skill", "project_skill", "similar_talent",
+}
+
+_SQLITE_SCAN_RE = re.compile(r"^SCAN (\w+)")
+
+class QueryRecorder:
+    """
+    엔진에서 실행되는 SELECT 문과 파라미터를 기록합니다.
+    """
+
+    def __init__(self):
+        self.queries: List[Tuple[str, Any]] = []
+        self.enabled = False
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.enabled and not executemany and statement.lstrip().upper().startswith("SELECT"):
+            self.queries.append((statement, parameters))
+
+def sqlite_scans(conn, statement: str, parameters: Any) -> Tuple[List[str], Set[str]]:
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    plan = [row[-1] for row in rows]
+    scans = set()
+    for detail in plan:
+        match = _SQLITE_SCAN_RE.match(detail)
+        # "SCAN t USING INDEX ..."도 인덱스 전체를 읽는 것이므로 전체 스캔으로 취급
+        if match:
+            scans.add(match.group(1))
+    return plan, scans
+
+def _walk(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+def postgres_scans(conn, statement: str, parameters: Any) -> Tuple[List[str], Set[str]]:
+    (result,) = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).one()
+    root = (result if isinstance(result, list) else json.loads(result))[0]["Plan"]
+    plan, scans = [], set()
+    for node in _walk(root):
+        relation = node.get("Relation Name")
+        plan.append(f"{node['Node Type']}{' on ' + relation if relation else ''}" + (f" using {node['Index Name']}" if node.get("Index Name") else ""))
+        if node["Node Type"] == "Seq Scan" and relation:
+            scans.add(relation)
+    return plan, scans
+
+def load_fixtures() -> Optional[Dict[str, Any]]:
+    db = SessionLocal()
+    try:
+        portfolio = db.query(Portfolio.id, Portfolio.resume_id).join(Project, Project.portfolio_id == Portfolio.id).first()
+        company = db.query(User.id).filter(User.user_type == UserTypeEnum.company).first()
+        resume = db.query(ResumeBasicInfo.id).first()
+        course = db.query(StudentProfile.course_name).first()
+        if not (portfolio and company and resume and course):
+            return None
+        portfolio_ids = [i for (i,) in db.query(Portfolio.id).limit(20)]
+        return {
+            "portfolio_id": portfolio.id, "student_user_id": portfolio.resume_id, "company_user_id": company.id,
+            "resume_id": resume.id, "course_name": course.course_name, "portfolio_ids": portfolio_ids,
+        }
+    finally:
+        db.close()
+
+def routes(f: Dict[str, Any]) -> List[Tuple[str, str, str, Dict[str, Any], Set[str]]]:
+    """
+    점검할 요청 목록: (이름, 메서드, 경로, 옵션, 전체 스캔을 허용할 테이블)
+    """
+    ids = ",".join(map(str, f["portfolio_ids"]))
+    return [
+        # 조건 없는 인재 목록은 모든 포트폴리오를 반환하므로 portfolio 전체 스캔이 정상
+        ("list_talents", "GET", "/talents/", {}, {"portfolio"}),
+        ("list_talents(course_name)", "GET", "/talents/", {"params": {"course_name": f["course_name"]}}, set()),
+        ("list_talents(tech_stack)", "GET", "/talents/", {"params": {"tech_stack": "React"}}, set()),
+        ("get_resume_detail", "GET", f"/resumes/{f['resume_id']}/detail", {}, set()),
+        ("get_resume_detail(fields)", "GET", f"/resumes/{f['resume_id']}/detail", {"params": {"fields": "resume(name),projects(id,project_name)"}}, set()),
+        ("get_portfolios", "GET", "/portfolios/", {"params": {"resume_id": f["resume_id"]}}, set()),
+        ("get_projects", "GET", "/projects/", {"params": {"portfolio_id": f["portfolio_id"]}}, set()),
+        ("get_projects(portfolio_ids)", "GET", "/projects/", {"params": {"portfolio_ids": ids, "limit_per_portfolio": 3}}, set()),
+        ("create_connect_request", "POST", "/talents/connect-request", {"json": {
+            "company_user_id": f["company_user_id"], "student_user_id": f["student_user_id"], "portfolio_id": f["portfolio_id"],
+            "message": "실행 계획 점검",
+        }}, set()),
+    ]
+
+def override_sessions(app, conn) -> None:
+    """
+    모든 라우터의 get_db를 conn(바깥 트랜잭션이 열린 연결)에 묶인 세션으로 바꿉니다.
+    라우트의 commit/rollback은 SAVEPOINT에만 적용되고, 바깥 트랜잭션은 커밋하지 않고 롤백합니다.
+    """
+    session_factory = sessionmaker(bind=conn, autoflush=False, expire_on_commit=False, join_transaction_mode="create_savepoint")
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    import app.routers as routers
+    for module in pkgutil.iter_modules(routers.__path__):
+        router_module = importlib.import_module(f"app.routers.{module.name}")
+        if hasattr(router_module, "get_db"):
+            app.dependency_overrides[router_module.get_db] = get_db
+
+def main(verbose: bool) -> int:
+    from fastapi.testclient import TestClient
+    from app.main import app
+    import app.routers.talent as talent_router
+    # 점검용 연결 요청마다 실제 Slack 알림이 나가지 않도록 비활성화
+    talent_router.SLACK_WEBHOOK_URL = ""
+
+    fixtures = load_fixtures()
+    if fixtures is None:
+        print("⚠️ 점검용 데이터가 없습니다. seed_data.py를 먼저 실행하세요.")
+        return 1
+    postgres = engine.dialect.name == "postgresql"
+    explain = postgres_scans if postgres else sqlite_scans
+    recorder = QueryRecorder()
+    event.listen(engine, "before_cursor_execute", recorder)
+    failed_routes = 0
+    conn = engine.connect()
+    outer = conn.begin()
+    override_sessions(app, conn)
+    try:
+        with TestClient(app) as client:
+            for name, method, path, options, allowed in routes(fixtures):
+                failures = 0
+                recorder.queries = []
+                recorder.enabled = True
+                try:
+                    response = client.request(method, path, **options)
+                finally:
+                    recorder.enabled = False
+                if response.status_code >= 400 and not (name == "create_connect_request" and response.status_code == 400):
+                    print(f"❌ {name}: 요청 실패 {response.status_code} {response.text[:200]}")
+                    failed_routes += 1
+                    continue
+                for statement, parameters in recorder.queries:
+                    plan, scans = explain(conn, statement, parameters)
+                    bad = (scans & LARGE_TABLES) - allowed
+                    if bad:
+                        failures += 1
+                        print(f"❌ {name}: 전체 스캔 {', '.join(sorted(bad))}")
+                    elif verbose:
+                        print(f"✅ {name}")
+                    if bad or verbose:
+                        print("   " + " ".join(statement.split())[:300])
+                        for line in plan:
+                            print(f"     - {line}")
+                print(f"{'❌' if failures else '✅'} {name}: 쿼리 {len(recorder.queries)}개 점검")
+                failed_routes += bool(failures)
+    finally:
+        event.remove(engine, "before_cursor_execute", recorder)
+        app.dependency_overrides.clear()
+        # 점검 중 라우트가 쓴 데이터(연결 요청 등)는 모두 버림
+        outer.rollback()
+        conn.close()
+    return 1 if failed_routes else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="핫 경로 쿼리 실행 계획 점검 (큰 테이블 전체 스캔 검출)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="모든 쿼리의 실행 계획 출력")
+    args = parser.parse_args()
+    print(f"🔍 실행 계획 점검을 시작합니다... (DB: {SQLALCHEMY_DATABASE_URL})")
+    sys.exit(main(args.verbose))
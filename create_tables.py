@@ -7,6 +7,10 @@ from app.models.project import Project
 from app.models.award import Award
 from app.models.education import Education
 from app.models.connect import ConnectRequest
+from app.models.similar import Base as SimilarBase
+from app.models.skill import Base as SkillBase
+from app.models.change_log import Base as ChangeLogBase
+from app.utils.search import ensure_search_index, rebuild_search_index
 from datetime import datetime
 
 def create_tables():
@@ -17,6 +21,12 @@ def create_tables():
     
     # 모든 테이블 생성
     Base.metadata.create_all(bind=engine)
+    SimilarBase.metadata.create_all(bind=engine)
+    SkillBase.metadata.create_all(bind=engine)
+    ChangeLogBase.metadata.create_all(bind=engine)
+    
+    # 전문 검색 인덱스 생성
+    ensure_search_index(engine)
     
     print("✅ 모든 테이블이 성공적으로 생성되었습니다!")
     
@@ -91,6 +101,8 @@ def create_tables():
             db.add(test_project)
             db.commit()
             print("✅ 테스트 데이터가 성공적으로 생성되었습니다!")
+            rebuild_search_index(db)
+            print("✅ 전문 검색 인덱스가 갱신되었습니다!")
         except Exception as e:
             print(f"⚠️ 테스트 데이터 생성 중 오류: {e}")
             db.rollback()
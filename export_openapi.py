@@ -0,0 +1,37 @@
+import argparse
+import os
+import sys
+from app.core.config import OPENAPI_SCHEMA_PATH
+from app.utils.openapi import build_schema, dump_schema
+
+# 배포 빌드 단계에서 OpenAPI 스키마를 정적 파일로 생성합니다.
+# 운영 서버(APP_ENV=production)는 이 파일을 읽어 /openapi.json으로 그대로 제공합니다.
+
+def main(output: str, check: bool) -> int:
+    from app.main import app
+    body = dump_schema(build_schema(app))
+    if check:
+        # CI용: 커밋/배포된 스키마가 현재 코드와 같은지 확인
+        try:
+            with open(output, "rb") as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != body:
+            print(f"❌ {output}가 현재 라우트와 다릅니다. python export_openapi.py로 다시 생성하세요.")
+            return 1
+        print(f"✅ {output}가 최신입니다.")
+        return 0
+    tmp = output + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, output)
+    print(f"✅ OpenAPI 스키마를 저장했습니다: {output} ({len(body):,}바이트)")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenAPI 스키마 정적 파일 생성")
+    parser.add_argument("--output", default=OPENAPI_SCHEMA_PATH, help=f"저장할 파일 (기본값: {OPENAPI_SCHEMA_PATH})")
+    parser.add_argument("--check", action="store_true", help="파일을 쓰지 않고 최신인지 확인만 함")
+    args = parser.parse_args()
+    sys.exit(main(args.output, args.check))
@@ -0,0 +1,27 @@
+import sys
+import time
+from app.core.config import SessionLocal
+from app.crud.student import import_students, IMPORT_BATCH_SIZE
+
+def main(path: str, batch_size: int):
+    """
+    학생 CSV 파일로 계정을 일괄 등록합니다. (email,password,course_name,course_generation,tech_stack)
+    """
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            result = import_students(db, f, batch_size=batch_size)
+    finally:
+        db.close()
+    for error in result["errors"]:
+        print(f"  ⚠️ {error['line']}번째 줄 ({error['email'] or '-'}): {error['detail']}")
+    print(f"✅ {result['created']}명 등록, {result['failed']}건 실패 ({time.perf_counter() - started:.1f}초)")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python import_students.py <students.csv> [배치 크기]")
+        sys.exit(1)
+    print("🔄 학생 계정 일괄 등록을 시작합니다...")
+    main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else IMPORT_BATCH_SIZE)
+    print("🎉 완료!")
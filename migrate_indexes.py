@@ -0,0 +1,31 @@
+from sqlalchemy import text
+from app.core.config import engine
+
+# (인덱스 이름, 테이블, 컬럼) - 모델의 index=True / Index와 같은 이름을 사용
+INDEXES = [
+    ("ix_project_portfolio_id", "project", "portfolio_id"),
+    ("ix_portfolio_resume_id", "portfolio", "resume_id"),
+    ("ix_award_resume_id", "award", "resume_id"),
+    ("ix_education_resume_id", "education", "resume_id"),
+    ("ix_student_profile_course_name", "student_profile", "course_name"),
+    ("ix_connect_request_pair", "connect_request", "company_user_id, student_user_id, portfolio_id"),
+]
+
+def migrate_indexes():
+    """
+    기존 데이터베이스에 참조 컬럼 인덱스를 추가합니다. (이미 있으면 무시)
+    """
+    with engine.connect() as conn:
+        for name, table, column in INDEXES:
+            try:
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})"))
+                conn.commit()
+                print(f"{name} 인덱스가 생성되었습니다.")
+            except Exception as e:
+                conn.rollback()
+                print(f"{name} 인덱스 생성 중 오류 발생: {e}")
+
+if __name__ == "__main__":
+    print("인덱스 마이그레이션을 시작합니다...")
+    migrate_indexes()
+    print("마이그레이션이 완료되었습니다.")
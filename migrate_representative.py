@@ -0,0 +1,32 @@
+from sqlalchemy import text
+from app.core.config import engine
+
+def migrate_representative():
+    """
+    이력서당 대표 포트폴리오를 하나로 제한하는 부분 유니크 인덱스를 추가합니다.
+    이미 대표가 여러 개인 이력서는 가장 최근에 만든 포트폴리오만 대표로 남깁니다.
+    """
+    with engine.connect() as conn:
+        result = conn.execute(text("""
+            UPDATE portfolio SET is_representative = false
+            WHERE is_representative AND id NOT IN (
+                SELECT MAX(id) FROM portfolio WHERE is_representative GROUP BY resume_id
+            )
+        """))
+        conn.commit()
+        print(f"중복 대표 포트폴리오 {result.rowcount}개를 해제했습니다.")
+
+        try:
+            conn.execute(text("""
+                CREATE UNIQUE INDEX IF NOT EXISTS uq_portfolio_representative
+                ON portfolio (resume_id) WHERE is_representative
+            """))
+            conn.commit()
+            print("대표 포트폴리오 유니크 인덱스가 생성되었습니다.")
+        except Exception as e:
+            print(f"인덱스 생성 중 오류 발생: {e}")
+
+if __name__ == "__main__":
+    print("대표 포트폴리오 마이그레이션을 시작합니다...")
+    migrate_representative()
+    print("마이그레이션이 완료되었습니다.")
@@ -0,0 +1,33 @@
+from app.core.config import engine, SessionLocal
+from app.models.skill import Base
+from app.models.user import StudentProfile
+from app.models.project import Project
+from app.utils.skills import assign_student_skills, assign_project_skills
+
+def migrate_skills():
+    """
+    기존 학생 프로필/프로젝트의 기술 스택 문자열을 표준 스킬 ID로 변환해 저장합니다.
+    """
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        students = db.query(StudentProfile.user_id, StudentProfile.tech_stack).all()
+        for user_id, tech_stack in students:
+            assign_student_skills(db, user_id, tech_stack)
+        print(f"학생 {len(students)}명의 기술 스택을 변환했습니다.")
+
+        projects = db.query(Project.id, Project.tech_stack).all()
+        for project_id, tech_stack in projects:
+            assign_project_skills(db, project_id, tech_stack)
+        print(f"프로젝트 {len(projects)}개의 기술 스택을 변환했습니다.")
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"기술 스택 변환 중 오류 발생: {e}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("기술 스택 표준화 마이그레이션을 시작합니다...")
+    migrate_skills()
+    print("마이그레이션이 완료되었습니다.")
\ No newline at end of file
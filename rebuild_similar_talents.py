@@ -0,0 +1,20 @@
+from app.core.config import engine, SessionLocal
+from app.models.similar import Base
+from app.utils.similar import rebuild_similar_talents
+
+def main():
+    """
+    전체 학생의 유사 인재 목록을 다시 계산합니다. (최초 도입 또는 주기적 전체 갱신용)
+    """
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        count = rebuild_similar_talents(db)
+        print(f"✅ {count}명의 유사 인재 목록을 갱신했습니다.")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("🔄 유사 인재 목록 전체 재계산을 시작합니다...")
+    main()
+    print("🎉 완료!")
\ No newline at end of file
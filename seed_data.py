@@ -0,0 +1,290 @@
+import argparse
+import csv
+import io
+import random
+import time
+from bisect import bisect
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Dict, List, Sequence
+from sqlalchemy import func, select, text
+from app.core.config import engine, SessionLocal
+from app.models.user import Base, User, StudentProfile, CompanyProfile
+from app.models.resume import Base as ResumeBase, ResumeBasicInfo
+from app.models.portfolio import Base as PortfolioBase, Portfolio
+from app.models.project import Base as ProjectBase, Project
+from app.models.award import Base as AwardBase, Award
+from app.models.education import Base as EducationBase, Education
+from app.models.connect import Base as ConnectBase
+from app.models.similar import Base as SimilarBase
+from app.models.skill import Base as SkillBase
+from app.utils.auth import hash_password
+from app.utils.search import ensure_search_index, rebuild_search_index
+from app.utils.skills import SKILL_NAMES
+
+# 부하/실행 계획 테스트용 대량 데이터 생성기
+# 같은 --seed와 같은 초기 DB 상태라면 항상 같은 데이터를 만듭니다.
+# 기존 데이터 뒤에 이어서(각 테이블 최대 ID 다음부터) 추가합니다.
+
+DEFAULT_PASSWORD = "lionconnect123!"  # 생성된 모든 계정의 비밀번호
+CHUNK_STUDENTS = 2000                 # 한 트랜잭션에서 생성하는 학생 수 (하위 데이터 포함)
+BASE_TIME = datetime(2025, 3, 1)      # 생성 시각 기준 (실행 시각과 무관하게 같은 데이터가 나오도록 고정)
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍전고문양손배백허유남심노하곽성차주우구민"
+GIVEN = "민서준지현우수영하은도윤재연성진예원시호유나태아채희주혜경동건소정승다인경훈"
+SCHOOLS = ["서울대학교", "연세대학교", "고려대학교", "성균관대학교", "한양대학교", "중앙대학교", "경희대학교", "한국외국어대학교",
+           "서울시립대학교", "건국대학교", "동국대학교", "홍익대학교", "국민대학교", "숭실대학교", "세종대학교", "광운대학교",
+           "부산대학교", "경북대학교", "전남대학교", "충남대학교", "인하대학교", "아주대학교", "한국방송통신대학교"]
+MAJORS = ["컴퓨터공학과", "소프트웨어학과", "정보통신공학과", "전자공학과", "산업공학과", "인공지능학과", "데이터사이언스학과",
+          "경영학과", "경제학과", "통계학과", "수학과", "시각디자인학과", "산업디자인학과", "국어국문학과", "영어영문학과", "심리학과"]
+GRADES = ["1학년", "2학년", "3학년", "4학년", "졸업", "졸업 예정", "휴학"]
+JOB_TYPES = ["프론트엔드 개발자", "백엔드 개발자", "풀스택 개발자", "데이터 분석가", "AI 엔지니어", "iOS 개발자",
+             "안드로이드 개발자", "UI/UX 디자이너", "DevOps 엔지니어", "게임 개발자"]
+COURSES = ["프론트엔드 과정", "백엔드 과정", "AI 과정", "데이터 분석 과정", "iOS 과정", "안드로이드 과정",
+           "UX/UI 디자인 과정", "클라우드 엔지니어링 과정", "블록체인 과정"]
+TOPICS = ["쇼핑몰", "중고거래", "여행 일정", "반려동물 돌봄", "헬스케어", "가계부", "스터디 매칭", "맛집 추천", "중고책 거래",
+          "동네 커뮤니티", "일정 관리", "실시간 채팅", "음악 추천", "부동산 정보", "날씨 알림", "레시피 공유", "공연 예매",
+          "자전거 대여", "봉사활동 매칭", "취업 정보", "온라인 강의", "택배 조회", "캠핑장 예약", "운동 기록"]
+KINDS = ["웹 서비스", "앱", "플랫폼", "대시보드", "API 서버", "챗봇", "추천 시스템"]
+FEATURES = ["회원가입/로그인", "결제", "실시간 알림", "검색", "추천", "관리자 페이지", "지도 연동", "이미지 업로드",
+            "채팅", "통계 대시보드", "소셜 로그인", "리뷰 작성", "예약", "무한 스크롤", "다크 모드"]
+ROLES = ["프론트엔드 개발", "백엔드 개발", "풀스택 개발", "기획 및 디자인", "데이터 분석", "인프라 구축", "팀장 및 백엔드 개발"]
+STRENGTHS = ["문제 해결", "협업", "꼼꼼한 테스트", "빠른 학습", "사용자 경험 개선", "성능 최적화", "문서화", "코드 리뷰"]
+AWARDS = [("정보처리기사", "한국산업인력공단"), ("SQLD", "한국데이터산업진흥원"), ("ADsP", "한국데이터산업진흥원"),
+          ("TOEIC 850", "ETS"), ("OPIc IH", "ACTFL"), ("리눅스마스터 2급", "한국정보통신진흥협회"),
+          ("멋쟁이사자처럼 해커톤 대상", "멋쟁이사자처럼"), ("교내 SW 경진대회 우수상", "소프트웨어중심대학사업단"),
+          ("AWS Certified Cloud Practitioner", "Amazon Web Services"), ("컴퓨터활용능력 1급", "대한상공회의소")]
+EDUCATIONS = [("멋쟁이사자처럼", "프론트엔드 부트캠프"), ("멋쟁이사자처럼", "백엔드 부트캠프"), ("멋쟁이사자처럼", "AI 엔지니어링 부트캠프"),
+              ("삼성 청년 SW 아카데미", "SSAFY"), ("우아한테크코스", "웹 백엔드"), ("네이버 부스트캠프", "웹·모바일"),
+              ("42서울", "본과정"), ("코드스테이츠", "데이터 분석 부트캠프")]
+INDUSTRIES = ["IT/소프트웨어", "이커머스", "핀테크", "게임", "교육", "헬스케어", "모빌리티", "미디어"]
+COMPANY_SIZES = ["스타트업", "중소기업", "중견기업", "대기업"]
+
+ZIPF_EXPONENT = 1.1
+_SKILL_IDS = sorted(SKILL_NAMES)
+# 사전 순서를 인기 순위로 보고 Zipf 분포로 기술 스택을 뽑음 (JavaScript가 가장 흔하고 뒤로 갈수록 드묾)
+_SKILL_WEIGHTS = list(accumulate(1.0 / (rank ** ZIPF_EXPONENT) for rank in range(1, len(_SKILL_IDS) + 1)))
+
+def pick_skills(rng: random.Random, count: int) -> List[int]:
+    total = _SKILL_WEIGHTS[-1]
+    picked = (_SKILL_IDS[bisect(_SKILL_WEIGHTS, rng.random() * total)] for _ in range(count))
+    return list(dict.fromkeys(picked))
+
+def _stamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+class Writer:
+    """
+    테이블별로 행(튜플)을 모았다가 PostgreSQL은 COPY, SQLite는 executemany로 기록합니다.
+    """
+
+    def __init__(self, conn, batch_size: int):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.postgres = conn.dialect.name == "postgresql"
+        self.rows: Dict[str, List[tuple]] = {}
+        self.columns: Dict[str, Sequence[str]] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, table: str, columns: Sequence[str], row: tuple) -> None:
+        self.columns[table] = columns
+        rows = self.rows.setdefault(table, [])
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            self.flush(table)
+
+    def flush(self, table: str) -> None:
+        rows = self.rows.get(table)
+        if not rows:
+            return
+        columns = self.columns[table]
+        if self.postgres:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            cursor = self.conn.connection.cursor()
+            cursor.copy_expert(f'COPY "{table}" ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)', buffer)
+        else:
+            placeholders = ", ".join("?" for _ in columns)
+            self.conn.exec_driver_sql(f'INSERT INTO "{table}" ({", ".join(columns)}) VALUES ({placeholders})', rows)
+        self.counts[table] = self.counts.get(table, 0) + len(rows)
+        self.rows[table] = []
+
+    def flush_all(self) -> None:
+        for table in list(self.rows):
+            self.flush(table)
+
+USER_COLUMNS = ("id", "email", "password_hash", "user_type", "name", "created_at", "updated_at")
+STUDENT_COLUMNS = ("id", "user_id", "course_name", "course_generation", "tech_stack")
+COMPANY_COLUMNS = ("id", "user_id", "company_name", "industry", "size", "intro", "email_verified")
+RESUME_COLUMNS = ("id", "user_id", "name", "email", "phone", "job_type", "school", "major", "grade", "period",
+                  "short_intro", "intro", "age", "created_at", "updated_at")
+PORTFOLIO_COLUMNS = ("id", "resume_id", "is_representative", "project_url", "project_name", "project_intro",
+                     "project_period", "role", "created_at", "updated_at")
+PROJECT_COLUMNS = ("id", "portfolio_id", "project_name", "project_period", "project_intro", "description", "role",
+                   "tech_stack", "github_url", "created_at", "updated_at")
+AWARD_COLUMNS = ("id", "resume_id", "name", "date", "organization", "created_at")
+EDUCATION_COLUMNS = ("id", "resume_id", "institution", "period", "name", "created_at")
+
+class Seeder:
+    def __init__(self, rng: random.Random, next_ids: Dict[str, int], args: argparse.Namespace, password_hash: str):
+        self.rng = rng
+        self.ids = next_ids
+        self.args = args
+        self.password_hash = password_hash
+        self.now = BASE_TIME
+
+    def _next(self, table: str) -> int:
+        value = self.ids[table]
+        self.ids[table] += 1
+        return value
+
+    def _count(self, average: int) -> int:
+        # 평균이 average인 0 ~ 2 * average 사이 정수
+        return self.rng.randint(0, 2 * average) if average else 0
+
+    def _moment(self) -> datetime:
+        return self.now - timedelta(seconds=self.rng.randint(0, 3 * 365 * 24 * 3600))
+
+    def _period(self) -> str:
+        year = self.rng.randint(2019, 2025)
+        month = self.rng.randint(1, 12)
+        months = self.rng.randint(1, 6)
+        end_year, end_month = year + (month + months - 1) // 12, (month + months - 1) % 12 + 1
+        return f"{year}.{month:02d} - {end_year}.{end_month:02d}"
+
+    def _name(self) -> str:
+        return self.rng.choice(SURNAMES) + self.rng.choice(GIVEN) + self.rng.choice(GIVEN)
+
+    def student(self, w: Writer) -> None:
+        rng = self.rng
+        user_id = self._next("user")
+        created = _stamp(self._moment())
+        name = self._name()
+        email = f"student{user_id}@example.com"
+        skill_ids = pick_skills(rng, rng.randint(2, 6))
+        skills = [SKILL_NAMES[skill_id] for skill_id in skill_ids]
+        course = rng.choice(COURSES)
+        job_type = rng.choice(JOB_TYPES)
+        w.add("user", USER_COLUMNS, (user_id, email, self.password_hash, "student", name, created, created))
+        w.add("student_profile", STUDENT_COLUMNS, (self._next("student_profile"), user_id, course, f"{rng.randint(1, 13)}기", ", ".join(skills)))
+        for skill_id in skill_ids:
+            w.add("student_skill", ("user_id", "skill_id"), (user_id, skill_id))
+
+        # 인재 탐색과 같은 규칙으로 이력서 ID = 학생 user_id
+        resume_id = user_id
+        start = rng.randint(2015, 2022)
+        w.add("resume_basic_info", RESUME_COLUMNS, (
+            resume_id, user_id, name, email, f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}", job_type,
+            rng.choice(SCHOOLS), rng.choice(MAJORS), rng.choice(GRADES), f"{start}-{start + 4}",
+            f"{', '.join(skills[:2])}를 주로 다루는 {job_type}입니다.",
+            f"{course}을 수료했습니다. {rng.choice(STRENGTHS)}과 {rng.choice(STRENGTHS)}에 강점이 있으며 "
+            f"{', '.join(skills)}를 활용한 프로젝트 경험이 있습니다.",
+            rng.randint(20, 35), created, created,
+        ))
+
+        for index in range(self._count(self.args.portfolios)):
+            portfolio_id = self._next("portfolio")
+            topic, kind = rng.choice(TOPICS), rng.choice(KINDS)
+            w.add("portfolio", PORTFOLIO_COLUMNS, (
+                portfolio_id, resume_id, index == 0, f"https://example.com/{portfolio_id}",
+                f"{topic} {kind}", f"{topic}을(를) 주제로 한 {kind} 팀 프로젝트", self._period(), rng.choice(ROLES),
+                created, created,
+            ))
+            for _ in range(self._count(self.args.projects)):
+                project_id = self._next("project")
+                project_skills = pick_skills(rng, rng.randint(2, 5))
+                features = rng.sample(FEATURES, 2)
+                w.add("project", PROJECT_COLUMNS, (
+                    project_id, portfolio_id, f"{topic} {features[0]} 기능", self._period(),
+                    f"{topic} {kind}의 {features[0]} 기능 개발",
+                    f"{features[0]}과(와) {features[1]} 기능을 설계하고 구현했습니다. {rng.choice(STRENGTHS)}에 집중했습니다.",
+                    rng.choice(ROLES), ", ".join(SKILL_NAMES[skill_id] for skill_id in project_skills),
+                    f"https://github.com/lionconnect-seed/project-{project_id}" if rng.random() < 0.7 else None,
+                    created, created,
+                ))
+                for skill_id in project_skills:
+                    w.add("project_skill", ("project_id", "skill_id"), (project_id, skill_id))
+
+        for award, organization in rng.sample(AWARDS, min(self._count(self.args.awards), len(AWARDS))):
+            w.add("award", AWARD_COLUMNS, (self._next("award"), resume_id, award, f"{rng.randint(2018, 2025)}-{rng.randint(1, 12):02d}", organization, created))
+        for institution, education in rng.sample(EDUCATIONS, min(self._count(self.args.educations), len(EDUCATIONS))):
+            w.add("education", EDUCATION_COLUMNS, (self._next("education"), resume_id, institution, self._period(), education, created))
+
+    def company(self, w: Writer) -> None:
+        rng = self.rng
+        user_id = self._next("user")
+        created = _stamp(self._moment())
+        w.add("user", USER_COLUMNS, (user_id, f"company{user_id}@example.com", self.password_hash, "company", self._name(), created, created))
+        w.add("company_profile", COMPANY_COLUMNS, (
+            self._next("company_profile"), user_id, f"{rng.choice(TOPICS)}랩스 {user_id}", rng.choice(INDUSTRIES),
+            rng.choice(COMPANY_SIZES), f"{rng.choice(TOPICS)} 분야의 {rng.choice(INDUSTRIES)} 기업입니다.", rng.random() < 0.5,
+        ))
+
+ID_TABLES = {
+    "user": User, "student_profile": StudentProfile, "company_profile": CompanyProfile, "resume_basic_info": ResumeBasicInfo,
+    "portfolio": Portfolio, "project": Project, "award": Award, "education": Education,
+}
+
+def main(args: argparse.Namespace):
+    """
+    지정한 규모의 학생/이력서/포트폴리오/프로젝트/기업 데이터를 생성합니다.
+    """
+    for base in (Base, ResumeBase, PortfolioBase, ProjectBase, AwardBase, EducationBase, ConnectBase, SimilarBase, SkillBase):
+        base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        next_ids = {table: (conn.scalar(select(func.max(model.id))) or 0) + 1 for table, model in ID_TABLES.items()}
+    # 이력서 ID를 학생 user_id와 맞추기 위해 user ID를 두 테이블 중 큰 값부터 시작
+    next_ids["user"] = max(next_ids["user"], next_ids["resume_basic_info"])
+    seeder = Seeder(random.Random(args.seed), next_ids, args, hash_password(DEFAULT_PASSWORD))
+
+    counts: Dict[str, int] = {}
+    for start in range(0, args.students, CHUNK_STUDENTS):
+        with engine.begin() as conn:
+            writer = Writer(conn, args.batch_size)
+            for _ in range(min(CHUNK_STUDENTS, args.students - start)):
+                seeder.student(writer)
+            writer.flush_all()
+        for table, count in writer.counts.items():
+            counts[table] = counts.get(table, 0) + count
+        print(f"  ... 학생 {min(start + CHUNK_STUDENTS, args.students)}/{args.students}명 ({time.perf_counter() - started:.0f}초)")
+    with engine.begin() as conn:
+        writer = Writer(conn, args.batch_size)
+        for _ in range(args.companies):
+            seeder.company(writer)
+        writer.flush_all()
+        if writer.postgres:
+            # ID를 직접 지정해 넣었으므로 시퀀스를 최대 ID 뒤로 맞춤
+            for table in ID_TABLES:
+                conn.execute(text(f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), (SELECT COALESCE(MAX(id), 1) FROM \"{table}\"))"))
+    for table, count in writer.counts.items():
+        counts[table] = counts.get(table, 0) + count
+
+    for table, count in sorted(counts.items()):
+        print(f"✅ {table}: {count:,}행")
+    if not args.skip_index:
+        db = SessionLocal()
+        try:
+            print(f"✅ 전문 검색 인덱스 {rebuild_search_index(db):,}건 갱신")
+        finally:
+            db.close()
+    print(f"⏱️ {time.perf_counter() - started:.1f}초 소요 (계정 비밀번호: {DEFAULT_PASSWORD})")
+    print("ℹ️ 유사 인재 목록은 rebuild_similar_talents.py로 따로 계산하세요.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="부하/실행 계획 테스트용 대량 데이터 생성")
+    parser.add_argument("--students", type=int, default=1000, help="생성할 학생 수 (기본값: 1000)")
+    parser.add_argument("--portfolios", type=int, default=5, help="학생당 평균 포트폴리오 수 (기본값: 5)")
+    parser.add_argument("--projects", type=int, default=5, help="포트폴리오당 평균 프로젝트 수 (기본값: 5)")
+    parser.add_argument("--awards", type=int, default=2, help="이력서당 평균 수상/자격 수 (기본값: 2)")
+    parser.add_argument("--educations", type=int, default=1, help="이력서당 평균 교육 이력 수 (기본값: 1)")
+    parser.add_argument("--companies", type=int, default=100, help="생성할 기업 수 (기본값: 100)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같은 시드면 같은 데이터)")
+    parser.add_argument("--batch-size", type=int, default=10000, help="COPY/executemany 한 번에 보내는 행 수")
+    parser.add_argument("--skip-index", action="store_true", help="전문 검색 인덱스 재구축 생략 (대량 생성 시 권장)")
+    print("🌱 테스트 데이터 생성을 시작합니다...")
+    main(parser.parse_args())
+    print("🎉 완료!")
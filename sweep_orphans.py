@@ -0,0 +1,77 @@
+import sys
+import time
+from sqlalchemy import delete, exists
+from app.core.config import SessionLocal
+from app.models.resume import ResumeBasicInfo
+from app.models.portfolio import Portfolio
+from app.models.project import Project
+from app.models.award import Award
+from app.models.education import Education
+from app.models.user import StudentProfile
+from app.models.skill import StudentSkill, ProjectSkill
+from app.crud.cascade import delete_projects
+
+BATCH_SIZE = 500      # 한 트랜잭션에서 삭제할 최대 행 수
+PAUSE_SECONDS = 0.05  # 배치 사이 대기 (다른 트랜잭션에 잠금 양보)
+
+def _sweep(label: str, find_ids, remove, batch_size: int) -> int:
+    """
+    고아 행 ID를 batch_size개씩 찾아 삭제하고 배치마다 커밋합니다.
+    """
+    total = 0
+    while True:
+        db = SessionLocal()
+        try:
+            ids = [row_id for (row_id,) in find_ids(db).limit(batch_size)]
+            if not ids:
+                break
+            remove(db, ids)
+            db.commit()
+            total += len(ids)
+        except Exception as e:
+            db.rollback()
+            print(f"{label} 정리 중 오류 발생: {e}")
+            break
+        finally:
+            db.close()
+        time.sleep(PAUSE_SECONDS)
+    print(f"{label}: {total}개 삭제")
+    return total
+
+def sweep_orphans(batch_size: int = BATCH_SIZE) -> int:
+    """
+    부모 행이 사라진 하위 데이터를 작은 배치로 나눠 삭제합니다.
+    - 포트폴리오가 없는 프로젝트 (표준 기술 스택/검색 문서 포함)
+    - 프로젝트가 없는 프로젝트 기술 스택
+    - 이력서가 없는 수상 및 활동 / 교육 이력
+    - 학생 프로필이 없는 학생 기술 스택
+    포트폴리오는 resume_id를 학생 user_id로도 사용하므로 정리 대상에서 제외합니다.
+    """
+    total = 0
+    total += _sweep(
+        "프로젝트",
+        lambda db: db.query(Project.id).filter(~exists().where(Portfolio.id == Project.portfolio_id)),
+        delete_projects, batch_size)
+    total += _sweep(
+        "프로젝트 기술 스택",
+        lambda db: db.query(ProjectSkill.project_id).filter(~exists().where(Project.id == ProjectSkill.project_id)).distinct(),
+        lambda db, ids: db.execute(delete(ProjectSkill).where(ProjectSkill.project_id.in_(ids))), batch_size)
+    total += _sweep(
+        "수상 및 활동",
+        lambda db: db.query(Award.id).filter(~exists().where(ResumeBasicInfo.id == Award.resume_id)),
+        lambda db, ids: db.execute(delete(Award).where(Award.id.in_(ids))), batch_size)
+    total += _sweep(
+        "교육 이력",
+        lambda db: db.query(Education.id).filter(~exists().where(ResumeBasicInfo.id == Education.resume_id)),
+        lambda db, ids: db.execute(delete(Education).where(Education.id.in_(ids))), batch_size)
+    total += _sweep(
+        "학생 기술 스택",
+        lambda db: db.query(StudentSkill.user_id).filter(~exists().where(StudentProfile.user_id == StudentSkill.user_id)).distinct(),
+        lambda db, ids: db.execute(delete(StudentSkill).where(StudentSkill.user_id.in_(ids))), batch_size)
+    return total
+
+if __name__ == "__main__":
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else BATCH_SIZE
+    print(f"고아 데이터 정리를 시작합니다... (배치 크기: {batch_size})")
+    total = sweep_orphans(batch_size)
+    print(f"정리가 완료되었습니다. 총 {total}개 삭제")